@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
+from solvers import solve
 
 #+++++++++++++++ Color Scheme +++++++++++++++++++
 backgroundColour = '#282c34'
@@ -8,14 +9,16 @@ accentColour = '#61afef'
 buttonBg = '#3c424a'
 buttonHover = '#4a5260'
 
-# Configure ttk styles for better appearance
-style = ttk.Style()
-style.theme_use('default')
-style.configure('TNotebook', background=backgroundColour, borderwidth=0)
-style.configure('TNotebook.Tab', background=buttonBg, foreground=foregroundColour, 
-                padding=[10, 5], font=('Arial', 10))
-style.map('TNotebook.Tab', background=[('selected', accentColour)], 
-          foreground=[('selected', 'white')])
+def configureStyles(master):
+    # Configure ttk styles for better appearance. Done when the first window
+    # opens rather than at import, which would create a stray Tk root.
+    style = ttk.Style(master)
+    style.theme_use('default')
+    style.configure('TNotebook', background=backgroundColour, borderwidth=0)
+    style.configure('TNotebook.Tab', background=buttonBg, foreground=foregroundColour, 
+                    padding=[10, 5], font=('Arial', 10))
+    style.map('TNotebook.Tab', background=[('selected', accentColour)], 
+              foreground=[('selected', 'white')])
 
 #+++++++++++++++ APM1513 Problem Solver Window +++++++++++++++++++
 class APM1513Window(tk.Toplevel):
@@ -26,6 +29,7 @@ class APM1513Window(tk.Toplevel):
         self.title(f"APM1513 - {topicName}")
         self.geometry("800x650")
         self.configure(bg=backgroundColour)
+        configureStyles(self)
         
         # Disable the module window while this is open
         parent.attributes('-disabled', True)
@@ -238,152 +242,16 @@ class APM1513Window(tk.Toplevel):
         # Reset hint to default for current selection
         self.updateInputHint()
     
-    def parse_matrix(self, text):
-        # Helper to parse matrix text into list of lists
-        matrix = []
-        rows = text.strip().split('\n')
-        for row in rows:
-            if not row.strip() or row.strip().startswith("#"): continue
-            try:
-                matrix.append([float(x) for x in row.split()])
-            except ValueError:
-                pass
-        return matrix
-
-    def format_octave_matrix(self, matrix):
-        # Converts [[1,2],[3,4]] to "[1 2; 3 4]" string for Octave
-        row_strs = []
-        for row in matrix:
-            row_strs.append(" ".join(str(x) for x in row))
-        return "[" + "; ".join(row_strs) + "]"
-
     def generateSolution(self):
         # Main logic to generate Octave Code strings
         input_str = self.inputText.get("1.0", "end")
         problem = self.problemTypeVar.get()
-        octave_code = ""
-
-        try:
-            # 1. Parsing Logic
-            if problem == "Direct Method (Ax=b)":
-                parts = input_str.split('\n\n')
-                if len(parts) < 2:
-                    octave_code = "% Error: Separate A and b with a blank line in input box."
-                else:
-                    matrix_A = self.parse_matrix(parts[0])
-                    vector_b = self.parse_matrix(parts[1])
-                    
-                    str_A = self.format_octave_matrix(matrix_A)
-                    str_b = self.format_octave_matrix(vector_b)
-                    
-                    octave_code = f"""% Octave Script: Solve Ax = b
-A = {str_A};
-b = {str_b};
-
-% Solve using left division operator
-x = A \\ b;
-
-disp("Solution vector x:");
-disp(x);
-"""
-
-            elif problem == "Solve LP (glpk)":
-                # Expecting c, A, b
-                parts = input_str.split('\n\n')
-                if len(parts) < 3:
-                    octave_code = "% Error: Separate c, A, and b with blank lines."
-                else:
-                    str_c = self.format_octave_matrix(self.parse_matrix(parts[0]))
-                    str_A = self.format_octave_matrix(self.parse_matrix(parts[1]))
-                    str_b = self.format_octave_matrix(self.parse_matrix(parts[2]))
-                    
-                    octave_code = f"""% Octave Script: Linear Programming (Simplex)
-c = {str_c}';  % Objective function coefficients
-A = {str_A};   % Constraint matrix
-b = {str_b};   % Constraint limits
-
-% Standard bounds (x >= 0)
-lb = [0; 0]; 
-ub = []; 
-ctype = "UU"; % Upper bounds constraints
-vartype = "CC"; % Continuous variables
-s = -1; % Maximize (-1) or Minimize (1)
-
-[xmax, fmax] = glpk(c, A, b, lb, ub, ctype, vartype, s);
-
-disp("Optimal x:");
-disp(xmax);
-disp("Maximum Value:");
-disp(fmax);
-"""
-
-            else:
-                # Standard single matrix operations
-                matrix = self.parse_matrix(input_str)
-                if not matrix:
-                    octave_code = "% Error: Invalid Matrix Input"
-                else:
-                    str_A = self.format_octave_matrix(matrix)
-                    
-                    if problem == "Calculate Determinant":
-                        octave_code = f"""% Calculate Determinant
-A = {str_A};
-d = det(A);
-disp("Determinant:");
-disp(d);
-"""
-                    elif problem == "Find Matrix Inverse":
-                        octave_code = f"""% Calculate Inverse
-A = {str_A};
-if det(A) == 0
-    disp("Matrix is singular, no inverse.");
-else
-    invA = inv(A);
-    disp("Inverse Matrix:");
-    disp(invA);
-end
-"""
-                    elif problem == "Calculate Trace":
-                        octave_code = f"""% Calculate Trace
-A = {str_A};
-t = trace(A);
-disp("Trace:");
-disp(t);
-"""
-                    elif problem == "Transpose Matrix":
-                        octave_code = f"""% Transpose
-A = {str_A};
-AT = A';
-disp("Transposed Matrix:");
-disp(AT);
-"""
-                    elif problem == "Calculate Eigenvalues":
-                        octave_code = f"""% Eigenvalues and Eigenvectors
-A = {str_A};
-[V, D] = eig(A);
-disp("Eigenvalues (Diagonal of D):");
-disp(diag(D));
-disp("Eigenvectors (Columns of V):");
-disp(V);
-"""
-                    elif problem == "Method of Least Squares":
-                        octave_code = f"""% Least Squares Solution (Overdetermined)
-A = {str_A};
-% Note: You need a b vector. Assuming placeholder b.
-b = ones(rows(A), 1); 
-x = (A' * A) \\ (A' * b);
-disp("Least Squares Solution x:");
-disp(x);
-"""
-                    else:
-                        octave_code = f"% Code generation for {problem} not implemented yet."
 
-        except Exception as e:
-            octave_code = f"% Error generating code: {str(e)}"
+        solution = solve("APM1513", problem, {"Input": input_str})
 
         # Display result
         self.resultText.delete("1.0", "end")
-        self.resultText.insert("1.0", octave_code)
+        self.resultText.insert("1.0", solution.text())
     
     def on_close(self, parent):
         # Re-enable the parent window and close this window
@@ -1,8 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import math
-import sympy
-from sympy import symbols, Function, Eq, classify_ode, dsolve, separatevars, solve
+from solvers import SolverInputError
+from solverPool import BackgroundSolve
 
 #+++++++++++++++ Color Scheme +++++++++++++++++++
 backgroundColour = '#282c34'
@@ -27,6 +26,7 @@ class APM1514Window(tk.Toplevel):
         self.topicName = topicName
         self.entries = {} 
         
+        self.runner = BackgroundSolve(self, "APM1514", self.showSolution, self.showStatus)
         self.createInterface()
 
     def createInterface(self):
@@ -116,6 +116,23 @@ class APM1514Window(tk.Toplevel):
         )
         clearButton.pack(fill="x")
 
+        # Cancel Button (SymPy solves run in a background process)
+        self.cancelButton = tk.Button(
+            leftPanel,
+            text="⏹ Cancel",
+            command=self.cancelSolve,
+            bg=buttonBg,
+            fg=foregroundColour,
+            font=("Arial", 10),
+            relief='flat',
+            cursor='hand2',
+            state="disabled"
+        )
+        self.cancelButton.pack(fill="x", pady=(5, 0))
+
+        self.statusLabel = tk.Label(leftPanel, text="", bg=backgroundColour, fg=accentColour, font=("Arial", 9), justify="left")
+        self.statusLabel.pack(anchor="w", pady=(10, 0))
+
         # 2. RIGHT SIDE: Solution Display
         rightPanel = tk.Frame(contentFrame, bg=backgroundColour)
         rightPanel.pack(side="right", fill="both", expand=True)
@@ -227,171 +244,44 @@ class APM1514Window(tk.Toplevel):
 
     def solve_step_by_step(self):
         model = self.modelVar.get()
-        steps = ""
-
-        # ================= SEPARABILITY CHECKER =================
-        if "Check Separability" in model:
-            eq_str = self.entries["Equation"].get()
-            steps = self.check_separability(eq_str)
-            self.solutionText.delete("1.0", "end")
-            self.solutionText.insert("1.0", steps)
-            return
-
-        # ================= STANDARD SOLVERS =================
-        try:
-            data = {}
-            for label, entry in self.entries.items():
-                data[label] = float(entry.get())
-        except ValueError:
-            messagebox.showerror("Input Error", "Please ensure all fields contain valid numbers.")
-            return
-
-        if "Malthusian Growth" in model:
-            P0 = data["Initial Pop (P0)"]
-            k = data["Growth Rate k"]
-            steps += "TOPIC: MALTHUSIAN POPULATION MODEL\n----------------------------------\n"
-            steps += "1. Differential Equation: dP/dt = kP\n"
-            steps += "2. General Solution: P(t) = P0 * e^(kt)\n"
-            
-            if "Find P" in model:
-                t = data["Time t"]
-                result = P0 * math.exp(k * t)
-                steps += f"3. Solve for t={t}:\n   P({t}) = {P0} * e^({k}*{t})\n   Result = {result:.2f}"
-            else:
-                Pt = data["Target Pop P(t)"]
-                ratio = Pt/P0
-                t_calc = math.log(ratio) / k
-                steps += f"3. Solve for t given P={Pt}:\n   {Pt} = {P0}e^({k}t)\n   ln({ratio:.2f}) = {k}t\n   t = {t_calc:.2f}"
-
-        elif "Logistic" in model:
-            P0 = data["Initial Pop (P0)"]
-            a = data["Growth Rate a"]
-            b = data["Interaction b"]
-            t = data["Time t"]
-            K = a/b
-            A = (K - P0)/P0
-            result = K / (1 + A * math.exp(-a * t))
-            
-            steps += "TOPIC: LOGISTIC POPULATION MODEL\n--------------------------------\n"
-            steps += "1. Differential Equation: dP/dt = aP - bP^2\n"
-            steps += f"2. Carrying Capacity K = a/b = {K:.2f}\n"
-            steps += f"3. Constant A = (K-P0)/P0 = {A:.4f}\n"
-            steps += f"4. Solution P(t) = K / (1 + A*e^(-at))\n"
-            steps += f"   P({t}) = {K:.2f} / (1 + {A:.4f}*e^(-{a}*{t}))\n"
-            steps += f"   Result = {result:.2f}"
+        inputs = {label: entry.get() for label, entry in self.entries.items()}
 
-        elif "Newton" in model:
-            T0 = data["Initial Temp (T0)"]
-            Tm = data["Ambient Temp (Tm)"]
-            k = data["Constant k"]
-            steps += "TOPIC: NEWTON'S LAW OF COOLING\n------------------------------\n"
-            steps += "1. Equation: dT/dt = -k(T - Tm)\n"
-            steps += "2. Solution: T(t) = Tm + (T0 - Tm)e^(-kt)\n"
-            
-            if "Find Temp" in model:
-                t = data["Time t"]
-                res = Tm + (T0-Tm)*math.exp(-k*t)
-                steps += f"3. T({t}) = {Tm} + ({T0}-{Tm})e^(-{k}*{t})\n   Result = {res:.2f}"
-            else:
-                Target = data["Target Temp"]
-                ratio = (Target - Tm)/(T0 - Tm)
-                t_calc = math.log(ratio) / -k
-                steps += f"3. Solve for t:\n   {Target} = {Tm} + {T0-Tm}e^(-{k}t)\n   t = {t_calc:.2f}"
+        # Runs in a worker process; showSolution is called back on this thread
+        self.runner.start(model, inputs)
+        self.solutionText.delete("1.0", "end")
+        self.cancelButton.config(state="normal")
 
-        elif "Linear Difference" in model:
-            a0, r, n = data["Initial Value (a0)"], data["Multiplier r"], int(data["Steps n"])
-            steps += "TOPIC: LINEAR DIFFERENCE EQUATION\n---------------------------------\n"
-            steps += f"1. Equation: a(n+1) = {r} * a(n)\n"
-            steps += f"2. Solution: a(n) = {a0} * ({r})^n\n"
-            steps += f"3. Result a({n}) = {a0 * (r**n)}"
+    def cancelSolve(self):
+        self.runner.cancel()
 
-        elif "Savings" in model:
-            A0, q, D, n = data["Initial Deposit (A0)"], data["Interest Rate % (q)"], data["Monthly Deposit (D)"], int(data["Months n"])
-            r = 1 + q/100
-            steps += "TOPIC: SAVINGS ACCOUNT\n----------------------\n"
-            steps += f"1. Recurrence: A(n+1) = {r}*A(n) + {D}\n"
-            curr = A0
-            for i in range(1, n+1):
-                curr = curr*r + D
-                if i <= 3 or i==n: steps += f"   Month {i}: {curr:.2f}\n"
+    def showStatus(self, text):
+        self.statusLabel.config(text=text)
 
-        elif "Loan" in model:
-            L, q, P, n = data["Loan Amount (L)"], data["Interest Rate % (q)"], data["Monthly Payment (P)"], int(data["Months n"])
-            r = 1 + q/100
-            steps += "TOPIC: LOAN REPAYMENT\n---------------------\n"
-            steps += f"1. Recurrence: A(n+1) = {r}*A(n) - {P}\n"
-            curr = L
-            for i in range(1, n+1):
-                curr = curr*r - P
-                if i <= 3 or i==n: steps += f"   Month {i}: {curr:.2f}\n"
+    def showSolution(self, job):
+        self.cancelButton.config(state="disabled")
+        self.statusLabel.config(text="")
 
+        if job.status == "done":
+            steps = job.solution.text()
+            self.statusLabel.config(text=f"Solved in {job.elapsed():.2f} s")
+        elif job.status == "timeout":
+            steps = f"Stopped after {job.elapsed():.0f} s: this calculation is taking too long.\nTry a simpler expression or check the input."
+        elif job.status == "cancelled":
+            steps = "Calculation cancelled."
+        elif isinstance(job.error, SolverInputError):
+            messagebox.showerror("Input Error", str(job.error))
+            return
         else:
-            steps = "Solution logic for this model coming soon."
+            steps = f"Error: {job.error}"
 
         self.solutionText.delete("1.0", "end")
         self.solutionText.insert("1.0", steps)
 
-    def check_separability(self, eq_str):
-        # Uses SymPy to analyze the equation string
-        steps = f"ANALYZING: {eq_str}\n"
-        steps += "--------------------------------------\n"
-        
-        try:
-            x = symbols('x')
-            y = Function('y')(x)
-            
-            # Pre-process string to make it SymPy friendly
-            eq_str = eq_str.replace("dy/dx", "y'").replace("^", "**")
-            
-            # Extract RHS (assuming y' = ...)
-            if "=" in eq_str:
-                rhs_str = eq_str.split("=")[1].strip()
-            else:
-                rhs_str = eq_str
-                
-            # Parse
-            rhs = sympy.sympify(rhs_str, locals={'y': y, 'x': x})
-            ode = Eq(y.diff(x), rhs)
-            
-            steps += "1. Standard Form:\n"
-            steps += f"   dy/dx = {rhs}\n\n"
-            
-            # Check Classification
-            hints = classify_ode(ode)
-            
-            if "separable" in hints:
-                steps += "✅ RESULT: SEPARABLE\n\n"
-                
-                # Attempt to separate
-                # Sympy's separatevars takes an expression, returns g(x)*h(y) if separable
-                separated = separatevars(rhs)
-                
-                if separated:
-                    steps += "2. Separation Logic:\n"
-                    steps += f"   The expression factors into: {separated}\n"
-                    steps += "   We can write this as: 1/h(y) dy = g(x) dx\n\n"
-                    
-                    # Solve
-                    sol = dsolve(ode, hint='separable')
-                    steps += "3. General Solution:\n"
-                    steps += f"   {sol}"
-                else:
-                    steps += "   (Could not automatically display separated terms, but it is valid.)"
-            else:
-                steps += "❌ RESULT: NOT SEPARABLE\n"
-                steps += f"   Reason: Cannot factor f(x,y) into g(x)*h(y).\n"
-                steps += f"   Other classifications found: {hints}"
-                
-        except Exception as e:
-            steps += f"\nError parsing equation: {str(e)}\n"
-            steps += "Tip: Use python syntax (e.g., x*y instead of xy, x**2 for x^2)"
-            
-        return steps
-
     def clearInputs(self):
         self.updateInputFields()
         self.solutionText.delete("1.0", "end")
 
     def on_close(self, parent):
+        self.runner.cancel()
         parent.attributes('-disabled', False)
         self.destroy()
\ No newline at end of file
@@ -1,6 +1,8 @@
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
-import itertools
+from tkinter import ttk, scrolledtext, messagebox, filedialog
+from solvers import solve, SolverInputError
+from solvers.COS1501 import power_set_input
+from setEngine import power_set_estimate, write_subsets, format_bytes
 
 #+++++++++++++++ Color Scheme +++++++++++++++++++
 backgroundColour = '#282c34'
@@ -9,6 +11,11 @@ accentColour = '#61afef'
 buttonBg = '#3c424a'
 buttonHover = '#4a5260'
 
+# Rows (truth table lines, subsets) rendered per page in the solution view
+tablePageRows = 256
+# Ask before streaming more text than this to a file
+fileWarnBytes = 100 * 1024 * 1024
+
 #+++++++++++++++ COS1501 Solver Window +++++++++++++++++++
 class COS1501Window(tk.Toplevel):
     def __init__(self, parent, topicName):
@@ -24,6 +31,7 @@ class COS1501Window(tk.Toplevel):
         
         self.topicName = topicName
         self.entries = {} 
+        self.summaryVar = tk.BooleanVar(value=False)
         
         self.createInterface()
 
@@ -135,7 +143,28 @@ class COS1501Window(tk.Toplevel):
             padx=15, pady=15
         )
         self.solutionText.pack(fill="both", expand=True, pady=5)
-        
+
+        # Pager for long results such as truth tables and power sets
+        # (only packed while a paged result is showing)
+        self.pagerFrame = tk.Frame(rightPanel, bg=backgroundColour)
+        self.pageLines = None
+        self.pagePosition = 0
+
+        for text, step in (("◀ Prev", -1), ("Next ▶", 1)):
+            tk.Button(
+                self.pagerFrame,
+                text=text,
+                command=lambda s=step: self.showPage(self.pagePosition + s),
+                bg=buttonBg,
+                fg=foregroundColour,
+                font=("Arial", 9),
+                relief='flat',
+                cursor='hand2'
+            ).pack(side="left", padx=(0, 5))
+
+        self.pageLabel = tk.Label(self.pagerFrame, text="", bg=backgroundColour, fg=foregroundColour, font=("Arial", 9))
+        self.pageLabel.pack(side="left", padx=10)
+
         # Back Button
         tk.Button(
             self,
@@ -173,13 +202,23 @@ class COS1501Window(tk.Toplevel):
         if "Truth Table" in task or "Tautology" in task:
             tk.Label(self.inputFrame, text="Use: p, q, r, &, |, ~, ->, <->", bg=backgroundColour, fg=foregroundColour).pack()
             fields = [("Expression", "(p -> q) & (q -> r)")]
+            tk.Checkbutton(
+                self.inputFrame, text="Summary only (no table)", variable=self.summaryVar,
+                bg=backgroundColour, fg=foregroundColour, selectcolor=buttonBg,
+                activebackground=backgroundColour, activeforeground=accentColour
+            ).pack(side="bottom", anchor="w", pady=(5, 0))
 
         # --- SETS ---
         elif "Set Operations" in task:
-            tk.Label(self.inputFrame, text="Elements: 1,2,3 or a,b,c", bg=backgroundColour, fg=foregroundColour).pack()
+            tk.Label(self.inputFrame, text="Elements: 1,2,3 or a,b,c\nAlso: 1..10, {1,2}, \"quoted, text\"", bg=backgroundColour, fg=foregroundColour).pack()
             fields = [("Set A", "1, 2, 3"), ("Set B", "3, 4, 5")]
         elif "Power Set" in task:
-            fields = [("Set A", "a, b, c")]
+            fields = [("Set A", "a, b, c"), ("Only size k", "")]
+            tk.Label(self.inputFrame, text="Leave size k blank for every subset", bg=backgroundColour, fg=foregroundColour).pack()
+            tk.Button(
+                self.inputFrame, text="💾 Save Subsets to File", command=self.saveSubsetsToFile,
+                bg=buttonBg, fg=foregroundColour, font=("Arial", 9), relief='flat', cursor='hand2'
+            ).pack(side="bottom", fill="x", pady=(5, 0))
         elif "Check Subset" in task:
             fields = [("Set A", "1, 2"), ("Set B", "1, 2, 3, 4")]
 
@@ -190,7 +229,8 @@ class COS1501Window(tk.Toplevel):
         elif "Inverse Relation" in task:
              fields = [("Relation R", "(1,a), (2,b), (3,c)")]
         elif "Composition" in task:
-             fields = [("Relation R", "(1,a), (2,b)"), ("Relation S", "(a,x), (b,y)")]
+             tk.Label(self.inputFrame, text="S o R: apply R first, then S\nPower k computes R^k (blank to skip)", bg=backgroundColour, fg=foregroundColour).pack()
+             fields = [("Relation R", "(1,a), (2,b)"), ("Relation S", "(a,x), (b,y)"), ("Power k", "")]
 
         # --- FUNCTIONS ---
         elif "Check Function" in task:
@@ -208,157 +248,90 @@ class COS1501Window(tk.Toplevel):
 
     def solve_step_by_step(self):
         task = self.taskVar.get()
-        output = ""
+        self.pageLines = None
+        self.pagerFrame.pack_forget()
         
+        inputs = {k: v.get() for k, v in self.entries.items()}
+        if "Truth Table" in task or "Tautology" in task:
+            inputs["Summary only"] = self.summaryVar.get()
+
         try:
-            inputs = {k: v.get() for k, v in self.entries.items()}
-        except:
+            solution = solve("COS1501", task, inputs)
+        except SolverInputError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+
+        # Long listings (truth tables, power sets) are shown one page at a time
+        listing = solution.listing()
+        if listing is not None and not solution.error:
+            at = solution.steps.index(listing)
+            self.startPaging(
+                "".join(step.text for step in solution.steps[:at]),
+                listing.lines,
+                listing.total,
+                "".join(step.text for step in solution.steps[at + 1:])
+            )
             return
 
+        self.solutionText.delete("1.0", "end")
+        self.solutionText.insert("1.0", solution.text())
+
+    def saveSubsetsToFile(self):
+        # SolverInputError covers k; anything else is the set itself (SetSyntaxError)
         try:
-            # ================= LOGIC =================
-            if "Truth Table" in task or "Tautology" in task:
-                expr_str = inputs["Expression"]
-                
-                # Parse variables
-                vars = sorted(list(set([c for c in expr_str if c.isalpha()])))
-                n = len(vars)
-                
-                # Logic Evaluator
-                def evaluate_logic(expression, values):
-                    # Convert custom symbols to Python logic
-                    e = expression.replace("&", " and ").replace("|", " or ").replace("~", " not ")
-                    # Implication A -> B is equivalent to (not A) or B. 
-                    # For Truth tables, we can use <= for Implication (True <= False is False)
-                    e = e.replace("->", "<=").replace("<->", "==")
-                    
-                    env = {k: v for k, v in zip(vars, values)}
-                    return eval(e, {}, env)
-
-                # Header
-                header = " | ".join(vars) + " || Result\n"
-                output += header + "-" * len(header) + "\n"
-                
-                results = []
-                combinations = list(itertools.product([True, False], repeat=n))
-                
-                for combo in combinations:
-                    res = evaluate_logic(expr_str, combo)
-                    results.append(res)
-                    
-                    row_str = " | ".join(["T" if v else "F" for v in combo])
-                    res_str = "T" if res else "F"
-                    output += f"{row_str} || {res_str}\n"
-
-                if "Tautology" in task:
-                    if all(results): output += "\nConclusion: TAUTOLOGY (Always True)"
-                    elif not any(results): output += "\nConclusion: CONTRADICTION (Always False)"
-                    else: output += "\nConclusion: CONTINGENCY (Sometimes True/False)"
-
-            # ================= SETS =================
-            elif "Set Operations" in task:
-                A = set(x.strip() for x in inputs["Set A"].split(","))
-                B = set(x.strip() for x in inputs["Set B"].split(","))
-                
-                output += f"Set A: {A}\nSet B: {B}\n\n"
-                output += f"Union (A u B): {A.union(B)}\n"
-                output += f"Intersection (A n B): {A.intersection(B)}\n"
-                output += f"Difference (A - B): {A.difference(B)}\n"
-                output += f"Difference (B - A): {B.difference(A)}\n"
-                output += f"Symmetric Diff (A + B): {A.symmetric_difference(B)}\n"
-
-            elif "Power Set" in task:
-                A = [x.strip() for x in inputs["Set A"].split(",")]
-                n = len(A)
-                powerset = []
-                for i in range(1 << n):
-                    subset = [A[j] for j in range(n) if (i & (1 << j))]
-                    powerset.append(set(subset))
-                
-                output += f"Power Set P(A) (Size 2^{n} = {len(powerset)}):\n\n"
-                for s in powerset:
-                    output += f"{s}\n"
-
-            # ================= RELATIONS =================
-            elif "Check Properties" in task:
-                A = set(x.strip() for x in inputs["Set A"].split(","))
-                # Parse Relation: (1,1), (1,2) -> list of tuples
-                raw_R = inputs["Relation R"].replace("(", "").replace(")", "")
-                pairs = [tuple(p.split(",")) for p in raw_R.split(" ") if "," in p]
-                # Clean pairs
-                R = set()
-                for a, b in pairs:
-                    R.add((a.strip(), b.strip()))
-                
-                output += f"Relation R: {R}\n\n"
-                
-                # Reflexive
-                is_refl = all((a, a) in R for a in A)
-                output += f"Reflexive: {'YES' if is_refl else 'NO'}\n"
-
-                # Symmetric
-                is_sym = all((b, a) in R for (a, b) in R)
-                output += f"Symmetric: {'YES' if is_sym else 'NO'}\n"
-
-                # Transitive
-                is_trans = True
-                missing_trans = []
-                for (a, b) in R:
-                    for (c, d) in R:
-                        if b == c: # (a,b) and (b,d) exist
-                            if (a, d) not in R:
-                                is_trans = False
-                                missing_trans.append(((a,b), (b,d)))
-                
-                output += f"Transitive: {'YES' if is_trans else 'NO'}\n"
-                if not is_trans:
-                    output += f"  Counterexample: {missing_trans[0]} exists, but transitive pair missing.\n"
-
-            # ================= FUNCTIONS =================
-            elif "Check Function" in task:
-                A = set(x.strip() for x in inputs["Domain A"].split(","))
-                B = set(x.strip() for x in inputs["Codomain B"].split(","))
-                
-                raw_f = inputs["Function f (pairs)"].replace("(", "").replace(")", "")
-                pairs = [tuple(p.split(",")) for p in raw_f.split(" ") if "," in p]
-                
-                f = {}
-                valid_func = True
-                for a, b in pairs:
-                    a, b = a.strip(), b.strip()
-                    if a in f: valid_func = False # One-to-many check
-                    f[a] = b
-                
-                # Domain Check
-                if set(f.keys()) != A: 
-                    output += "NOT a Function (Domain mismatch)\n"
-                elif not valid_func:
-                    output += "NOT a Function (One element maps to multiple)\n"
-                else:
-                    output += "Valid Function: YES\n"
-                    
-                    # Injective (One-to-One)
-                    values = list(f.values())
-                    is_inj = len(values) == len(set(values))
-                    output += f"Injective: {'YES' if is_inj else 'NO'}\n"
-                    
-                    # Surjective (Onto)
-                    is_sur = set(values) == B
-                    output += f"Surjective: {'YES' if is_sur else 'NO'}\n"
-                    
-                    # Bijective
-                    output += f"Bijective: {'YES' if (is_inj and is_sur) else 'NO'}\n"
-
-            else:
-                output += "Logic coming soon."
-
-        except Exception as e:
-            output += f"Error: {str(e)}\nCheck input format."
+            A, k = power_set_input({key: v.get() for key, v in self.entries.items()})
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+
+        count, _, text_bytes = power_set_estimate(A, k)
+        if text_bytes > fileWarnBytes:
+            if not messagebox.askyesno("Large Output", f"This will write {count} subsets (~{format_bytes(text_bytes)}). Continue?"):
+                return
+
+        path = filedialog.asksaveasfilename(parent=self, defaultextension=".txt", filetypes=[("Text files", "*.txt")])
+        if not path:
+            return
+        try:
+            written = write_subsets(path, A, k)
+        except OSError as e:
+            messagebox.showerror("Save Error", f"Cannot write {path}: {e.strerror or e}")
+            return
+        messagebox.showinfo("Saved", f"Wrote {written} subsets to:\n{path}")
+
+    def startPaging(self, intro, lines, total, outro=""):
+        # lines(start, stop) produces the text rows for one page on demand
+        self.pageIntro = intro
+        self.pageLines = lines
+        self.pageTotal = total
+        self.pageOutro = outro
+        self.showPage(0)
+
+    def showPage(self, page):
+        # Renders one page of the current paged result into the solution view
+        if self.pageLines is None:
+            return
+        pages = max(1, (self.pageTotal + tablePageRows - 1) // tablePageRows)
+        self.pagePosition = max(0, min(page, pages - 1))
+        start = self.pagePosition * tablePageRows
+        stop = min(start + tablePageRows, self.pageTotal)
+
+        parts = [self.pageIntro]
+        parts.extend(self.pageLines(start, stop))
+        if pages > 1:
+            parts.append(f"... rows {start + 1}-{stop} of {self.pageTotal} shown\n")
+        parts.append(self.pageOutro)
 
         self.solutionText.delete("1.0", "end")
-        self.solutionText.insert("1.0", output)
+        self.solutionText.insert("1.0", "".join(parts))
+
+        if pages > 1:
+            self.pageLabel.config(text=f"Page {self.pagePosition + 1} of {pages}")
+            self.pagerFrame.pack(side="bottom", fill="x", before=self.solutionText)
 
     def clearInputs(self):
+        self.pageLines = None
+        self.pagerFrame.pack_forget()
         self.updateInputFields()
         self.solutionText.delete("1.0", "end")
 
@@ -1,7 +1,6 @@
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
-import math
-import cmath
+from tkinter import ttk, scrolledtext, messagebox, filedialog
+from solvers import solve, SolverInputError
 
 #+++++++++++++++ Color Scheme +++++++++++++++++++
 backgroundColour = '#282c34'
@@ -153,11 +152,11 @@ class MAT1503Window(tk.Toplevel):
     def getTasks(self):
         # Return tasks based on the Topic Name (Chapters)
         if "System" in self.topicName or "Matrices" in self.topicName:
-            return ["Solve 2x2 System (Cramer's Rule)", "Matrix Multiplication (2x2)", "Inverse of 2x2 Matrix"]
+            return ["Solve 2x2 System (Cramer's Rule)", "Solve Linear System (n x n)", "Matrix Multiplication", "Matrix Chain Product", "Inverse of 2x2 Matrix"]
         elif "Determinant" in self.topicName:
-            return ["Determinant (2x2)", "Determinant (3x3)"]
+            return ["Determinant (2x2)", "Determinant (3x3)", "Determinant (n x n)"]
         elif "Vectors" in self.topicName:
-            return ["Dot Product", "Cross Product", "Angle Between Vectors", "Projection of u onto v"]
+            return ["Dot Product", "Cross Product", "Angle Between Vectors", "Projection of u onto v", "Vector Batch (n-D)"]
         elif "Complex" in self.topicName:
             return ["Complex Arithmetic (+, -, *, /)", "Convert to Polar Form", "De Moivre's Theorem (Powers)"]
         else:
@@ -174,25 +173,41 @@ class MAT1503Window(tk.Toplevel):
         # --- SYSTEMS & MATRICES ---
         if "Solve 2x2 System" in task:
             tk.Label(self.inputFrame, text="System: ax + by = e, cx + dy = f", bg=backgroundColour, fg=foregroundColour).pack()
-            fields = [("a", "2"), ("b", "3"), ("e", "5"), ("c", "4"), ("d", "1"), ("f", "2")]
+            fields = [("a", "2"), ("b", "3"), ("e", "5"), ("c", "4"), ("d", "1"), ("f", "2"), ("Mode", "auto")]
+        elif "Linear System" in task:
+            tk.Label(self.inputFrame, text="Rows separated by ;  (e.g. 2 1 -1; -3 -1 2)\nMode: auto, exact or float", bg=backgroundColour, fg=foregroundColour).pack()
+            fields = [("Matrix A", "2 1 -1; -3 -1 2; -2 1 2"), ("Vector b", "8 -11 -3"), ("Mode", "auto")]
         elif "Matrix Multiplication" in task:
-            tk.Label(self.inputFrame, text="Matrix A (2x2) * Matrix B (2x2)", bg=backgroundColour, fg=foregroundColour).pack()
-            fields = [("A11", "1"), ("A12", "2"), ("A21", "3"), ("A22", "4"), 
-                      ("B11", "2"), ("B12", "0"), ("B21", "1"), ("B22", "2")]
+            tk.Label(self.inputFrame, text="Rows separated by ;  A is m x k, B is k x n\nMode: auto, exact or float", bg=backgroundColour, fg=foregroundColour).pack()
+            fields = [("Matrix A", "1 2 3; 4 5 6"), ("Matrix B", "2 0; 1 2; -1 1/2"), ("Mode", "auto")]
+        elif "Matrix Chain" in task:
+            tk.Label(self.inputFrame, text="Matrices separated by |  (e.g. 1 2; 3 4 | 5; 6 | 1 2 3)\nMode: auto, exact or float", bg=backgroundColour, fg=foregroundColour).pack()
+            fields = [("Matrices", "1 2; 3 4; 5 6 | 1 0 2; 0 1 1 | 3; 1; 2"), ("Mode", "auto")]
         elif "Inverse" in task:
-            fields = [("A11", "4"), ("A12", "7"), ("A21", "2"), ("A22", "6")]
+            fields = [("A11", "4"), ("A12", "7"), ("A21", "2"), ("A22", "6"), ("Mode", "auto")]
 
         # --- DETERMINANTS ---
         elif "Determinant (2x2)" in task:
-            fields = [("a11", "2"), ("a12", "3"), ("a21", "4"), ("a22", "5")]
+            fields = [("a11", "2"), ("a12", "3"), ("a21", "4"), ("a22", "5"), ("Mode", "auto")]
         elif "Determinant (3x3)" in task:
-            fields = [("a", "1"), ("b", "2"), ("c", "3"), ("d", "0"), ("e", "1"), ("f", "4"), ("g", "5"), ("h", "6"), ("i", "0")]
+            fields = [("a", "1"), ("b", "2"), ("c", "3"), ("d", "0"), ("e", "1"), ("f", "4"), ("g", "5"), ("h", "6"), ("i", "0"), ("Mode", "auto")]
+        elif "Determinant (n x n)" in task:
+            tk.Label(self.inputFrame, text="Rows separated by ;  (e.g. 1 2 3; 0 1 4; 5 6 0)\nMode: auto, exact or float", bg=backgroundColour, fg=foregroundColour).pack()
+            fields = [("Matrix A", "2 -1 0 3; 1 0 4 -2; 0 5 1 1; 3 2 -1 0"), ("Mode", "auto")]
 
         # --- VECTORS ---
         elif "Dot Product" in task or "Angle" in task or "Projection" in task:
-            fields = [("u1", "1"), ("u2", "2"), ("u3", "3"), ("v1", "4"), ("v2", "-5"), ("v3", "6")]
+            tk.Label(self.inputFrame, text="Vectors of any dimension, e.g. 1 2 3 or 1, 0, -2, 4", bg=backgroundColour, fg=foregroundColour).pack()
+            fields = [("Vector u", "1 2 3"), ("Vector v", "4 -5 6"), ("Mode", "auto")]
+        elif "Vector Batch" in task:
+            tk.Label(self.inputFrame, text="Pairs u | v separated by ;  any dimension\nOperations: all, or dot cross angle projection", bg=backgroundColour, fg=foregroundColour).pack()
+            fields = [("Vector Pairs", "1 2 3 | 4 -5 6; 1 0 | 0 1; 1 2 3 4 | 2 0 1 -1"), ("CSV File", ""), ("Operations", "all")]
+            tk.Button(
+                self.inputFrame, text="📂 Load Pairs from CSV", command=self.chooseVectorFile,
+                bg=buttonBg, fg=foregroundColour, font=("Arial", 9), relief='flat', cursor='hand2'
+            ).pack(side="bottom", fill="x", pady=(5, 0))
         elif "Cross Product" in task:
-            fields = [("u1", "1"), ("u2", "0"), ("u3", "1"), ("v1", "2"), ("v2", "3"), ("v3", "0")]
+            fields = [("u1", "1"), ("u2", "0"), ("u3", "1"), ("v1", "2"), ("v2", "3"), ("v3", "0"), ("Mode", "auto")]
 
         # --- COMPLEX NUMBERS ---
         elif "Complex Arithmetic" in task:
@@ -214,133 +229,22 @@ class MAT1503Window(tk.Toplevel):
 
     def solve_step_by_step(self):
         task = self.taskVar.get()
-        steps = ""
-        
+        inputs = {k: v.get() for k, v in self.entries.items()}
+
         try:
-            data = {k: float(v.get()) for k, v in self.entries.items()}
-        except ValueError:
-            messagebox.showerror("Input Error", "Please enter valid numbers.")
+            solution = solve("MAT1503", task, inputs)
+        except SolverInputError as e:
+            messagebox.showerror("Input Error", str(e))
             return
 
-        # ================= MATRICES & SYSTEMS =================
-        if "Solve 2x2 System" in task:
-            a, b, e = data["a"], data["b"], data["e"]
-            c, d, f = data["c"], data["d"], data["f"]
-            
-            detA = a*d - b*c
-            dx = e*d - b*f
-            dy = a*f - e*c
-            
-            steps += "TOPIC: CRAMER'S RULE (2x2)\n----------------------------\n"
-            steps += f"System:\n   {a}x + {b}y = {e}\n   {c}x + {d}y = {f}\n\n"
-            steps += "1. Calculate Determinant D:\n"
-            steps += f"   D = (a*d) - (b*c) = ({a}*{d}) - ({b}*{c}) = {detA}\n\n"
-            
-            if detA == 0:
-                steps += "   Since D = 0, the system has no unique solution.\n"
-            else:
-                steps += "2. Calculate Dx (Replace x-column with constants):\n"
-                steps += f"   Dx = (e*d) - (b*f) = ({e}*{d}) - ({b}*{f}) = {dx}\n\n"
-                steps += "3. Calculate Dy (Replace y-column with constants):\n"
-                steps += f"   Dy = (a*f) - (e*c) = ({a}*{f}) - ({e}*{c}) = {dy}\n\n"
-                steps += "4. Solve for x and y:\n"
-                steps += f"   x = Dx / D = {dx} / {detA} = {dx/detA:.2f}\n"
-                steps += f"   y = Dy / D = {dy} / {detA} = {dy/detA:.2f}\n"
-
-        elif "Inverse" in task:
-            a, b, c, d = data["A11"], data["A12"], data["A21"], data["A22"]
-            det = a*d - b*c
-            
-            steps += "TOPIC: INVERSE MATRIX (2x2)\n---------------------------\n"
-            steps += f"Matrix A = [[{a}, {b}], [{c}, {d}]]\n\n"
-            steps += "1. Calculate Determinant:\n"
-            steps += f"   det(A) = ad - bc = ({a})({d}) - ({b})({c}) = {det}\n\n"
-            
-            if det == 0:
-                steps += "   Since det(A) = 0, the matrix is Singular and has NO Inverse.\n"
-            else:
-                steps += "2. Swap main diagonal, change signs of off-diagonal:\n"
-                steps += f"   Adjoint = [[{d}, {-b}], [{-c}, {a}]]\n\n"
-                steps += "3. Multiply by 1/det(A):\n"
-                steps += f"   A^(-1) = (1/{det}) * Adjoint\n"
-                steps += f"   A^(-1) = [[{d/det:.2f}, {-b/det:.2f}], [{-c/det:.2f}, {a/det:.2f}]]\n"
-
-        # ================= VECTORS =================
-        elif "Dot Product" in task:
-            u = [data["u1"], data["u2"], data["u3"]]
-            v = [data["v1"], data["v2"], data["v3"]]
-            dot_prod = sum(i*j for i, j in zip(u, v))
-            
-            steps += "TOPIC: DOT PRODUCT\n------------------\n"
-            steps += f"Vectors:\n   u = {u}\n   v = {v}\n\n"
-            steps += "Formula: u.v = u1*v1 + u2*v2 + u3*v3\n"
-            steps += f"   = ({u[0]}*{v[0]}) + ({u[1]}*{v[1]}) + ({u[2]}*{v[2]})\n"
-            steps += f"   = {u[0]*v[0]} + {u[1]*v[1]} + {u[2]*v[2]}\n"
-            steps += f"   = {dot_prod}\n"
-
-        elif "Cross Product" in task:
-            u1, u2, u3 = data["u1"], data["u2"], data["u3"]
-            v1, v2, v3 = data["v1"], data["v2"], data["v3"]
-            
-            cx = u2*v3 - u3*v2
-            cy = u3*v1 - u1*v3
-            cz = u1*v2 - u2*v1
-            
-            steps += "TOPIC: CROSS PRODUCT\n--------------------\n"
-            steps += f"u = <{u1}, {u2}, {u3}>, v = <{v1}, {v2}, {v3}>\n\n"
-            steps += "Formula (Determinant method):\n"
-            steps += "   i(u2v3 - u3v2) - j(u1v3 - u3v1) + k(u1v2 - u2v1)\n\n"
-            steps += f"1. i-component: ({u2}*{v3}) - ({u3}*{v2}) = {cx}\n"
-            steps += f"2. j-component: -[({u1}*{v3}) - ({u3}*{v1})] = -[{u1*v3 - u3*v1}] = {cy}\n"
-            steps += f"3. k-component: ({u1}*{v2}) - ({u2}*{v1}) = {cz}\n\n"
-            steps += f"Result: u x v = <{cx}, {cy}, {cz}>\n"
-
-        # ================= COMPLEX NUMBERS =================
-        elif "Polar Form" in task:
-            a, b = data["Real Part (a)"], data["Imag Part (b)"]
-            r = math.sqrt(a**2 + b**2)
-            theta = math.atan2(b, a)
-            deg = math.degrees(theta)
-            
-            steps += "TOPIC: COMPLEX POLAR FORM\n---------------------------\n"
-            steps += f"z = {a} + {b}i\n\n"
-            steps += "1. Calculate Modulus |z| (r):\n"
-            steps += f"   r = sqrt(a^2 + b^2) = sqrt({a}^2 + {b}^2)\n"
-            steps += f"   r = sqrt({a**2 + b**2}) = {r:.4f}\n\n"
-            steps += "2. Calculate Argument (theta):\n"
-            steps += f"   theta = atan(b/a) = atan({b}/{a})\n"
-            steps += f"   theta = {theta:.4f} radians ({deg:.2f} degrees)\n\n"
-            steps += "3. Polar Form:\n"
-            steps += f"   z = {r:.2f}(cos({deg:.2f}°) + i*sin({deg:.2f}°))\n"
-
-        elif "De Moivre" in task:
-            a, b, n = data["Real Part"], data["Imag Part"], int(data["Power n"])
-            r = math.sqrt(a**2 + b**2)
-            theta = math.atan2(b, a)
-            
-            steps += "TOPIC: DE MOIVRE'S THEOREM\n--------------------------\n"
-            steps += f"Calculate ({a} + {b}i)^{n}\n\n"
-            steps += "1. Convert to Polar:\n"
-            steps += f"   r = {r:.2f}, theta = {math.degrees(theta):.2f}°\n\n"
-            steps += "2. Apply Theorem: z^n = r^n * (cos(n*theta) + i*sin(n*theta))\n"
-            steps += f"   r^{n} = {r}^{n} = {r**n:.2f}\n"
-            steps += f"   angle = {n} * {math.degrees(theta):.2f}° = {n*math.degrees(theta):.2f}°\n\n"
-            
-            new_r = r**n
-            new_theta = n * theta
-            final_real = new_r * math.cos(new_theta)
-            final_imag = new_r * math.sin(new_theta)
-            
-            steps += "3. Convert back to Rectangular:\n"
-            steps += f"   Real = {new_r:.2f} * cos({math.degrees(new_theta):.2f}°) = {final_real:.2f}\n"
-            steps += f"   Imag = {new_r:.2f} * sin({math.degrees(new_theta):.2f}°) = {final_imag:.2f}\n\n"
-            steps += f"Result: {final_real:.2f} + {final_imag:.2f}i\n"
-
-        else:
-            steps = "Solution logic for this task is coming soon."
-
         self.solutionText.delete("1.0", "end")
-        self.solutionText.insert("1.0", steps)
+        self.solutionText.insert("1.0", solution.text())
+
+    def chooseVectorFile(self):
+        path = filedialog.askopenfilename(parent=self, filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if path:
+            self.entries["CSV File"].delete(0, "end")
+            self.entries["CSV File"].insert(0, path)
 
     def clearInputs(self):
         self.updateInputFields()
@@ -1,8 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import math
-import sympy
-from sympy import symbols, limit, diff, integrate, solve, Function, dsolve, Eq, sin, cos, tan, exp, log, sqrt
+from solvers import SolverInputError
+from solverPool import BackgroundSolve
+from plotPanel import PlotPanel
 
 #+++++++++++++++ Color Scheme +++++++++++++++++++
 backgroundColour = '#282c34'
@@ -26,7 +26,10 @@ class MAT1512Window(tk.Toplevel):
         
         self.topicName = topicName
         self.entries = {} 
+        self.figure = None  # graph of the last solution, drawn by the plot panel
+        self.graphShown = False
         
+        self.runner = BackgroundSolve(self, "MAT1512", self.showSolution, self.showStatus)
         self.createInterface()
 
     def createInterface(self):
@@ -116,6 +119,36 @@ class MAT1512Window(tk.Toplevel):
         )
         clearButton.pack(fill="x")
 
+        # Cancel Button (SymPy solves run in a background process)
+        self.cancelButton = tk.Button(
+            leftPanel,
+            text="⏹ Cancel",
+            command=self.cancelSolve,
+            bg=buttonBg,
+            fg=foregroundColour,
+            font=("Arial", 10),
+            relief='flat',
+            cursor='hand2',
+            state="disabled"
+        )
+        self.cancelButton.pack(fill="x", pady=(5, 0))
+
+        # Graph toggle (the plot panel sits under the solution)
+        self.graphButton = tk.Button(
+            leftPanel,
+            text="📊 Show Graph",
+            command=self.toggleGraph,
+            bg=buttonBg,
+            fg=foregroundColour,
+            font=("Arial", 10),
+            relief='flat',
+            cursor='hand2'
+        )
+        self.graphButton.pack(fill="x", pady=(5, 0))
+
+        self.statusLabel = tk.Label(leftPanel, text="", bg=backgroundColour, fg=accentColour, font=("Arial", 9), justify="left")
+        self.statusLabel.pack(anchor="w", pady=(10, 0))
+
         # 2. RIGHT SIDE: Solution Display
         rightPanel = tk.Frame(contentFrame, bg=backgroundColour)
         rightPanel.pack(side="right", fill="both", expand=True)
@@ -137,6 +170,8 @@ class MAT1512Window(tk.Toplevel):
             padx=15, pady=15
         )
         self.solutionText.pack(fill="both", expand=True, pady=5)
+
+        self.plotPanel = PlotPanel(rightPanel)
         
         # Back Button
         tk.Button(
@@ -222,129 +257,48 @@ class MAT1512Window(tk.Toplevel):
 
     def solve_step_by_step(self):
         task = self.taskVar.get()
-        steps = ""
-        
-        try:
-            # Collect inputs
-            inputs = {k: v.get() for k, v in self.entries.items()}
-            x, y, z = symbols('x y z')
-        except ValueError:
-            messagebox.showerror("Input Error", "Please check your inputs.")
-            return
+        inputs = {label: entry.get() for label, entry in self.entries.items()}
+
+        # Runs in a worker process; showSolution is called back on this thread
+        self.runner.start(task, inputs)
+        self.solutionText.delete("1.0", "end")
+        self.cancelButton.config(state="normal")
 
-        try:
-            # ================= LIMITS =================
-            if "Limit as x->a" in task:
-                expr_str = inputs["Function f(x)"]
-                a = float(inputs["Point a"])
-                f = sympy.sympify(expr_str)
-                res = limit(f, x, a)
-                
-                steps += f"TOPIC: LIMIT OF A FUNCTION\n--------------------------\n"
-                steps += f"Calculate limit of f(x) = {expr_str} as x -> {a}\n\n"
-                steps += "1. Direct Substitution Check:\n"
-                try:
-                    val = f.subs(x, a)
-                    steps += f"   f({a}) = {val}\n"
-                except:
-                    steps += f"   f({a}) is undefined or indeterminate.\n"
-                
-                steps += f"\n2. Calculated Limit:\n   lim(x->{a}) = {res}\n"
-
-            elif "Limit at Infinity" in task:
-                expr_str = inputs["Function f(x)"]
-                f = sympy.sympify(expr_str)
-                res = limit(f, x, sympy.oo)
-                
-                steps += "TOPIC: LIMIT AT INFINITY\n------------------------\n"
-                steps += f"Calculate limit of f(x) = {expr_str} as x -> oo\n\n"
-                steps += f"Result: {res}\n"
-
-            # ================= DIFFERENTIATION =================
-            elif "Find Derivative" in task:
-                expr_str = inputs["Function f(x)"]
-                f = sympy.sympify(expr_str)
-                res = diff(f, x)
-                
-                steps += "TOPIC: DIFFERENTIATION\n----------------------\n"
-                steps += f"Function: f(x) = {expr_str}\n\n"
-                steps += "1. Apply Differentiation Rules:\n"
-                steps += f"   f'(x) = d/dx [{expr_str}]\n\n"
-                steps += f"Result:\n   f'(x) = {res}\n"
-
-            elif "Tangent Line" in task:
-                expr_str = inputs["Function f(x)"]
-                a = float(inputs["Point x=a"])
-                f = sympy.sympify(expr_str)
-                
-                # 1. Find f(a)
-                fa = f.subs(x, a)
-                # 2. Find f'(x)
-                f_prime = diff(f, x)
-                # 3. Find slope m = f'(a)
-                m = f_prime.subs(x, a)
-                
-                steps += "TOPIC: TANGENT LINE\n-------------------\n"
-                steps += f"Find tangent to f(x) = {expr_str} at x = {a}\n\n"
-                steps += f"1. Find point coordinates:\n   f({a}) = {fa}\n   Point: ({a}, {fa})\n\n"
-                steps += f"2. Find Derivative (Slope function):\n   f'(x) = {f_prime}\n\n"
-                steps += f"3. Calculate Slope at x={a}:\n   m = f'({a}) = {m}\n\n"
-                steps += f"4. Equation of Line (y - y1 = m(x - x1)):\n"
-                steps += f"   y - {fa} = {m}(x - {a})\n"
-                steps += f"   y = {m}*x + ({fa - m*a})\n"
-
-            # ================= INTEGRALS =================
-            elif "Indefinite Integral" in task:
-                expr_str = inputs["Function f(x)"]
-                f = sympy.sympify(expr_str)
-                res = integrate(f, x)
-                
-                steps += "TOPIC: INDEFINITE INTEGRAL\n--------------------------\n"
-                steps += f"Integral of: {expr_str} dx\n\n"
-                steps += "1. Find Antiderivative:\n"
-                steps += f"   F(x) = {res} + C\n"
-
-            elif "Definite Integral" in task:
-                expr_str = inputs["Function f(x)"]
-                a = float(inputs["Lower Limit a"])
-                b = float(inputs["Upper Limit b"])
-                f = sympy.sympify(expr_str)
-                
-                F = integrate(f, x)
-                val_b = F.subs(x, b)
-                val_a = F.subs(x, a)
-                res = val_b - val_a
-                
-                steps += "TOPIC: DEFINITE INTEGRAL\n------------------------\n"
-                steps += f"Calculate Integral from {a} to {b} of {expr_str} dx\n\n"
-                steps += f"1. Find Antiderivative F(x):\n   F(x) = {F}\n\n"
-                steps += f"2. Apply Fundamental Theorem (F(b) - F(a)):\n"
-                steps += f"   F({b}) = {val_b}\n"
-                steps += f"   F({a}) = {val_a}\n\n"
-                steps += f"3. Result:\n   {val_b} - ({val_a}) = {res}\n"
-
-            # ================= PARTIAL DERIVATIVES =================
-            elif "Partial Derivative" in task:
-                expr_str = inputs["Function f(x,y)"]
-                f = sympy.sympify(expr_str)
-                
-                if "fx" in task:
-                    res = diff(f, x)
-                    var = "x"
-                else:
-                    res = diff(f, y)
-                    var = "y"
-                
-                steps += f"TOPIC: PARTIAL DERIVATIVE ({var})\n-----------------------------\n"
-                steps += f"Function f(x,y) = {expr_str}\n\n"
-                steps += f"Differentiate with respect to {var} (treating other variables as constants):\n\n"
-                steps += f"Result:\n   df/d{var} = {res}\n"
-
-            else:
-                steps += "Solver logic for this specific task is coming soon."
-
-        except Exception as e:
-            steps += f"Error in calculation: {str(e)}\nCheck your syntax (e.g., use * for multiply, ** for power)."
+    def toggleGraph(self):
+        self.graphShown = not self.graphShown
+        if not self.graphShown:
+            self.plotPanel.pack_forget()
+            self.graphButton.config(text="📊 Show Graph")
+        else:
+            self.plotPanel.pack(side="bottom", fill="x", pady=(5, 0))
+            self.graphButton.config(text="📊 Hide Graph")
+            self.plotPanel.show(self.figure)
+
+    def cancelSolve(self):
+        self.runner.cancel()
+
+    def showStatus(self, text):
+        self.statusLabel.config(text=text)
+
+    def showSolution(self, job):
+        self.cancelButton.config(state="disabled")
+        self.statusLabel.config(text="")
+
+        if job.status == "done":
+            steps = job.solution.text()
+            self.statusLabel.config(text=f"Solved in {job.elapsed():.2f} s")
+            self.figure = job.solution.figure
+            if self.graphShown:
+                self.plotPanel.show(self.figure)
+        elif job.status == "timeout":
+            steps = f"Stopped after {job.elapsed():.0f} s: this calculation is taking too long.\nTry a simpler expression or check the input."
+        elif job.status == "cancelled":
+            steps = "Calculation cancelled."
+        elif isinstance(job.error, SolverInputError):
+            messagebox.showerror("Input Error", str(job.error))
+            return
+        else:
+            steps = f"Error: {job.error}"
 
         self.solutionText.delete("1.0", "end")
         self.solutionText.insert("1.0", steps)
@@ -352,7 +306,11 @@ class MAT1512Window(tk.Toplevel):
     def clearInputs(self):
         self.updateInputFields()
         self.solutionText.delete("1.0", "end")
+        self.figure = None
+        if self.graphShown:
+            self.plotPanel.show(None)
 
     def on_close(self, parent):
+        self.runner.cancel()
         parent.attributes('-disabled', False)
         self.destroy()
\ No newline at end of file
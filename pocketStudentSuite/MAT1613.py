@@ -1,7 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import sympy
-from sympy import symbols, limit, diff, integrate, series, sin, cos, tan, exp, log, oo, pi, asin, acos, atan, sinh, cosh, tanh
+from solvers import SolverInputError
+from solverPool import BackgroundSolve
+from plotPanel import PlotPanel
 
 #+++++++++++++++ Color Scheme +++++++++++++++++++
 backgroundColour = '#282c34'
@@ -25,7 +26,10 @@ class MAT1613Window(tk.Toplevel):
         
         self.topicName = topicName
         self.entries = {} 
+        self.figure = None  # graph of the last solution, drawn by the plot panel
+        self.graphShown = False
         
+        self.runner = BackgroundSolve(self, "MAT1613", self.showSolution, self.showStatus)
         self.createInterface()
 
     def createInterface(self):
@@ -115,6 +119,36 @@ class MAT1613Window(tk.Toplevel):
         )
         clearButton.pack(fill="x")
 
+        # Cancel Button (SymPy solves run in a background process)
+        self.cancelButton = tk.Button(
+            leftPanel,
+            text="⏹ Cancel",
+            command=self.cancelSolve,
+            bg=buttonBg,
+            fg=foregroundColour,
+            font=("Arial", 10),
+            relief='flat',
+            cursor='hand2',
+            state="disabled"
+        )
+        self.cancelButton.pack(fill="x", pady=(5, 0))
+
+        # Graph toggle (the plot panel sits under the solution)
+        self.graphButton = tk.Button(
+            leftPanel,
+            text="📊 Show Graph",
+            command=self.toggleGraph,
+            bg=buttonBg,
+            fg=foregroundColour,
+            font=("Arial", 10),
+            relief='flat',
+            cursor='hand2'
+        )
+        self.graphButton.pack(fill="x", pady=(5, 0))
+
+        self.statusLabel = tk.Label(leftPanel, text="", bg=backgroundColour, fg=accentColour, font=("Arial", 9), justify="left")
+        self.statusLabel.pack(anchor="w", pady=(10, 0))
+
         # 2. RIGHT SIDE: Solution Display
         rightPanel = tk.Frame(contentFrame, bg=backgroundColour)
         rightPanel.pack(side="right", fill="both", expand=True)
@@ -136,6 +170,8 @@ class MAT1613Window(tk.Toplevel):
             padx=15, pady=15
         )
         self.solutionText.pack(fill="both", expand=True, pady=5)
+
+        self.plotPanel = PlotPanel(rightPanel)
         
         # Back Button
         tk.Button(
@@ -161,7 +197,7 @@ class MAT1613Window(tk.Toplevel):
         elif "Applications" in self.topicName: # Area/Volume
             return ["Area Between Curves", "Volume of Revolution (Disk)"]
         elif "Series" in self.topicName:
-            return ["Taylor Series Expansion", "Limit of Sequence"]
+            return ["Taylor Series Expansion", "Limit of Sequence", "Series Convergence Test"]
         else:
             return ["Standard Calculation"]
 
@@ -179,7 +215,7 @@ class MAT1613Window(tk.Toplevel):
         elif "Mean Value" in task:
             fields = [("Function f(x)", "x**3 - x"), ("Interval [a, b]", "-1, 2")]
         elif "Critical Points" in task:
-            fields = [("Function f(x)", "x**3 - 3*x**2 + 1")]
+            fields = [("Function f(x)", "x**3 - 3*x**2 + 1"), ("Search Interval a, b", "-10, 10")]
 
         # --- TRANSCENDENTAL ---
         elif "Derive Inverse" in task:
@@ -189,7 +225,8 @@ class MAT1613Window(tk.Toplevel):
 
         # --- INTEGRATION TECHNIQUES ---
         elif "Integration by Parts" in task:
-            fields = [("Integrand f(x)", "x * exp(x)"), ("Parts u", "x"), ("Parts dv", "exp(x)")]
+            tk.Label(self.inputFrame, text="Leave u and dv blank to choose them by LIATE\nMethod: auto, standard or tabular", bg=backgroundColour, fg=foregroundColour).pack()
+            fields = [("Integrand f(x)", "x * exp(x)"), ("Parts u", "x"), ("Parts dv", "exp(x)"), ("Method", "auto")]
         elif "Partial Fractions" in task:
             fields = [("Rational Function", "1 / (x**2 - 1)")]
         elif "Improper" in task:
@@ -203,9 +240,11 @@ class MAT1613Window(tk.Toplevel):
 
         # --- SERIES ---
         elif "Taylor Series" in task:
-            fields = [("Function f(x)", "sin(x)"), ("Point a", "0"), ("Order n", "5")]
+            fields = [("Function f(x)", "sin(x)"), ("Point a", "0"), ("Order n", "5"), ("Error Radius r", "1")]
         elif "Sequence" in task:
             fields = [("General Term a_n", "(n + 1)/n")]
+        elif "Convergence" in task:
+            fields = [("General Term a_n", "(-1)**n / n"), ("Start n", "1")]
 
         # Create Entry Boxes
         for text, default in fields:
@@ -219,135 +258,48 @@ class MAT1613Window(tk.Toplevel):
 
     def solve_step_by_step(self):
         task = self.taskVar.get()
-        steps = ""
-        x, n = symbols('x n')
-        
-        try:
-            inputs = {k: v.get() for k, v in self.entries.items()}
-        except:
-            return
+        inputs = {label: entry.get() for label, entry in self.entries.items()}
+
+        # Runs in a worker process; showSolution is called back on this thread
+        self.runner.start(task, inputs)
+        self.solutionText.delete("1.0", "end")
+        self.cancelButton.config(state="normal")
 
-        try:
-            # ================= DERIVATIVES & LIMITS =================
-            if "L'Hopital" in task:
-                func_str = inputs["Function f(x)"]
-                pt = float(inputs["Limit Point a"])
-                f = sympy.sympify(func_str)
-                
-                # Check direct sub
-                try:
-                    val = f.subs(x, pt)
-                except:
-                    val = "undefined"
-                
-                # Calculate Limit
-                lim_val = limit(f, x, pt)
-                
-                steps += "TOPIC: L'HOPITAL'S RULE\n-----------------------\n"
-                steps += f"Limit of {func_str} as x -> {pt}\n\n"
-                steps += f"1. Direct Substitution: {val}\n"
-                steps += "   (Likely 0/0 or inf/inf)\n\n"
-                steps += f"2. Applying L'Hopital (differentiating num and denom)...\n"
-                steps += f"   Limit Value = {lim_val}\n"
-
-            # ================= INTEGRATION TECHNIQUES =================
-            elif "Integration by Parts" in task:
-                func_str = inputs["Integrand f(x)"]
-                u_str = inputs["Parts u"]
-                dv_str = inputs["Parts dv"]
-                
-                f = sympy.sympify(func_str)
-                u = sympy.sympify(u_str)
-                dv = sympy.sympify(dv_str)
-                
-                du = diff(u, x)
-                v = integrate(dv, x)
-                
-                result = u*v - integrate(v*du, x)
-                
-                steps += "TOPIC: INTEGRATION BY PARTS\n---------------------------\n"
-                steps += f"Integral: {func_str} dx\n"
-                steps += "Formula: integral(u dv) = uv - integral(v du)\n\n"
-                steps += f"1. Choose u = {u}  =>  du = {du} dx\n"
-                steps += f"2. Choose dv = {dv} dx =>  v = {v}\n\n"
-                steps += f"3. Apply Formula:\n"
-                steps += f"   = ({u})*({v}) - integral({v} * {du})\n"
-                steps += f"   = {u*v} - {integrate(v*du, x)}\n\n"
-                steps += f"Final Result: {result} + C\n"
-
-            elif "Partial Fractions" in task:
-                func_str = inputs["Rational Function"]
-                f = sympy.sympify(func_str)
-                part_frac = sympy.apart(f)
-                integral = integrate(part_frac, x)
-                
-                steps += "TOPIC: PARTIAL FRACTIONS\n------------------------\n"
-                steps += f"Integrate: {func_str}\n\n"
-                steps += f"1. Decompose into Partial Fractions:\n"
-                steps += f"   {part_frac}\n\n"
-                steps += f"2. Integrate each term:\n"
-                steps += f"   {integral} + C\n"
-
-            elif "Improper" in task:
-                func_str = inputs["Integrand"]
-                a_str = inputs["Lower Limit"]
-                b_str = inputs["Upper Limit"]
-                
-                f = sympy.sympify(func_str)
-                # Handle infinity input
-                if "oo" in b_str: b = oo
-                else: b = float(b_str)
-                a = float(a_str)
-                
-                res = integrate(f, (x, a, b))
-                
-                steps += "TOPIC: IMPROPER INTEGRAL\n------------------------\n"
-                steps += f"Integral from {a} to {b} of {func_str}\n\n"
-                steps += "1. Set up Limit:\n"
-                steps += f"   lim(t->{b}) integral({a} to t)\n\n"
-                steps += f"2. Evaluate:\n"
-                if res == oo:
-                    steps += "   Result is Infinity (DIVERGES)\n"
-                else:
-                    steps += f"   Result = {res} (CONVERGES)\n"
-
-            # ================= APPLICATIONS =================
-            elif "Volume" in task:
-                r_str = inputs["Radius Function R(x)"]
-                a_str, b_str = inputs["Interval a, b"].split(",")
-                
-                R = sympy.sympify(r_str)
-                a, b = float(a_str), float(b_str)
-                
-                vol = sympy.pi * integrate(R**2, (x, a, b))
-                
-                steps += "TOPIC: VOLUME OF REVOLUTION (DISK)\n----------------------------------\n"
-                steps += f"Rotate region under {r_str} about x-axis.\n"
-                steps += "Formula: V = pi * integral(R(x)^2 dx)\n\n"
-                steps += f"1. R(x)^2 = ({R})**2 = {R**2}\n"
-                steps += f"2. Integrate from {a} to {b}:\n"
-                steps += f"   V = {vol} cubic units\n"
-                steps += f"   V approx {vol.evalf():.4f}\n"
-
-            # ================= SERIES =================
-            elif "Taylor Series" in task:
-                func_str = inputs["Function f(x)"]
-                a = float(inputs["Point a"])
-                order = int(inputs["Order n"])
-                f = sympy.sympify(func_str)
-                
-                ser = f.series(x, a, order).removeO()
-                
-                steps += "TOPIC: TAYLOR SERIES\n--------------------\n"
-                steps += f"Expand {func_str} at x={a} to order {order}\n\n"
-                steps += f"Resulting Polynomial:\n"
-                steps += f"{ser}\n"
-
-            else:
-                steps += "Solution logic coming soon."
-
-        except Exception as e:
-            steps += f"Calculation Error: {str(e)}\nCheck syntax (e.g. use ** for power)"
+    def toggleGraph(self):
+        self.graphShown = not self.graphShown
+        if not self.graphShown:
+            self.plotPanel.pack_forget()
+            self.graphButton.config(text="📊 Show Graph")
+        else:
+            self.plotPanel.pack(side="bottom", fill="x", pady=(5, 0))
+            self.graphButton.config(text="📊 Hide Graph")
+            self.plotPanel.show(self.figure)
+
+    def cancelSolve(self):
+        self.runner.cancel()
+
+    def showStatus(self, text):
+        self.statusLabel.config(text=text)
+
+    def showSolution(self, job):
+        self.cancelButton.config(state="disabled")
+        self.statusLabel.config(text="")
+
+        if job.status == "done":
+            steps = job.solution.text()
+            self.statusLabel.config(text=f"Solved in {job.elapsed():.2f} s")
+            self.figure = job.solution.figure
+            if self.graphShown:
+                self.plotPanel.show(self.figure)
+        elif job.status == "timeout":
+            steps = f"Stopped after {job.elapsed():.0f} s: this calculation is taking too long.\nTry a simpler expression or check the input."
+        elif job.status == "cancelled":
+            steps = "Calculation cancelled."
+        elif isinstance(job.error, SolverInputError):
+            messagebox.showerror("Input Error", str(job.error))
+            return
+        else:
+            steps = f"Error: {job.error}"
 
         self.solutionText.delete("1.0", "end")
         self.solutionText.insert("1.0", steps)
@@ -355,7 +307,11 @@ class MAT1613Window(tk.Toplevel):
     def clearInputs(self):
         self.updateInputFields()
         self.solutionText.delete("1.0", "end")
+        self.figure = None
+        if self.graphShown:
+            self.plotPanel.show(None)
 
     def on_close(self, parent):
+        self.runner.cancel()
         parent.attributes('-disabled', False)
         self.destroy()
\ No newline at end of file
@@ -0,0 +1,192 @@
+import argparse
+import csv
+import difflib
+import json
+import os
+import sys
+import time
+
+import solvers
+from solverPool import SolverPool, defaultTimeout
+
+#+++++++++++++++ Batch Homework Mode +++++++++++++++++++
+# Solves a whole file of problems without opening a window:
+#
+#     python batchSolve.py problems.jsonl -o solutions.jsonl --workers 4
+#
+# Each problem names a module, a task and the task's inputs (the labels the
+# windows use). JSONL lines look like
+#
+#     {"id": "q1", "module": "MAT1512", "task": "Definite Integral",
+#      "inputs": {"Function f(x)": "x^2", "Lower Limit a": "0", "Upper Limit b": "3"}}
+#
+# and a CSV has module and task columns (id optional) plus either an "inputs"
+# column holding that JSON object or one column per input label; empty cells
+# are left out, so one CSV can mix tasks.
+#
+# Problems go to a SolverPool of worker processes and every result is written
+# as soon as it finishes (so the output is in finishing order; "line" gives
+# the problem's place in the input). Output is JSONL, or readable worked
+# solutions when the output file ends in .txt. A per-task timing table goes
+# to stderr at the end.
+
+# Seconds between checks on the pool
+pollSeconds = 0.02
+reservedColumns = ("id", "module", "task", "inputs")
+
+
+def read_problems(path):
+    # Yields (line, record) with record = {"id", "module", "task", "inputs"},
+    # or (line, error message) for a record that cannot be used
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as handle:
+            for line, row in enumerate(csv.DictReader(handle), 2):
+                try:
+                    if row.get("inputs"):
+                        inputs = json.loads(row["inputs"])
+                    else:
+                        inputs = {k: v for k, v in row.items() if k not in reservedColumns and k and v not in (None, "")}
+                except ValueError as e:
+                    yield line, f"bad inputs column: {e}"
+                    continue
+                yield line, _record(row, inputs, line)
+        return
+
+    with open(path, encoding="utf-8") as handle:
+        for line, text in enumerate(handle, 1):
+            if not text.strip():
+                continue
+            try:
+                row = json.loads(text)
+            except ValueError as e:
+                yield line, f"not valid JSON: {e}"
+                continue
+            yield line, _record(row, row.get("inputs") or {}, line)
+
+
+def _record(row, inputs, line):
+    if not row.get("module") or not row.get("task"):
+        return "needs both a module and a task"
+    if not isinstance(inputs, dict):
+        return "inputs must be an object of label: value pairs"
+    # A task with no solver would "solve" to the placeholder text and be
+    # reported as done, so unknown names are rejected here
+    try:
+        known = solvers.tasks(row["module"])
+    except ImportError:
+        return f"unknown module '{row['module']}'"
+    if row["task"] not in known:
+        close = difflib.get_close_matches(row["task"], known, n=1)
+        return f"no solver for task '{row['task']}' in {row['module']}" + (f" (did you mean '{close[0]}'?)" if close else "")
+    return {"id": row.get("id") or str(line), "module": row["module"], "task": row["task"], "inputs": inputs}
+
+
+class ResultWriter:
+    def __init__(self, handle, as_text):
+        self.handle = handle
+        self.as_text = as_text
+
+    def write(self, result, solution=None):
+        if self.as_text:
+            self.handle.write(f"===== {result['id']}: {result['module']} / {result['task']} "
+                              f"({result['status']}, {result['seconds']:.2f} s) =====\n")
+            self.handle.write((solution.text() if solution is not None else result.get("error") or "") + "\n\n")
+        else:
+            self.handle.write(json.dumps(result, default=str) + "\n")
+        # Streamed: each result is on disk as soon as it is known
+        self.handle.flush()
+
+
+def job_result(line, record, job):
+    result = {"id": record["id"], "line": line, "module": record["module"], "task": record["task"],
+              "status": job.status, "seconds": round(job.elapsed(), 4)}
+    solution = job.solution
+    if job.status == "done":
+        if solution.error:
+            result["status"] = "error"
+            result["error"] = solution.error
+        result["answer"] = solution.answer
+        result["solution"] = solution.text()
+    elif job.status == "timeout":
+        result["error"] = f"stopped after {job.timeout or defaultTimeout:.0f} s"
+    elif job.error is not None:
+        result["error"] = str(job.error)
+    return result, solution
+
+
+def run(problems, writer, workers, timeout, progress=sys.stderr):
+    # Returns {(module, task): [seconds, ...]} and the counts per status
+    pool = SolverPool(size=workers, timeout=timeout)
+    pool.warm()
+    timings, counts = {}, {}
+    running = {}
+    problems = list(problems)
+    total = len(problems)
+
+    def report(result, solution=None):
+        writer.write(result, solution)
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+        finished = sum(counts.values())
+        if progress:
+            progress.write(f"[{finished}/{total}] {result['module']} / {result['task']} ({result['id']}): "
+                           f"{result['status']} in {result['seconds']:.2f} s\n")
+
+    try:
+        for line, record in problems:
+            if isinstance(record, str):
+                report({"id": str(line), "line": line, "module": None, "task": None,
+                        "status": "error", "seconds": 0.0, "error": record})
+                continue
+            job = pool.submit(record["module"], record["task"], record["inputs"])
+            running[job.id] = (line, record, job)
+
+        while running:
+            pool.poll()
+            for job_id, (line, record, job) in list(running.items()):
+                if not job.done():
+                    continue
+                del running[job_id]
+                result, solution = job_result(line, record, job)
+                timings.setdefault((record["module"], record["task"]), []).append(job.elapsed())
+                report(result, solution if result["status"] != "timeout" else None)
+            time.sleep(pollSeconds)
+    finally:
+        pool.shutdown()
+    return timings, counts
+
+
+def timing_table(timings, counts, wall):
+    lines = [f"{'Module':<8} {'Task':<36} {'Count':>5} {'Mean s':>8} {'Max s':>8} {'Total s':>8}"]
+    for (module, task), seconds in sorted(timings.items(), key=lambda item: -sum(item[1])):
+        lines.append(f"{module:<8} {task[:36]:<36} {len(seconds):>5} {sum(seconds) / len(seconds):>8.3f} "
+                     f"{max(seconds):>8.3f} {sum(seconds):>8.3f}")
+    summary = ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+    lines.append(f"{sum(counts.values())} problems ({summary}) in {wall:.2f} s wall time")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a JSONL or CSV file of problems with the suite's solvers.")
+    parser.add_argument("problems", help="input file (.jsonl or .csv)")
+    parser.add_argument("-o", "--output", help="output file (.jsonl, or .txt for worked solutions); default: stdout")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 2, help="solver processes (default: CPU count)")
+    parser.add_argument("-t", "--timeout", type=float, default=defaultTimeout,
+                        help=f"seconds per problem when its task sets no limit (default: {defaultTimeout})")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no per-problem progress lines")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    handle = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    as_text = bool(args.output) and args.output.lower().endswith(".txt")
+    try:
+        timings, counts = run(read_problems(args.problems), ResultWriter(handle, as_text), max(1, args.workers),
+                              args.timeout, progress=None if args.quiet else sys.stderr)
+    finally:
+        if handle is not sys.stdout:
+            handle.close()
+    sys.stderr.write(timing_table(timings, counts, time.perf_counter() - start))
+    return 1 if counts.get("error") or counts.get("timeout") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,416 @@
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+#+++++++++++++++ Solver Benchmarks +++++++++++++++++++
+# Times every solver task on representative and worst-case inputs, headless:
+#
+#     python benchmark.py                       # all cases, table on stdout
+#     python benchmark.py -k COS1501 -r 10      # only matching cases
+#     python benchmark.py --json before.json    # save results...
+#     python benchmark.py --compare before.json # ...and compare a later commit
+#
+# Each case runs in a fresh process (spawned, so no state is shared with the
+# others; a symbolic attempt left running by one case cannot slow the next)
+# with an empty result cache in a temporary directory. One untimed solve
+# imports the module, then every timed repeat starts from cold caches (use
+# --warm to keep them) and includes building the solution text. Peak memory
+# is what tracemalloc sees during one extra solve, so the SymPy import itself
+# is not counted.
+
+# Timed solves per case
+defaultRepeat = 5
+# Seconds a case may take in total before it is stopped
+caseTimeout = 300
+# A median this much slower/faster than the baseline is flagged
+changeThreshold = 1.2
+
+
+# ================= CASES =================
+def _csv(items):
+    return ", ".join(str(i) for i in items)
+
+
+def _pairs(pairs):
+    return ", ".join(f"({a},{b})" for a, b in pairs)
+
+
+def _ring(count):
+    # Satisfiable CNF over count variables, every one of them needed
+    return " & ".join(f"(v{i} | ~v{(i + 1) % count})" for i in range(count))
+
+
+def _matrix(n, m=None):
+    # Deterministic integer matrix, nonsingular when square
+    return "; ".join(" ".join(str((i * 31 + j * 17) % 19 - 9 + (i == j) * 4 * n) for j in range(m or n)) for i in range(n))
+
+
+def _vector_pairs(count, dimension):
+    # Deterministic "u | v" pairs, one per line
+    return "\n".join(" ".join(str((k * 7 + i * 3) % 13 - 6) for i in range(dimension)) + " | "
+                     + " ".join(str((k * 5 + i * 11) % 17 - 8) for i in range(dimension)) for k in range(count))
+
+
+_span = range(1000)
+
+# (module, task, case name, inputs)
+cases = [
+    # --- COS1501 ---
+    ("COS1501", "Generate Truth Table", "3 variables", {"Expression": "(p -> q) & (q -> r) -> (p -> r)"}),
+    ("COS1501", "Generate Truth Table", "20 variables", {"Expression": _ring(20)}),
+    ("COS1501", "Check Tautology/Contradiction", "20 variables, summary", {"Expression": _ring(20), "Summary only": "yes"}),
+    ("COS1501", "Check Tautology/Contradiction", "40 variables (SAT)", {"Expression": _ring(40)}),
+    ("COS1501", "Check Tautology/Contradiction", "1200 clauses (SAT)", {"Expression": _ring(1200), "Summary only": "yes"}),
+    ("COS1501", "Generate Truth Table", "1200-term chain", {"Expression": " & ".join(["(p | q | ~r)"] * 1200)}),
+    ("COS1501", "Set Operations (Union, Intersect)", "small", {"Set A": "1, 2, 3", "Set B": "3, 4, 5"}),
+    ("COS1501", "Set Operations (Union, Intersect)", "1000 elements",
+     {"Set A": _csv(_span), "Set B": _csv(range(500, 1500))}),
+    ("COS1501", "Power Set Generator", "3 elements", {"Set A": "a, b, c"}),
+    ("COS1501", "Power Set Generator", "18 elements", {"Set A": _csv(f"e{i}" for i in range(18))}),
+    ("COS1501", "Power Set Generator", "30 elements, k = 3", {"Set A": _csv(f"e{i}" for i in range(30)), "Only size k": "3"}),
+    ("COS1501", "Check Properties (Reflexive, etc.)", "small",
+     {"Set A": "1, 2, 3", "Relation R": "(1,1), (2,2), (3,3), (1,2)"}),
+    ("COS1501", "Check Properties (Reflexive, etc.)", "1000 elements",
+     {"Set A": _csv(_span), "Relation R": _pairs((i, (7 * i + 3) % 1000) for i in _span)}),
+    ("COS1501", "Find Inverse Relation", "1000 pairs", {"Relation R": _pairs((i, (7 * i + 3) % 1000) for i in _span)}),
+    ("COS1501", "Composition of Relations", "small", {"Relation R": "(1,a), (2,b)", "Relation S": "(a,x), (b,y)"}),
+    ("COS1501", "Composition of Relations", "1000 pairs, R^16",
+     {"Relation R": _pairs((i, (7 * i + 3) % 1000) for i in _span),
+      "Relation S": _pairs((i, (i + 1) % 1000) for i in _span), "Power k": "16"}),
+    ("COS1501", "Check Function Properties", "small",
+     {"Domain A": "1, 2, 3", "Codomain B": "a, b, c, d", "Function f (pairs)": "(1,a), (2,b), (3,c)"}),
+    ("COS1501", "Check Function Properties", "1000 elements",
+     {"Domain A": _csv(_span), "Codomain B": _csv(_span), "Function f (pairs)": _pairs((i, (7 * i) % 1000) for i in _span)}),
+
+    # --- MAT1503 ---
+    ("MAT1503", "Solve 2x2 System (Cramer's Rule)", "typical", {"a": "2", "b": "3", "e": "5", "c": "4", "d": "1", "f": "2"}),
+    ("MAT1503", "Solve Linear System (n x n)", "3x3 exact", {"Matrix A": "2 1 -1; -3 -1 2; -2 1 2", "Vector b": "8 -11 -3"}),
+    ("MAT1503", "Solve 2x2 System (Cramer's Rule)", "float",
+     {"a": "2", "b": "3", "e": "5", "c": "4", "d": "1", "f": "2", "Mode": "float"}),
+    ("MAT1503", "Solve Linear System (n x n)", "10x10 exact", {"Matrix A": _matrix(10), "Vector b": _matrix(1, 10)}),
+    ("MAT1503", "Solve Linear System (n x n)", "10x10 float",
+     {"Matrix A": _matrix(10), "Vector b": _matrix(1, 10), "Mode": "float"}),
+    ("MAT1503", "Solve Linear System (n x n)", "12x12 exact", {"Matrix A": _matrix(12), "Vector b": _matrix(1, 12)}),
+    ("MAT1503", "Solve Linear System (n x n)", "100x100 float",
+     {"Matrix A": _matrix(100), "Vector b": _matrix(1, 100), "Mode": "float"}),
+    ("MAT1503", "Matrix Multiplication", "2x3 by 3x2 steps", {"Matrix A": "1 2 3; 4 5 6", "Matrix B": "2 0; 1 2; -1 1/2"}),
+    ("MAT1503", "Matrix Multiplication", "60x60 exact", {"Matrix A": _matrix(60), "Matrix B": _matrix(60), "Mode": "exact"}),
+    ("MAT1503", "Matrix Multiplication", "200x200 float",
+     {"Matrix A": _matrix(200), "Matrix B": _matrix(200), "Mode": "float"}),
+    ("MAT1503", "Matrix Chain Product", "6 matrices",
+     {"Matrices": " | ".join(_matrix(m, n) for m, n in [(30, 35), (35, 15), (15, 5), (5, 10), (10, 20), (20, 25)])}),
+    ("MAT1503", "Determinant (2x2)", "typical", {"a11": "2", "a12": "3", "a21": "4", "a22": "5"}),
+    ("MAT1503", "Determinant (3x3)", "typical", dict(zip("abcdefghi", "1 2 3 0 1 4 5 6 0".split()))),
+    ("MAT1503", "Determinant (n x n)", "4x4 cofactors", {"Matrix A": _matrix(4)}),
+    ("MAT1503", "Determinant (n x n)", "6x6 Bareiss steps", {"Matrix A": _matrix(6)}),
+    ("MAT1503", "Determinant (n x n)", "200x200 exact", {"Matrix A": _matrix(200), "Mode": "exact"}),
+    ("MAT1503", "Determinant (n x n)", "200x200 float", {"Matrix A": _matrix(200), "Mode": "float"}),
+    ("MAT1503", "Inverse of 2x2 Matrix", "typical", {"A11": "4", "A12": "7", "A21": "2", "A22": "6"}),
+    ("MAT1503", "Inverse of 2x2 Matrix", "float", {"A11": "4", "A12": "7", "A21": "2", "A22": "6", "Mode": "float"}),
+    ("MAT1503", "Dot Product", "typical", {"u1": "1", "u2": "2", "u3": "3", "v1": "4", "v2": "-5", "v3": "6"}),
+    ("MAT1503", "Dot Product", "float", {"u1": "1", "u2": "2", "u3": "3", "v1": "4", "v2": "-5", "v3": "6", "Mode": "float"}),
+    ("MAT1503", "Cross Product", "typical", {"u1": "1", "u2": "0", "u3": "1", "v1": "2", "v2": "3", "v3": "0"}),
+    ("MAT1503", "Cross Product", "float", {"u1": "1", "u2": "0", "u3": "1", "v1": "2", "v2": "3", "v3": "0", "Mode": "float"}),
+    ("MAT1503", "Angle Between Vectors", "typical", {"u1": "1", "u2": "2", "u3": "3", "v1": "4", "v2": "-5", "v3": "6"}),
+    ("MAT1503", "Angle Between Vectors", "6-D", {"Vector u": "1 2 3 4 5 6", "Vector v": "6 -5 4 -3 2 -1"}),
+    ("MAT1503", "Projection of u onto v", "typical", {"u1": "1", "u2": "2", "u3": "3", "v1": "4", "v2": "-5", "v3": "6"}),
+    ("MAT1503", "Vector Batch (n-D)", "3 pairs, mixed dimensions", {"Vector Pairs": "1 2 3 | 4 -5 6; 1 0 | 0 1; 1 2 3 4 | 2 0 1 -1"}),
+    ("MAT1503", "Vector Batch (n-D)", "1000 pairs 3-D", {"Vector Pairs": _vector_pairs(1000, 3)}),
+    ("MAT1503", "Vector Batch (n-D)", "1000 pairs 10-D", {"Vector Pairs": _vector_pairs(1000, 10)}),
+    ("MAT1503", "Convert to Polar Form", "typical", {"Real Part (a)": "1", "Imag Part (b)": "1"}),
+    ("MAT1503", "De Moivre's Theorem (Powers)", "typical", {"Real Part": "1", "Imag Part": "1", "Power n": "5"}),
+
+    # --- MAT1512 ---
+    ("MAT1512", "Limit as x->a", "typical", {"Function f(x)": "(x^2 - 4)/(x - 2)", "Point a": "2"}),
+    ("MAT1512", "Limit at Infinity", "typical", {"Function f(x)": "(2*x^2 + 1)/(x^2 - 3)"}),
+    ("MAT1512", "Limit at Infinity", "nested exponentials", {"Function f(x)": "exp(x)*(exp(1/x - exp(-x)) - exp(1/x))"}),
+    ("MAT1512", "Left/Right Hand Limits", "typical", {"Function f(x)": "1/x", "Point a": "0", "Direction (+ or -)": "+"}),
+    ("MAT1512", "Find Derivative f'(x)", "typical", {"Function f(x)": "x^3 + 2*x^2 - 5"}),
+    ("MAT1512", "Find Derivative f'(x)", "deep composition", {"Function f(x)": "sin(exp(cos(log(x^2 + 1)))) * atan(sqrt(x))"}),
+    ("MAT1512", "Implicit Differentiation", "typical", {"Equation F(x,y)=0": "x^2 + y^2 - 25"}),
+    ("MAT1512", "Implicit Differentiation", "folium", {"Equation F(x,y)=0": "x^3 + y^3 = 6*x*y"}),
+    ("MAT1512", "Equation of Tangent Line", "typical", {"Function f(x)": "x^2", "Point x=a": "1"}),
+    ("MAT1512", "Higher Order Derivative", "typical", {"Function f(x)": "sin(x)", "Order n": "2"}),
+    ("MAT1512", "Higher Order Derivative", "order 12", {"Function f(x)": "x*exp(sin(x))", "Order n": "12"}),
+    ("MAT1512", "Indefinite Integral", "typical", {"Function f(x)": "x^2 + 1/x"}),
+    ("MAT1512", "Indefinite Integral", "hard", {"Function f(x)": "exp(x)*sin(x)*x^2"}),
+    ("MAT1512", "Definite Integral", "typical", {"Function f(x)": "x^2", "Lower Limit a": "0", "Upper Limit b": "3"}),
+    ("MAT1512", "Definite Integral", "no antiderivative",
+     {"Function f(x)": "sin(x)/(1 + x^4 + cos(x)^2)", "Lower Limit a": "0", "Upper Limit b": "5"}),
+    ("MAT1512", "Area Under Curve", "typical", {"Function f(x)": "sin(x)", "Lower Limit a": "0", "Upper Limit b": "2*pi"}),
+    ("MAT1512", "Separable First-Order DE", "typical", {"Equation (use y')": "y' = x*y"}),
+    ("MAT1512", "Exponential Growth/Decay", "typical", {"Initial Amount y0": "100", "Rate k": "0.05", "Time t": "10"}),
+    ("MAT1512", "Partial Derivative fx", "typical", {"Function f(x,y)": "x^2*y + sin(y)"}),
+    ("MAT1512", "Partial Derivative fy", "typical", {"Function f(x,y)": "x^2*y + sin(y)"}),
+    ("MAT1512", "Second Order Partials", "typical", {"Function f(x,y)": "x^2*y + sin(y)"}),
+    ("MAT1512", "Second Order Partials", "exponential", {"Function f(x,y)": "exp(x*y)*cos(x + y^2)"}),
+
+    # --- MAT1613 ---
+    ("MAT1613", "L'Hopital's Rule (Limits)", "typical", {"Function f(x)": "(sin(x) - x)/x**3", "Limit Point a": "0"}),
+    ("MAT1613", "Find Critical Points", "polynomial", {"Function f(x)": "x**3 - 3*x**2 + 1", "Search Interval a, b": "-10, 10"}),
+    ("MAT1613", "Find Critical Points", "transcendental, wide",
+     {"Function f(x)": "x*sin(x) + cos(3*x)", "Search Interval a, b": "-50, 50"}),
+    ("MAT1613", "Mean Value Theorem Check", "typical", {"Function f(x)": "x**3 - x", "Interval [a, b]": "-1, 2"}),
+    ("MAT1613", "Integration by Parts", "typical", {"Integrand f(x)": "x * exp(x)", "Parts u": "", "Parts dv": "", "Method": "auto"}),
+    ("MAT1613", "Integration by Parts", "tabular, x^8",
+     {"Integrand f(x)": "x**8 * sin(x)", "Parts u": "", "Parts dv": "", "Method": "tabular"}),
+    ("MAT1613", "Partial Fractions", "typical", {"Rational Function": "1 / (x**2 - 1)"}),
+    ("MAT1613", "Partial Fractions", "degree 8",
+     {"Rational Function": "(x**3 + 1) / ((x - 1)**3 * (x**2 + 1)**2 * (x + 2))"}),
+    ("MAT1613", "Improper Integral Check", "typical", {"Integrand": "1/x**2", "Lower Limit": "1", "Upper Limit": "oo"}),
+    ("MAT1613", "Improper Integral Check", "oscillating", {"Integrand": "sin(x)**2/x**2", "Lower Limit": "0", "Upper Limit": "oo"}),
+    ("MAT1613", "Area Between Curves", "typical", {"Upper Function f(x)": "x", "Lower Function g(x)": "x**2", "Interval a, b": "0, 1"}),
+    ("MAT1613", "Volume of Revolution (Disk)", "typical", {"Radius Function R(x)": "sqrt(x)", "Interval a, b": "0, 1"}),
+    ("MAT1613", "Taylor Series Expansion", "order 5",
+     {"Function f(x)": "sin(x)", "Point a": "0", "Order n": "5", "Error Radius r": "1"}),
+    ("MAT1613", "Taylor Series Expansion", "order 30, composite",
+     {"Function f(x)": "exp(sin(x))/(1 + x**2)", "Point a": "0", "Order n": "30", "Error Radius r": "0.5"}),
+    ("MAT1613", "Limit of Sequence", "typical", {"General Term a_n": "(n + 1)/n"}),
+    ("MAT1613", "Series Convergence Test", "p-series", {"General Term a_n": "1/n**2", "Start n": "1"}),
+    ("MAT1613", "Series Convergence Test", "integral test", {"General Term a_n": "1/(n*log(n)**2)", "Start n": "2"}),
+
+    # --- APM1513 ---
+    ("APM1513", "Direct Method (Ax=b)", "typical", {"Input": "2 1\n1 3\n\n5\n8"}),
+    ("APM1513", "Direct Method (Ax=b)", "50x50",
+     {"Input": "\n".join(" ".join(str((i * j) % 7 + (i == j) * 50) for j in range(50)) for i in range(50))
+      + "\n\n" + "\n".join(str(i) for i in range(50))}),
+    ("APM1513", "Solve LP (glpk)", "typical", {"Input": "40 60\n\n2 1\n1 1\n\n70\n40"}),
+    ("APM1513", "Calculate Determinant", "typical", {"Input": "1 2 3\n4 5 6\n7 8 10"}),
+    ("APM1513", "Find Matrix Inverse", "typical", {"Input": "4 7\n2 6"}),
+    ("APM1513", "Calculate Trace", "typical", {"Input": "1 2\n3 4"}),
+    ("APM1513", "Transpose Matrix", "typical", {"Input": "1 2 3\n4 5 6"}),
+    ("APM1513", "Calculate Eigenvalues", "typical", {"Input": "2 0\n0 3"}),
+    ("APM1513", "Method of Least Squares", "typical", {"Input": "1 1\n1 2\n1 3\n\n1\n2\n2"}),
+
+    # --- APM1514 ---
+    ("APM1514", "🔍 Check Separability", "separable", {"Equation": "dy/dx = x*y"}),
+    ("APM1514", "🔍 Check Separability", "not separable", {"Equation": "y' = x + y"}),
+    ("APM1514", "Malthusian Growth (Find P)", "typical", {"Initial Pop (P0)": "100", "Growth Rate k": "0.02", "Time t": "10"}),
+    ("APM1514", "Malthusian Growth", "typical", {"Initial Pop (P0)": "100", "Target Pop P(t)": "200", "Growth Rate k": "0.02"}),
+    ("APM1514", "Malthusian Growth (Find time t)", "typical",
+     {"Initial Pop (P0)": "100", "Target Pop P(t)": "200", "Growth Rate k": "0.02"}),
+    ("APM1514", "Logistic Growth", "typical", {"Initial Pop (P0)": "100", "Growth Rate a": "0.2", "Interaction b": "0.0001", "Time t": "5"}),
+    ("APM1514", "Newton's Law (Find Temp)", "typical",
+     {"Initial Temp (T0)": "100", "Ambient Temp (Tm)": "20", "Constant k": "0.1", "Time t": "5"}),
+    ("APM1514", "Newton's Law (Find time t)", "typical",
+     {"Initial Temp (T0)": "100", "Ambient Temp (Tm)": "20", "Constant k": "0.1", "Target Temp": "50"}),
+    ("APM1514", "Linear Difference Eq", "typical", {"Initial Value (a0)": "5", "Multiplier r": "2", "Steps n": "4"}),
+    ("APM1514", "Linear Difference Eq", "1000 steps", {"Initial Value (a0)": "5", "Multiplier r": "1.001", "Steps n": "1000"}),
+    ("APM1514", "Savings Account", "typical",
+     {"Initial Deposit (A0)": "1000", "Interest Rate % (q)": "5", "Monthly Deposit (D)": "100", "Months n": "12"}),
+    ("APM1514", "Loan Repayment", "typical",
+     {"Loan Amount (L)": "10000", "Interest Rate % (q)": "1.5", "Monthly Payment (P)": "200", "Months n": "12"}),
+    ("APM1514", "Loan Repayment", "30 years monthly",
+     {"Loan Amount (L)": "250000", "Interest Rate % (q)": "0.5", "Monthly Payment (P)": "1500", "Months n": "360"}),
+    ("APM1514", "Savings Account", "100 years monthly",
+     {"Initial Deposit (A0)": "1000", "Interest Rate % (q)": "0.4", "Monthly Deposit (D)": "100", "Months n": "1200"}),
+]
+
+
+def case_key(case):
+    module, task, name, inputs = case
+    return f"{module} / {task} / {name}"
+
+
+# ================= MEASURING (in the case's own process) =================
+def reset_caches():
+    # Everything a solve could reuse from an earlier one
+    import sympy
+    from solvers.cache import get_cache
+    get_cache().clear()
+    sympy.core.cache.clear_cache()
+    for name, attr in (("solvers.taylor", "_built"), ("solvers.derivatives", "_derivatives")):
+        module = sys.modules.get(name)
+        if module is not None:
+            getattr(module, attr).clear()
+    setEngine = sys.modules.get("setEngine")
+    if setEngine is not None:
+        setEngine.parse_elements.cache_clear()
+        setEngine.parse_pairs.cache_clear()
+
+
+def solve_once(module, task, inputs):
+    import solvers
+    solution = solvers.solve(module, task, inputs)
+    solution.text()
+    return solution
+
+
+def has_solver(module, task):
+    import solvers
+    return task in solvers.load(module).tasks
+
+
+def measure(case, repeat, warm):
+    module, task, name, inputs = case
+    result = {"module": module, "task": task, "case": name}
+    try:
+        # Imports and first-use setup stay out of the timings
+        solution = solve_once(module, task, inputs)
+        if solution.error:
+            result["error"] = solution.error.splitlines()[0]
+            return result
+        # A task without a solver still "solves" (to the placeholder text),
+        # and would otherwise be timed as a very fast pass
+        if not has_solver(module, task) or not (solution.steps or solution.answer):
+            result["error"] = "no solver for this task (placeholder solution)"
+            return result
+        times = []
+        for _ in range(repeat):
+            if not warm:
+                reset_caches()
+            start = time.perf_counter()
+            solve_once(module, task, inputs)
+            times.append(time.perf_counter() - start)
+
+        if not warm:
+            reset_caches()
+        tracemalloc.start()
+        solve_once(module, task, inputs)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+
+    times.sort()
+    result.update({
+        "median": statistics.median(times),
+        "p95": times[max(0, math.ceil(0.95 * len(times)) - 1)],
+        "min": times[0],
+        "peak_bytes": peak,
+        "repeat": repeat,
+    })
+    return result
+
+
+def _case_main(conn, case, repeat, warm):
+    conn.send(measure(case, repeat, warm))
+    conn.close()
+    # Leave at once, even if a solve left a SymPy thread running
+    os._exit(0)
+
+
+def run_case(case, repeat, warm, timeout=caseTimeout):
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_case_main, args=(sender, case, repeat, warm), daemon=True)
+    process.start()
+    sender.close()
+    try:
+        if receiver.poll(timeout):
+            return receiver.recv()
+        module, task, name, inputs = case
+        return {"module": module, "task": task, "case": name, "error": f"stopped after {timeout} s"}
+    except EOFError:
+        module, task, name, inputs = case
+        return {"module": module, "task": task, "case": name, "error": "the benchmark process died"}
+    finally:
+        process.kill()
+        process.join()
+        receiver.close()
+
+
+# ================= REPORTING =================
+def format_seconds(value):
+    if value < 1e-3:
+        return f"{value * 1e6:.0f} us"
+    if value < 1:
+        return f"{value * 1e3:.1f} ms"
+    return f"{value:.2f} s"
+
+
+def format_bytes(value):
+    for unit in ("B", "KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def report_line(key, result, baseline=None):
+    if "error" in result:
+        return f"{key:<72} ERROR {result['error']}"
+    line = (f"{key[:72]:<72} {format_seconds(result['median']):>10} {format_seconds(result['p95']):>10} "
+            f"{format_bytes(result['peak_bytes']):>10}")
+    old = (baseline or {}).get(key)
+    if old and "median" in old and old["median"] > 0:
+        ratio = result["median"] / old["median"]
+        mark = "  slower" if ratio >= changeThreshold else ("  faster" if ratio <= 1 / changeThreshold else "")
+        line += f" {ratio:>7.2f}x{mark}"
+    return line
+
+
+def uncovered_tasks(selected):
+    # Registered tasks of the benchmarked modules that have no case
+    import solvers
+    covered = {(module, task) for module, task, name, inputs in selected}
+    missing = []
+    for module in sorted({case[0] for case in selected}):
+        missing += [f"{module} / {task}" for task in solvers.tasks(module) if (module, task) not in covered]
+    return missing
+
+
+def commit_id():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every solver task (median/p95 latency, peak memory).")
+    parser.add_argument("-k", "--filter", default="", help="only cases whose 'module / task / case' contains this text")
+    parser.add_argument("-r", "--repeat", type=int, default=defaultRepeat, help=f"timed solves per case (default: {defaultRepeat})")
+    parser.add_argument("--warm", action="store_true", help="keep caches between repeats")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="results file from an earlier run to compare medians with")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    selected = [case for case in cases if args.filter.lower() in case_key(case).lower()]
+    if args.list:
+        print("\n".join(case_key(case) for case in selected))
+        return 0
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)["results"]
+
+    # Cases never touch the user's result cache
+    cacheDir = tempfile.mkdtemp(prefix="pocket-bench-")
+    os.environ["POCKET_SUITE_CACHE"] = os.path.join(cacheDir, "results.sqlite3")
+    results = {}
+    print(f"{'Case':<72} {'Median':>10} {'p95':>10} {'Peak mem':>10}" + ("   vs base" if baseline else ""))
+    try:
+        for case in selected:
+            key = case_key(case)
+            results[key] = run_case(case, max(1, args.repeat), args.warm)
+            print(report_line(key, results[key], baseline), flush=True)
+    finally:
+        shutil.rmtree(cacheDir, ignore_errors=True)
+
+    missing = uncovered_tasks(selected) if not args.filter else []
+    if missing:
+        print("\nTasks without a benchmark case:\n   " + "\n   ".join(missing))
+    if args.json:
+        import sympy
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump({"commit": commit_id(), "python": platform.python_version(), "sympy": sympy.__version__,
+                       "repeat": args.repeat, "warm": args.warm, "results": results}, handle, indent=1)
+    return 1 if any("error" in r for r in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+#+++++++++++++++ Propositional Logic Engine +++++++++++++++++++
+# Parses formulas written with p, q, r, &, |, ~, ->, <-> into a small AST and
+# compiles them once into a postfix program. The program is run over bitsets:
+# bit r of every value is the truth value in row r of the truth table, so all
+# 2^n rows are evaluated with a handful of big-integer operations.
+
+# Operator precedence, tightest first: ~, &, |, ->, <->
+# "->" is right associative (p -> q -> r == p -> (q -> r)), the rest are left associative.
+
+class LogicSyntaxError(ValueError):
+    pass
+
+
+def tokenize(text):
+    # Splits the formula into variable names, operators and brackets
+    tokens = []
+    i = 0
+    while i < len(text):
+        c = text[i]
+        if c.isspace():
+            i += 1
+        elif c.isalpha() or c == "_":
+            start = i
+            while i < len(text) and (text[i].isalnum() or text[i] == "_"):
+                i += 1
+            tokens.append(("var", text[start:i]))
+        elif text.startswith("<->", i):
+            tokens.append(("op", "<->"))
+            i += 3
+        elif text.startswith("->", i):
+            tokens.append(("op", "->"))
+            i += 2
+        elif c in "~!":
+            tokens.append(("op", "~"))
+            i += 1
+        elif c in "&|()":
+            tokens.append(("op", c))
+            i += 1
+        elif c in "01":
+            tokens.append(("const", c == "1"))
+            i += 1
+        else:
+            raise LogicSyntaxError(f"Unexpected symbol '{c}' at position {i + 1}")
+    return tokens
+
+
+# Binary operators: symbol -> (precedence, right associative, node kind)
+_BINARY = {
+    "&": (4, False, "and"),
+    "|": (3, False, "or"),
+    "->": (2, True, "imp"),
+    "<->": (1, False, "iff"),
+}
+
+
+class _Parser:
+    # Precedence climbing with explicit operand and operator stacks, producing
+    # tuples:
+    #   ("var", name), ("const", bool), ("not", a), ("and"/"or"/"imp"/"iff", a, b)
+    # Nothing recurses per operator or bracket, so formulas with thousands of
+    # terms (and the deep trees they make) parse fine.
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.operands = []
+        self.operators = []  # "~", "(" or a binary symbol
+
+    def reduce(self):
+        op = self.operators.pop()
+        if op == "~":
+            self.operands.append(("not", self.operands.pop()))
+        else:
+            b = self.operands.pop()
+            a = self.operands.pop()
+            self.operands.append((_BINARY[op][2], a, b))
+
+    def binds_before(self, top, op):
+        # True if the pending operator `top` must be applied before `op` is pushed
+        if top == "(":
+            return False
+        if top == "~":
+            return True
+        precedence, right, _ = _BINARY[op]
+        top_precedence = _BINARY[top][0]
+        return top_precedence > precedence or (top_precedence == precedence and not right)
+
+    def unexpected(self, value):
+        if "(" in self.operators:
+            return LogicSyntaxError("Missing closing bracket ')'")
+        return LogicSyntaxError(f"Unexpected '{value}' after complete expression")
+
+    def parse(self):
+        if not self.tokens:
+            raise LogicSyntaxError("Empty expression")
+        expect_operand = True
+        for kind, value in self.tokens:
+            if expect_operand:
+                if kind == "var" or kind == "const":
+                    self.operands.append((kind, value))
+                    expect_operand = False
+                elif value == "~" or value == "(":
+                    self.operators.append(value)
+                else:
+                    raise LogicSyntaxError(f"Unexpected '{value}'")
+            elif value in _BINARY:
+                while self.operators and self.binds_before(self.operators[-1], value):
+                    self.reduce()
+                self.operators.append(value)
+                expect_operand = True
+            elif value == ")":
+                while self.operators and self.operators[-1] != "(":
+                    self.reduce()
+                if not self.operators:
+                    raise LogicSyntaxError("Unexpected ')' after complete expression")
+                self.operators.pop()
+            else:
+                raise self.unexpected(value)
+
+        if expect_operand:
+            raise LogicSyntaxError("Expression ends unexpectedly")
+        while self.operators:
+            if self.operators[-1] == "(":
+                raise LogicSyntaxError("Missing closing bracket ')'")
+            self.reduce()
+        return self.operands.pop()
+
+
+def parse(text):
+    return _Parser(tokenize(text)).parse()
+
+
+def variables_of(node, found=None):
+    # Collects variable names in the AST
+    if found is None:
+        found = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node[0] == "var":
+            found.add(node[1])
+        elif node[0] != "const":
+            stack.extend(node[1:])
+    return found
+
+
+def to_text(node):
+    # Renders an AST back into fully bracketed infix form. The stack holds
+    # nodes still to render and literal pieces, pushed in reverse order.
+    symbols = {"and": " & ", "or": " | ", "imp": " -> ", "iff": " <-> "}
+    pieces = []
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            pieces.append(item)
+        elif item[0] == "var":
+            pieces.append(item[1])
+        elif item[0] == "const":
+            pieces.append("1" if item[1] else "0")
+        elif item[0] == "not":
+            stack += [item[1], "~"]
+        else:
+            stack += [")", item[2], symbols[item[0]], item[1], "("]
+    return "".join(pieces)
+
+
+def variable_mask(index, n):
+    # Bitset of the rows where variable `index` (0 = leftmost column) is True.
+    # Rows follow itertools.product([True, False], repeat=n): the leftmost
+    # variable is True for the first half of the table, and so on.
+    rows = 1 << n
+    block = 1 << (n - 1 - index)  # run length of equal values in this column
+    if rows < 8:
+        mask = 0
+        for r in range(rows):
+            if not (r // block) % 2:
+                mask |= 1 << r
+        return mask
+    if block >= 8:
+        pattern = b"\xff" * (block // 8) + b"\x00" * (block // 8)
+    else:
+        byte = 0
+        for bit in range(8):
+            if not (bit // block) % 2:
+                byte |= 1 << bit
+        pattern = bytes([byte])
+    return int.from_bytes(pattern * (rows // 8 // len(pattern)), "little")
+
+
+def _natural_key(name):
+    # Orders x2 before x10 so numbered variables keep their table columns in order
+    head = name.rstrip("0123456789")
+    tail = name[len(head):]
+    return (head, int(tail) if tail else -1)
+
+
+class CompiledFormula:
+    def __init__(self, text):
+        self.text = text
+        self.tree = parse(text)
+        self.variables = sorted(variables_of(self.tree), key=_natural_key)
+        self.program = []
+        self._compile(self.tree)
+        self._bits = None
+
+    def _compile(self, node):
+        # Post-order walk: operands first, then the operator. An operator is
+        # pushed back as ("op", kind) below its children so it is emitted
+        # after them.
+        index = {name: i for i, name in enumerate(self.variables)}
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            kind = node[0]
+            if kind == "var":
+                self.program.append(("var", index[node[1]]))
+            elif kind == "const":
+                self.program.append(("const", node[1]))
+            elif kind == "op":
+                self.program.append((node[1], None))
+            else:
+                stack.append(("op", kind))
+                stack.extend(reversed(node[1:]))
+
+    @property
+    def row_count(self):
+        return 1 << len(self.variables)
+
+    def evaluate(self):
+        # Runs the postfix program once over all rows; cached afterwards
+        if self._bits is not None:
+            return self._bits
+
+        n = len(self.variables)
+        full = (1 << self.row_count) - 1
+        masks = {}
+        stack = []
+        for op, arg in self.program:
+            if op == "var":
+                if arg not in masks:
+                    masks[arg] = variable_mask(arg, n)
+                stack.append(masks[arg])
+            elif op == "const":
+                stack.append(full if arg else 0)
+            elif op == "not":
+                stack.append(full ^ stack.pop())
+            else:
+                b = stack.pop()
+                a = stack.pop()
+                if op == "and":
+                    stack.append(a & b)
+                elif op == "or":
+                    stack.append(a | b)
+                elif op == "imp":
+                    stack.append((full ^ a) | b)
+                else:
+                    stack.append(full ^ (a ^ b))
+
+        self._bits = stack.pop()
+        return self._bits
+
+    def row(self, index):
+        # Returns (assignment values, result) for one row of the table
+        n = len(self.variables)
+        values = tuple(not (index >> (n - 1 - i)) & 1 for i in range(n))
+        return values, bool((self.evaluate() >> index) & 1)
+
+    def true_count(self):
+        return self.evaluate().bit_count()
+
+    def classify(self):
+        bits = self.evaluate()
+        if bits == (1 << self.row_count) - 1:
+            return "TAUTOLOGY"
+        if bits == 0:
+            return "CONTRADICTION"
+        return "CONTINGENCY"
+
+    def first_row_with(self, value):
+        # Index of the first row whose result equals `value`, or None
+        bits = self.evaluate()
+        if not value:
+            bits = ((1 << self.row_count) - 1) ^ bits
+        if bits == 0:
+            return None
+        return (bits & -bits).bit_length() - 1
+
+
+def compile_formula(text):
+    return CompiledFormula(text)
+
+
+def iter_rows(formula, start=0, stop=None):
+    # Yields (assignment values, result) lazily for rows start..stop-1
+    n = len(formula.variables)
+    if stop is None or stop > formula.row_count:
+        stop = formula.row_count
+    bits = formula.evaluate() >> start
+    for index in range(start, stop):
+        values = tuple(not (index >> (n - 1 - i)) & 1 for i in range(n))
+        yield values, bool(bits & 1)
+        bits >>= 1
+
+
+def table_header(formula):
+    header = " | ".join(formula.variables) + " || Result\n"
+    return header + "-" * len(header) + "\n"
+
+
+def table_lines(formula, start=0, stop=None):
+    # Text rows for the given slice of the truth table, one string per row
+    for values, result in iter_rows(formula, start, stop):
+        row_str = " | ".join("T" if v else "F" for v in values)
+        yield f"{row_str} || {'T' if result else 'F'}\n"
+
+
+def summary_lines(formula):
+    # Classification, row count and one witness for each outcome, without the table
+    vars = formula.variables
+    total = formula.row_count
+    verdict = formula.classify()
+    if verdict == "TAUTOLOGY":
+        yield "Conclusion: TAUTOLOGY (Always True)\n"
+    elif verdict == "CONTRADICTION":
+        yield "Conclusion: CONTRADICTION (Always False)\n"
+    else:
+        yield "Conclusion: CONTINGENCY (Sometimes True/False)\n"
+    yield f"  True in {formula.true_count()} of {total} rows\n"
+    for label, value in (("True", True), ("False", False)):
+        index = formula.first_row_with(value)
+        if index is not None:
+            combo, _ = formula.row(index)
+            witness = ", ".join(f"{v}={'T' if b else 'F'}" for v, b in zip(vars, combo)) or "(no variables)"
+            yield f"  {label} when: {witness}\n"
@@ -1,7 +1,12 @@
+import time
+startupClock = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk 
 from tkinter import messagebox
-import sys # Importing sys, though not strictly required, is good practice for main entry files
+import sys # Command line flags: --no-prewarm, --startup-time
+import importlib
+import threading
 
 #+++++++++++++++ Designing the windows+++++++++++++++++++
 backgroundColour = '#282c34'
@@ -10,18 +15,41 @@ accentColour = '#61afef'
 buttonBg = '#3c424a'
 buttonHover = '#4a5260'
 
-# Attempt to import all module windows needed by topicAction
-try:
-    from APM1513 import APM1513Window
-    from APM1514 import APM1514Window
-    from MAT1503 import MAT1503Window
-    from MAT1512 import MAT1512Window
-    from MAT1613 import MAT1613Window
-    from COS1501 import COS1501Window
-except ImportError as e:
-    # This block handles the case where not all module files have been created yet,
-    # preventing a crash at startup.
-    print(f"Warning: Could not import module classes. Missing file? {e}")
+#+++++++++++++++ Module Registry +++++++++++++++++++
+# Module code -> (file, window class). Nothing here is imported until a topic
+# of that module is first opened, so SymPy and the solver engines stay out of
+# the main menu's start up.
+moduleWindows = {
+    "APM1513": ("APM1513", "APM1513Window"),   # Linear Algebra/Octave Code Generation
+    "APM1514": ("APM1514", "APM1514Window"),   # Differential Equations/Step-by-Step Solvers
+    "MAT1503": ("MAT1503", "MAT1503Window"),   # Linear Algebra/Cramer's Rule/Vectors
+    "MAT1512": ("MAT1512", "MAT1512Window"),   # Calculus A/Derivatives/Integrals
+    "MAT1613": ("MAT1613", "MAT1613Window"),   # Calculus B/Advanced Integration/Series
+    "COS1501": ("COS1501", "COS1501Window"),   # Discrete Math/Logic/Sets
+}
+
+# The main menu should be on screen within this many seconds
+startupTarget = 0.5
+
+def loadWindowClass(code):
+    # Imports the module's window file on first use (later calls hit sys.modules)
+    fileName, className = moduleWindows[code]
+    return getattr(importlib.import_module(fileName), className)
+
+def prewarmSolvers():
+    # Runs on a background thread once the menu is showing: imports the window
+    # files and the in-process solvers so the first topic window opens quickly.
+    # SymPy modules are solved in the worker pool, which imports SymPy itself.
+    # Only plain Python modules are imported here; no Tk calls off the main thread.
+    try:
+        import solvers
+        from solverPool import pooledModules
+        for code, (fileName, className) in moduleWindows.items():
+            importlib.import_module(fileName)
+            if code not in pooledModules:
+                solvers.load(code)
+    except ImportError as e:
+        print(f"Warning: Could not pre-load solvers. Missing package? {e}")
 
 class moduleWindow(tk.Toplevel):
     def __init__(self, parent, moduleCode, moduleName, moduleTopic):
@@ -105,35 +133,18 @@ class moduleWindow(tk.Toplevel):
 
     def topicAction(self, chapterName):
         # This function launches the correct module window class
-        
-        if self.moduleCode == "APM1513":
-            # APM1513 is Linear Algebra/Octave Code Generation
-            APM1513Window(self, chapterName)
-            
-        elif self.moduleCode == "APM1514":
-            # APM1514 is Differential Equations/Step-by-Step Solvers
-            APM1514Window(self, chapterName)
-            
-        elif self.moduleCode == "MAT1503":
-            # MAT1503 is Linear Algebra/Cramer's Rule/Vectors
-            MAT1503Window(self, chapterName)
-
-        elif self.moduleCode == "MAT1512":
-            # MAT1512 is Calculus A/Derivatives/Integrals
-            MAT1512Window(self, chapterName)
-        
-        elif self.moduleCode == "MAT1613":
-            # MAT1613 is Calculus B/Advanced Integration/Series
-            MAT1613Window(self, chapterName)
-
-        elif self.moduleCode == "COS1501":
-            # COS1501 is Discrete Math/Logic/Sets
-            COS1501Window(self, chapterName)
-            
-        else:
+        if self.moduleCode not in moduleWindows:
             # Fallback for modules not yet implemented
             messagebox.showinfo("Topic Selected",
                                 f"You selected: {chapterName}\n\nModule content coming soon!")
+            return
+
+        try:
+            windowClass = loadWindowClass(self.moduleCode)
+        except ImportError as e:
+            messagebox.showerror("Module Error", f"Could not load {self.moduleCode}.\nMissing file or package? {e}")
+            return
+        windowClass(self, chapterName)
 
     def on_close(self, parent):
         # Re-enable the main window
@@ -255,7 +266,20 @@ class pocketStudentSuite(tk.Tk):
     def openModuleWindow(self, code, name, chapters):
         moduleWindow(self, code, name, chapters)
 
+    def onStartupIdle(self):
+        # Called once the menu has been drawn for the first time
+        elapsed = time.perf_counter() - startupClock
+        if "--startup-time" in sys.argv or elapsed > startupTarget:
+            print(f"Main menu ready in {elapsed * 1000:.0f} ms (target {startupTarget * 1000:.0f} ms)")
+
+        if "--no-prewarm" not in sys.argv:
+            threading.Thread(target=prewarmSolvers, name="prewarm", daemon=True).start()
+            # Worker processes start importing SymPy straight away
+            from solverPool import get_pool
+            get_pool().warm()
+
 
 if __name__ == "__main__":
     app = pocketStudentSuite()                     
+    app.after_idle(app.onStartupIdle)
     app.mainloop()
\ No newline at end of file
@@ -0,0 +1,664 @@
+import math
+import operator
+import re
+from fractions import Fraction
+
+#+++++++++++++++ Matrix Engine +++++++++++++++++++
+# Dense linear algebra for the MAT1503 tasks, on plain lists of rows.
+# Entries are Fractions in exact mode (what students expect to see: 2/3, not
+# 0.67) and floats otherwise. Small systems are solved here in pure Python so
+# every row operation can be shown; large float systems go to NumPy (LAPACK's
+# LU with partial pivoting) when it is installed.
+# Exact determinants use fraction-free (Bareiss) elimination, or for large
+# integer matrices a multi-modular NumPy routine that avoids big-int work.
+#
+#   parse_matrix("2 1 -1; -3 -1 2; -2 1 2")   rows split on ";" or newlines,
+#                                              entries on spaces or commas;
+#                                              1/3, 0.25 and -2 stay exact
+
+# Largest system solved with Fractions when the mode is "auto"
+exactLimit = 12
+# Float systems at least this large go to NumPy
+numpyLimit = 30
+# Exact determinants at least this large use modular_determinant
+modularFrom = 40
+# Columns of B multiplied against every row of A at a time
+blockSize = 64
+
+
+class MatrixSyntaxError(ValueError):
+    pass
+
+
+class SingularMatrixError(ArithmeticError):
+    # Elimination found no pivot in this column
+    def __init__(self, column):
+        super().__init__(f"no pivot in column {column + 1}")
+        self.column = column
+
+
+# ================= PARSING & FORMATTING =================
+_ROWS = re.compile(r"[;\n]")
+_ENTRIES = re.compile(r"[\s,]+")
+
+
+def parse_number(text):
+    text = text.strip()
+    try:
+        # Integers, most entries, skip Fraction's string parser
+        return Fraction(int(text))
+    except ValueError:
+        pass
+    try:
+        return Fraction(text)
+    except (ValueError, ZeroDivisionError):
+        raise MatrixSyntaxError(f"'{text}' is not a number (use e.g. 3, -1/2 or 0.25)")
+
+
+def parse_matrix(text):
+    rows = []
+    for line in _ROWS.split(text.strip().strip("[]")):
+        line = line.strip().strip("[]")
+        if line:
+            rows.append([parse_number(item) for item in _ENTRIES.split(line) if item])
+    if not rows:
+        raise MatrixSyntaxError("The matrix is empty.")
+    if any(len(row) != len(rows[0]) for row in rows):
+        raise MatrixSyntaxError("Every row must have the same number of entries.")
+    return rows
+
+
+def parse_vector(text):
+    # A vector may be typed as one row or one column
+    return [value for row in parse_matrix(text) for value in row]
+
+
+def to_float(rows):
+    return [[float(v) for v in row] for row in rows]
+
+
+def fmt(value):
+    if isinstance(value, Fraction):
+        return str(value)
+    if isinstance(value, float):
+        return "0" if value == 0 else f"{value:.6g}"
+    return str(value)
+
+
+def format_matrix(rows, indent="   ", split=None):
+    # Aligned rows in brackets; split draws a bar before that column ([A | b])
+    cells = [[fmt(v) for v in row] for row in rows]
+    widths = [max(len(row[j]) for row in cells) for j in range(len(cells[0]))] if cells else []
+    lines = []
+    for row in cells:
+        items = [cell.rjust(width) for cell, width in zip(row, widths)]
+        if split is not None:
+            items.insert(split, "|")
+        lines.append(f"{indent}[ " + "  ".join(items) + " ]")
+    return "\n".join(lines) + "\n"
+
+
+def identity(n, exact=True):
+    one, zero = (Fraction(1), Fraction(0)) if exact else (1.0, 0.0)
+    return [[one if i == j else zero for j in range(n)] for i in range(n)]
+
+
+def tolerance(rows):
+    # Float entries below this count as zero during elimination
+    largest = max((abs(v) for row in rows for v in row), default=0.0)
+    return 1e-12 * max(1.0, largest) * max(1, len(rows))
+
+
+# ================= LU DECOMPOSITION =================
+class LUResult:
+    def __init__(self, perm, lower, upper, swaps):
+        self.perm = perm      # row i of U came from row perm[i] of A
+        self.lower = lower
+        self.upper = upper    # with any extra (augmented) columns still attached
+        self.swaps = swaps
+
+
+def lu_decompose(A, extra=None, exact=True, steps=None):
+    # PA = LU with partial pivoting. extra columns (b of Ax = b) are carried
+    # through the same row operations, which is forward substitution.
+    # steps, if a list, receives the row operations and matrices as text.
+    n = len(A)
+    zero = Fraction(0) if exact else 0.0
+    width = n + (len(extra[0]) if extra else 0)
+    U = [list(A[i]) + (list(extra[i]) if extra else []) for i in range(n)]
+    L = [[zero] * n for _ in range(n)]
+    perm = list(range(n))
+    swaps = 0
+    tol = 0 if exact else tolerance(A)
+
+    for k in range(n):
+        # Exact: the first nonzero pivot, as done by hand; floats: the
+        # largest, to keep rounding error down
+        if exact:
+            p = next((i for i in range(k, n) if U[i][k] != 0), None)
+        else:
+            p = max(range(k, n), key=lambda i: abs(U[i][k]))
+            if abs(U[p][k]) <= tol:
+                p = None
+        if p is None:
+            raise SingularMatrixError(k)
+        if p != k:
+            U[k], U[p] = U[p], U[k]
+            L[k], L[p] = L[p], L[k]
+            perm[k], perm[p] = perm[p], perm[k]
+            swaps += 1
+            if steps is not None:
+                steps.append(f"   R{k + 1} <-> R{p + 1}\n")
+
+        pivot_row = U[k]
+        pivot = pivot_row[k]
+        changed = p != k
+        for i in range(k + 1, n):
+            row = U[i]
+            if row[k] == 0:
+                continue
+            changed = True
+            m = row[k] / pivot
+            L[i][k] = m
+            for j in range(k, width):
+                row[j] -= m * pivot_row[j]
+            if not exact:
+                row[k] = 0.0
+            if steps is not None:
+                steps.append(f"   R{i + 1} = R{i + 1} - ({fmt(m)}) R{k + 1}\n")
+        if steps is not None and changed:
+            steps.append(format_matrix(U, split=n if extra else None) + "\n")
+
+    for i in range(n):
+        L[i][i] = Fraction(1) if exact else 1.0
+    return LUResult(perm, L, U, swaps)
+
+
+def back_substitute(U, n, steps=None):
+    # Solves the upper triangular system held in the first n columns of the
+    # augmented rows U (right-hand side in column n)
+    x = [None] * n
+    for i in range(n - 1, -1, -1):
+        row = U[i]
+        total = row[n] - sum(row[j] * x[j] for j in range(i + 1, n))
+        x[i] = total / row[i]
+        if steps is not None:
+            known = "".join(f" - ({fmt(row[j])})({fmt(x[j])})" for j in range(i + 1, n) if row[j] != 0)
+            steps.append(f"   x{i + 1} = ({fmt(row[n])}{known}) / {fmt(row[i])} = {fmt(x[i])}\n")
+    return x
+
+
+def integer_solve(A, b):
+    # Exact solution of a nonsingular Ax = b without Fraction arithmetic in
+    # the O(n^3) part: rows of [A | b] are scaled to integers, eliminated by
+    # cross-multiplication (pivot * row - entry * pivot row) and divided by
+    # their gcd after every step, which keeps the integers as small as the
+    # problem allows. Only back substitution builds Fractions. Raises
+    # SingularMatrixError like lu_decompose.
+    n = len(A)
+    rows, _ = _integer_rows([list(row) + [v] for row, v in zip(A, b)])
+    for k in range(n):
+        p = next((i for i in range(k, n) if rows[i][k] != 0), None)
+        if p is None:
+            raise SingularMatrixError(k)
+        rows[k], rows[p] = rows[p], rows[k]
+        pivot_row = rows[k]
+        pivot = pivot_row[k]
+        for i in range(k + 1, n):
+            row = rows[i]
+            first = row[k]
+            if first == 0:
+                continue
+            # Columns up to k are zero from here on
+            tail = [pivot * a - first * c for a, c in zip(row[k + 1:], pivot_row[k + 1:])]
+            g = math.gcd(*tail)
+            rows[i] = [0] * (k + 1) + ([v // g for v in tail] if g > 1 else tail)
+
+    # Back substitution over one common denominator: x_j = X[j] / D
+    X, D = [0] * n, 1
+    for i in range(n - 1, -1, -1):
+        row = rows[i]
+        pivot = row[i]
+        X[i] = row[n] * D - sum(map(operator.mul, row[i + 1:n], X[i + 1:]))
+        if pivot < 0:
+            pivot = -pivot
+            X[i] = -X[i]
+        for j in range(i + 1, n):
+            X[j] *= pivot
+        D *= pivot
+        g = math.gcd(D, *X[i:])
+        if g > 1:
+            X[i:] = [v // g for v in X[i:]]
+            D //= g
+    return [Fraction(v, D) for v in X]
+
+
+# ================= SINGULAR SYSTEMS =================
+def rref(M, columns, exact=True, steps=None):
+    # Reduced row echelon form of M (in place), pivoting in the first
+    # `columns` columns only. Returns the pivot columns.
+    rows = len(M)
+    width = len(M[0])
+    tol = 0 if exact else tolerance(M)
+    pivots = []
+    r = 0
+    for c in range(columns):
+        if r == rows:
+            break
+        if exact:
+            p = next((i for i in range(r, rows) if M[i][c] != 0), None)
+        else:
+            p = max(range(r, rows), key=lambda i: abs(M[i][c]))
+            if abs(M[p][c]) <= tol:
+                p = None
+        if p is None:
+            continue
+        if p != r:
+            M[r], M[p] = M[p], M[r]
+            if steps is not None:
+                steps.append(f"   R{r + 1} <-> R{p + 1}\n")
+        pivot = M[r][c]
+        if pivot != 1:
+            M[r] = [v / pivot for v in M[r]]
+            if steps is not None:
+                steps.append(f"   R{r + 1} = R{r + 1} / ({fmt(pivot)})\n")
+        for i in range(rows):
+            if i != r and M[i][c] != 0:
+                m = M[i][c]
+                M[i] = [a - m * b for a, b in zip(M[i], M[r])]
+                if not exact:
+                    M[i][c] = 0.0
+                if steps is not None:
+                    steps.append(f"   R{i + 1} = R{i + 1} - ({fmt(m)}) R{r + 1}\n")
+        pivots.append(c)
+        r += 1
+    if not exact:
+        for row in M:
+            for j in range(width):
+                if abs(row[j]) <= tol:
+                    row[j] = 0.0
+    return pivots
+
+
+class LinearSolution:
+    def __init__(self, kind):
+        self.kind = kind          # "unique", "infinite" or "none"
+        self.x = None             # the solution (unique) or a particular one (infinite)
+        self.free = []            # free variable indices
+        self.basis = []           # null space vectors, one per free variable
+        self.conflict = None      # index of a row reading 0 = c (no solution)
+
+
+def classify(A, b, exact=True, steps=None):
+    # Any system, square or not: row reduce [A | b] and read off the answer
+    n = len(A[0])
+    zero = Fraction(0) if exact else 0.0
+    one = Fraction(1) if exact else 1.0
+    M = [list(row) + [value] for row, value in zip(A, b)]
+    pivots = rref(M, n, exact, steps)
+    if steps is not None:
+        steps.append(format_matrix(M, split=n) + "\n")
+
+    for i in range(len(pivots), len(M)):
+        if M[i][n] != 0:
+            result = LinearSolution("none")
+            result.conflict = i
+            return result
+
+    if len(pivots) == n:
+        result = LinearSolution("unique")
+        result.x = [M[i][n] for i in range(n)]
+        return result
+
+    result = LinearSolution("infinite")
+    result.free = [j for j in range(n) if j not in pivots]
+    x = [zero] * n
+    for i, c in enumerate(pivots):
+        x[c] = M[i][n]
+    result.x = x
+    for f in result.free:
+        v = [zero] * n
+        v[f] = one
+        for i, c in enumerate(pivots):
+            v[c] = -M[i][f]
+        result.basis.append(v)
+    return result
+
+
+# ================= DETERMINANTS =================
+def exact_determinant(A, steps=None):
+    # det of a Fraction matrix. Each row is scaled to integers by the lcm of
+    # its denominators (det A = det M / product of the scales), then large
+    # matrices go to the multi-modular NumPy routine and the rest, and any
+    # determinant whose steps are shown, to Bareiss elimination.
+    M, scales = [], []
+    for row in A:
+        lcm = 1
+        for v in row:
+            lcm = lcm * v.denominator // math.gcd(lcm, v.denominator)
+        scales.append(lcm)
+        M.append([int(v * lcm) for v in row])
+    scale = math.prod(scales)
+
+    if steps is not None:
+        steps.extend(f"   R{i + 1} * {lcm}\n" for i, lcm in enumerate(scales) if lcm != 1)
+    value = modular_determinant(M) if steps is None and len(M) >= modularFrom else None
+    if value is None:
+        value = bareiss_determinant(M, steps)
+    if steps is not None and scale != 1:
+        steps.append(f"   Undo the row scaling: det = {value} / {scale}\n")
+    return Fraction(value, scale)
+
+
+def bareiss_determinant(M, steps=None):
+    # Fraction-free elimination on an integer matrix: every intermediate entry
+    # is itself a minor of M, so the division by the previous pivot is exact
+    # and entries never grow beyond the size of the determinant
+    n = len(M)
+    M = [list(row) for row in M]
+    sign = 1
+    previous = 1
+    for k in range(n - 1):
+        # Rows keep only their columns from k on, so M[i][0] is column k
+        if M[k][0] == 0:
+            p = next((i for i in range(k + 1, n) if M[i][0] != 0), None)
+            if p is None:
+                return 0
+            M[k], M[p] = M[p], M[k]
+            sign = -sign
+            if steps is not None:
+                steps.append(f"   R{k + 1} <-> R{p + 1} (the sign changes)\n")
+        pivot_row = M[k]
+        pivot = pivot_row[0]
+        for i in range(k + 1, n):
+            row = M[i]
+            first = row[0]
+            M[i] = [(pivot * a - first * b) // previous for a, b in zip(row[1:], pivot_row[1:])]
+        previous = pivot
+        if steps is not None:
+            steps.append(f"   Step {k + 1}: pivot {pivot}; the rows below become\n"
+                         + format_matrix(M[k + 1:], indent="      ") + "\n")
+    return sign * M[n - 1][0]
+
+
+def _is_prime(m):
+    # Deterministic Miller-Rabin, exact for m < 3,215,031,751
+    for q in (2, 3, 5, 7):
+        if m % q == 0:
+            return m == q
+    d, s = m - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in (2, 3, 5, 7):
+        x = pow(a, d, m)
+        if x in (1, m - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % m
+            if x == m - 1:
+                break
+        else:
+            return False
+    return True
+
+
+_primes = []
+
+
+def _prime(i):
+    # i-th prime below 2^31 counting down, so products of two residues fit in int64
+    while len(_primes) <= i:
+        c = (_primes[-1] if _primes else 2 ** 31 + 1) - 2
+        while not _is_prime(c):
+            c -= 2
+        _primes.append(c)
+    return _primes[i]
+
+
+def _determinant_mod(a, p, np):
+    n = len(a)
+    value = 1
+    for k in range(n):
+        nonzero = np.flatnonzero(a[k:, k])
+        if not len(nonzero):
+            return 0
+        r = k + int(nonzero[0])
+        if r != k:
+            a[[k, r]] = a[[r, k]]
+            value = p - value
+        pivot = int(a[k, k])
+        value = value * pivot % p
+        if k < n - 1:
+            row = a[k, k + 1:] * pow(pivot, -1, p) % p
+            a[k + 1:, k + 1:] = (a[k + 1:, k + 1:] - np.outer(a[k + 1:, k], row)) % p
+    return value
+
+
+def modular_determinant(M):
+    # det of an integer matrix from its residues modulo enough word-sized
+    # primes to cover twice the Hadamard bound, joined by the Chinese
+    # remainder theorem. Each residue is a vectorised O(n^3) elimination,
+    # so big integers are only touched n times instead of n^3 times.
+    # None when NumPy is missing or entries do not fit in int64.
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    if any(abs(v) >= 2 ** 62 for row in M for v in row):
+        return None
+    bound = 1
+    for row in M:
+        bound *= math.isqrt(sum(v * v for v in row)) + 1
+    base = np.array(M, dtype=np.int64)
+    value, modulus, i = 0, 1, 0
+    while modulus <= 2 * bound:
+        p = _prime(i)
+        i += 1
+        residue = _determinant_mod(base % p, p, np)
+        value += modulus * ((residue - value) * pow(modulus, -1, p) % p)
+        modulus *= p
+    return value - modulus if value > modulus // 2 else value
+
+
+def float_determinant(A):
+    # Product of the pivots of PA = LU, with one sign change per row swap.
+    # Large matrices go through NumPy's slogdet, and a determinant beyond
+    # the float range comes back as +-inf (see float_log_determinant).
+    n = len(A)
+    if n >= numpyLimit:
+        sign, log = float_log_determinant(A)
+        try:
+            return sign * 10.0 ** log if sign else 0.0
+        except OverflowError:
+            return sign * math.inf
+    try:
+        lu = lu_decompose(A, exact=False)
+    except SingularMatrixError:
+        return 0.0
+    value = -1.0 if lu.swaps % 2 else 1.0
+    for i in range(n):
+        value *= lu.upper[i][i]
+    return value
+
+
+def float_log_determinant(A):
+    # (sign, log10 |det A|), which stays finite when det A overflows
+    try:
+        import numpy as np
+        sign, log = np.linalg.slogdet(np.array(A, dtype=float))
+        return int(sign), float(log) / math.log(10) if sign else -math.inf
+    except ImportError:
+        pass
+    try:
+        lu = lu_decompose(A, exact=False)
+    except SingularMatrixError:
+        return 0, -math.inf
+    sign = -1 if lu.swaps % 2 else 1
+    log = 0.0
+    for i in range(len(A)):
+        sign *= 1 if lu.upper[i][i] > 0 else -1
+        log += math.log10(abs(lu.upper[i][i]))
+    return sign, log
+
+
+def determinant(A, exact=True, steps=None):
+    return exact_determinant(A, steps) if exact else float_determinant(to_float(A))
+
+
+def minor(A, i, j):
+    return [row[:j] + row[j + 1:] for k, row in enumerate(A) if k != i]
+
+
+def cofactor_expansion(A, exact=True):
+    # Text of a Laplace expansion along the row or column with the most
+    # zeros, and det(A). Minors are expanded the same way down to 2x2.
+    n = len(A)
+    if n == 1:
+        return "", A[0][0]
+    if n == 2:
+        (a, b), (c, d) = A
+        value = a * d - b * c
+        return f"({fmt(a)})({fmt(d)}) - ({fmt(b)})({fmt(c)}) = {fmt(value)}", value
+
+    zeros_in_row = [sum(1 for v in row if v == 0) for row in A]
+    zeros_in_column = [sum(1 for row in A if row[j] == 0) for j in range(n)]
+    if max(zeros_in_column) > max(zeros_in_row):
+        j = zeros_in_column.index(max(zeros_in_column))
+        positions, along = [(i, j) for i in range(n)], f"column {j + 1}"
+    else:
+        i = zeros_in_row.index(max(zeros_in_row))
+        positions, along = [(i, j) for j in range(n)], f"row {i + 1}"
+
+    lines = [f"Expand along {along}: det = sum of (-1)^(i+j) a_ij M_ij"]
+    terms, value = [], 0
+    for i, j in positions:
+        entry = A[i][j]
+        sign = -1 if (i + j) % 2 else 1
+        if entry == 0:
+            terms.append("0")
+            continue
+        text, m = cofactor_expansion(minor(A, i, j), exact)
+        if n == 3:
+            lines.append(f"   M{i + 1}{j + 1} = {text}")
+        else:
+            lines.append(f"   M{i + 1}{j + 1}:\n      " + text.replace("\n", "\n      "))
+        terms.append(f"({'+' if sign > 0 else '-'})({fmt(entry)})({fmt(m)})")
+        value += sign * entry * m
+    lines.append(f"det = {' '.join(terms)} = {fmt(value)}")
+    return "\n".join(lines), value
+
+
+# ================= MULTIPLICATION =================
+def transpose(rows):
+    return [list(column) for column in zip(*rows)]
+
+
+def _integer_rows(rows):
+    # Each row scaled to integers by the lcm of its denominators: (rows, scales)
+    scaled, scales = [], []
+    for row in rows:
+        lcm = math.lcm(*[v.denominator for v in row])
+        scales.append(lcm)
+        # Integer rows, the usual case, skip the Fraction multiplication
+        scaled.append([v.numerator for v in row] if lcm == 1 else [v.numerator * (lcm // v.denominator) for v in row])
+    return scaled, scales
+
+
+def multiply(A, B, exact=True, steps=None):
+    # A (m x k) times B (k x n). Exact products scale the rows of A and the
+    # columns of B to integers, so each entry is one integer dot product and
+    # a single Fraction instead of k Fraction additions; the columns of B are
+    # taken blockSize at a time for every row of A. Large float products go
+    # to NumPy. steps, when given, gets one line per entry.
+    m, k, n = len(A), len(B), len(B[0])
+    if len(A[0]) != k:
+        raise MatrixSyntaxError(f"Cannot multiply {m} x {len(A[0])} by {k} x {n}: "
+                                "the columns of A must match the rows of B.")
+    if steps is not None:
+        for i in range(m):
+            for j in range(n):
+                terms = [(A[i][t], B[t][j]) for t in range(k)]
+                value = sum(a * b for a, b in terms)
+                steps.append(f"   c{i + 1}{j + 1} = " + " + ".join(f"({fmt(a)})({fmt(b)})" for a, b in terms)
+                             + f" = {fmt(value)}\n")
+
+    if not exact:
+        if max(m, k, n) >= numpyLimit:
+            product = numpy_multiply(A, B)
+            if product is not None:
+                return product
+        columns = transpose(B)
+        C = [[] for _ in range(m)]
+        for start in range(0, n, blockSize):
+            block = columns[start:start + blockSize]
+            for row, out in zip(A, C):
+                out.extend(sum(map(operator.mul, row, column)) for column in block)
+        return C
+
+    rows, row_scales = _integer_rows(A)
+    columns, column_scales = _integer_rows(transpose(B))
+    C = [[] for _ in range(m)]
+    for start in range(0, n, blockSize):
+        block = columns[start:start + blockSize]
+        scales = column_scales[start:start + blockSize]
+        for row, scale, out in zip(rows, row_scales, C):
+            out.extend(Fraction(sum(map(operator.mul, row, column)), scale * s) for column, s in zip(block, scales))
+    return C
+
+
+def chain_order(dims):
+    # Matrix-chain dynamic programme: matrix i is dims[i] x dims[i + 1].
+    # Returns (cost, split) where cost[i][j] is the fewest scalar
+    # multiplications for matrices i..j and split[i][j] the last product.
+    count = len(dims) - 1
+    cost = [[0] * count for _ in range(count)]
+    split = [[0] * count for _ in range(count)]
+    for length in range(2, count + 1):
+        for i in range(count - length + 1):
+            j = i + length - 1
+            cost[i][j], split[i][j] = min(
+                (cost[i][s] + cost[s + 1][j] + dims[i] * dims[s + 1] * dims[j + 1], s) for s in range(i, j))
+    return cost, split
+
+
+def parenthesize(split, i, j, names):
+    if i == j:
+        return names[i]
+    s = split[i][j]
+    return f"({parenthesize(split, i, s, names)} {parenthesize(split, s + 1, j, names)})"
+
+
+def chain_multiply(matrices, split, exact=True, i=0, j=None):
+    j = len(matrices) - 1 if j is None else j
+    if i == j:
+        return matrices[i]
+    s = split[i][j]
+    return multiply(chain_multiply(matrices, split, exact, i, s), chain_multiply(matrices, split, exact, s + 1, j), exact)
+
+
+# ================= NUMPY =================
+def numpy_solve(A, b):
+    # LAPACK solve for large float systems; None when NumPy is missing or the
+    # matrix is singular (the caller falls back to classify())
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    try:
+        return np.linalg.solve(np.array(A, dtype=float), np.array(b, dtype=float)).tolist()
+    except np.linalg.LinAlgError:
+        return None
+
+
+def numpy_multiply(A, B):
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return (np.array(A, dtype=float) @ np.array(B, dtype=float)).tolist()
+
+
+def residual(A, x, b):
+    # Largest |Ax - b|, to show how far rounding moved a float answer
+    return max(abs(sum(a * v for a, v in zip(row, x)) - t) for row, t in zip(A, b))
@@ -0,0 +1,190 @@
+from collections import OrderedDict
+
+import numpy as np
+import sympy
+
+#+++++++++++++++ Plot Sampling Engine +++++++++++++++++++
+# Turns expression strings into NumPy sample arrays for the plot panel.
+# Expressions are lambdified once; sampling starts on a uniform grid and then
+# repeatedly bisects only the segments that bend sharply, are steep, or run
+# into a singularity (one end finite, the other not). Everything is done on
+# whole arrays, never point by point.
+#
+# Samples are cached per expression over a range wider than the view, so
+# panning and zooming in reuse them; only zooming out far, or into a region
+# the samples are too coarse for, samples again.
+
+# Points in the first uniform pass over the sampled range
+basePoints = 801
+# Bisection passes, and the most points a curve may end up with
+refinePasses = 8
+maxPoints = 40000
+# A segment is refined when the curve turns or climbs by more than this
+# fraction of the typical y-range
+bendTolerance = 0.002
+steepTolerance = 0.02
+# The view must hold at least this many cached points to reuse them
+minVisiblePoints = 300
+# Curves kept in the sample cache, and sample sets kept per curve
+cacheCurves = 32
+levelsPerCurve = 4
+
+x = sympy.Symbol("x")
+
+
+def compile_curve(text):
+    # Expression string -> vectorized function of a float array
+    expr = sympy.sympify(text)
+    extra = expr.free_symbols - {x}
+    if extra:
+        raise ValueError(f"cannot plot {text}: unknown symbols {', '.join(sorted(map(str, extra)))}")
+    fn = sympy.lambdify(x, expr, modules="numpy")
+    # Functions NumPy lacks (erf, gamma, ...) fall back to mpmath point by point
+    point = sympy.lambdify(x, expr, modules=["math", "mpmath"])
+
+    def safe_point(t):
+        try:
+            return complex(point(t))
+        except (ValueError, ZeroDivisionError, OverflowError, TypeError):
+            return complex(np.nan)
+    scalar = np.vectorize(safe_point, otypes=[complex])
+
+    def f(xs):
+        with np.errstate(all="ignore"):
+            try:
+                ys = np.asarray(fn(xs))
+            except (TypeError, NameError):
+                ys = scalar(xs)
+        if np.iscomplexobj(ys):
+            # Keep only the points where the value is (numerically) real
+            ys = np.where(np.abs(ys.imag) <= 1e-12 * np.maximum(1.0, np.abs(ys.real)), ys.real, np.nan)
+        ys = np.broadcast_to(ys.astype(float), xs.shape)
+        return np.where(np.isfinite(ys), ys, np.nan)
+    return f
+
+
+def y_scale(ys):
+    # Typical height of the curve: the 5th-95th percentile spread of its values
+    finite = ys[np.isfinite(ys)]
+    if finite.size < 2:
+        return 1.0
+    low, high = np.percentile(finite, [5, 95])
+    return max(high - low, 1e-12 * max(1.0, abs(high)), 1e-300)
+
+
+def adaptive_sample(f, a, b, points=basePoints):
+    xs = np.linspace(a, b, points)
+    ys = f(xs)
+    scale = y_scale(ys)
+    for _ in range(refinePasses):
+        finite = np.isfinite(ys)
+        dy = np.abs(np.diff(ys))
+        refine = (finite[:-1] != finite[1:]) | (dy > steepTolerance * scale)
+        # Second differences flag both segments around a sharp turn
+        bend = np.abs(ys[:-2] - 2 * ys[1:-1] + ys[2:]) > bendTolerance * scale
+        refine[:-1] |= bend
+        refine[1:] |= bend
+        refine &= np.diff(xs) > (b - a) * 1e-9
+        index = np.flatnonzero(refine)
+        if index.size == 0 or xs.size + index.size > maxPoints:
+            break
+        mid = 0.5 * (xs[index] + xs[index + 1])
+        xs = np.insert(xs, index + 1, mid)
+        ys = np.insert(ys, index + 1, f(mid))
+    return xs, ys
+
+
+class SampleCache:
+    def __init__(self, size=cacheCurves):
+        self.size = size
+        self.curves = OrderedDict()   # text -> function
+        self.samples = OrderedDict()  # text -> [(a, b, xs, ys), ...]
+        self.hits = self.misses = 0
+
+    def function(self, text):
+        if text not in self.curves:
+            self.curves[text] = compile_curve(text)
+            while len(self.curves) > self.size:
+                self.curves.popitem(last=False)
+        return self.curves[text]
+
+    def sample(self, text, a, b):
+        # Arrays covering at least [a, b], dense enough for a view of that width.
+        # A few sample sets are kept per curve (one per zoom level) so zooming
+        # back out finds the wider ones again.
+        levels = self.samples.setdefault(text, [])
+        self.samples.move_to_end(text)
+        for lo, hi, xs, ys in levels:
+            if lo <= a and b <= hi:
+                visible = np.searchsorted(xs, b) - np.searchsorted(xs, a)
+                if visible >= minVisiblePoints:
+                    self.hits += 1
+                    return xs, ys
+        self.misses += 1
+        width = b - a
+        lo, hi = a - width, b + width
+        xs, ys = adaptive_sample(self.function(text), lo, hi)
+        levels.insert(0, (lo, hi, xs, ys))
+        del levels[levelsPerCurve:]
+        while len(self.samples) > self.size:
+            self.samples.popitem(last=False)
+        return xs, ys
+
+    def grid(self, text, a, b, points=400):
+        # Uniform samples for shading; cheap enough not to cache
+        xs = np.linspace(a, b, points)
+        return xs, self.function(text)(xs)
+
+
+def visible_slice(xs, a, b):
+    # Indices of the samples in [a, b] plus one either side, so lines reach the edges
+    start = max(np.searchsorted(xs, a) - 1, 0)
+    stop = min(np.searchsorted(xs, b) + 1, xs.size)
+    return slice(start, stop)
+
+
+def auto_y_range(xs, ys, a, b):
+    # Robust y-limits for the view [a, b]. Refined samples crowd around poles,
+    # so the percentiles are taken over an even grid interpolated from them.
+    grid = np.interp(np.linspace(a, b, 512), xs, ys)
+    finite = grid[np.isfinite(grid)]
+    if finite.size == 0:
+        return -1.0, 1.0
+    low, high = np.percentile(finite, [2, 98])
+    if high - low < 1e-12:
+        low, high = low - 1, high + 1
+    pad = 0.1 * (high - low)
+    return low - pad, high + pad
+
+
+def to_screen(xs, ys, view, width, height):
+    x0, x1, y0, y1 = view
+    return (xs - x0) * (width / (x1 - x0)), height - (ys - y0) * (height / (y1 - y0))
+
+
+def region_outline(sx, top, bottom, height):
+    # Flat polygon coordinates for the area between two sampled curves
+    ok = np.isfinite(top) & np.isfinite(bottom)
+    sx, top, bottom = sx[ok], np.clip(top[ok], -height, 2 * height), np.clip(bottom[ok], -height, 2 * height)
+    if sx.size < 2:
+        return None
+    outline = np.column_stack((np.concatenate((sx, sx[::-1])), np.concatenate((top, bottom[::-1]))))
+    return outline.ravel().tolist()
+
+
+def polylines(sx, sy, height):
+    # Screen coordinates -> flat coordinate lists, one per unbroken piece.
+    # The line is broken at missing values and at jumps that cross the whole
+    # view in one segment (poles such as tan(x) at pi/2).
+    jump = np.zeros(sx.size, dtype=bool)
+    jump[1:] = ((sy[1:] < -height) & (sy[:-1] > 2 * height)) | ((sy[:-1] < -height) & (sy[1:] > 2 * height))
+    broken = ~np.isfinite(sy)
+    sy = np.clip(sy, -height, 2 * height)
+    starts = np.flatnonzero(jump | broken)
+    pieces = []
+    for piece_x, piece_y in zip(np.split(sx, starts), np.split(sy, starts)):
+        ok = np.isfinite(piece_y)
+        piece_x, piece_y = piece_x[ok], piece_y[ok]
+        if piece_x.size >= 2:
+            pieces.append(np.column_stack((piece_x, piece_y)).ravel().tolist())
+    return pieces
@@ -0,0 +1,198 @@
+import math
+import tkinter as tk
+
+#+++++++++++++++ Color Scheme +++++++++++++++++++
+backgroundColour = '#282c34'
+foregroundColour = '#c6c6c6'
+accentColour = '#61afef'
+plotBg = '#1e1e1e'
+gridColour = '#333842'
+axisColour = '#6b717d'
+curveColours = ['#61afef', '#e5c07b', '#98c379', '#e06c75', '#c678dd', '#56b6c2']
+regionColour = '#2f4a63'
+
+# Default view when a figure gives no x-range
+defaultRange = (-5.0, 5.0)
+# Grid lines aimed for across the width
+gridLines = 8
+
+
+#+++++++++++++++ Plot Panel +++++++++++++++++++
+# Draws a Solution.figure (curves, shaded regions, points) on a Tk canvas.
+# Sampling is done by plotEngine (NumPy), which is only imported with the
+# first plot. Drag to pan, scroll to zoom, double-click to reset; these only
+# change the view, and redraws reuse the cached samples.
+class PlotPanel(tk.Frame):
+    def __init__(self, parent, height=260):
+        super().__init__(parent, bg=backgroundColour)
+        self.canvas = tk.Canvas(self, height=height, bg=plotBg, highlightthickness=0, cursor="fleur")
+        self.canvas.pack(fill="both", expand=True)
+        self.engine = None
+        self.cache = None
+        self.figure = None
+        self.view = None      # (x0, x1, y0, y1)
+        self.dragFrom = None
+
+        self.canvas.bind("<Configure>", lambda event: self.redraw())
+        self.canvas.bind("<ButtonPress-1>", self.startDrag)
+        self.canvas.bind("<B1-Motion>", self.drag)
+        self.canvas.bind("<Double-Button-1>", lambda event: self.resetView())
+        self.canvas.bind("<MouseWheel>", lambda event: self.zoom(event, 0.8 if event.delta > 0 else 1.25))
+        self.canvas.bind("<Button-4>", lambda event: self.zoom(event, 0.8))
+        self.canvas.bind("<Button-5>", lambda event: self.zoom(event, 1.25))
+
+    def show(self, figure):
+        if self.engine is None:
+            import plotEngine
+            self.engine = plotEngine
+            self.cache = plotEngine.SampleCache()
+        self.figure = figure
+        self.resetView()
+
+    def resetView(self):
+        if not self.figure:
+            self.view = None
+            self.redraw()
+            return
+        x0, x1 = self.figure["range"] or defaultRange
+        if x0 == x1:
+            x0, x1 = x0 - 1, x1 + 1
+        y0, y1 = self.autoYRange(x0, x1)
+        self.view = (x0, x1, y0, y1)
+        self.redraw()
+
+    def autoYRange(self, x0, x1):
+        low, high = math.inf, -math.inf
+        for text, label in self.figure["curves"]:
+            try:
+                xs, ys = self.cache.sample(text, x0, x1)
+            except (ValueError, TypeError, SyntaxError, AttributeError):
+                continue
+            part = self.engine.visible_slice(xs, x0, x1)
+            lo, hi = self.engine.auto_y_range(xs[part], ys[part], x0, x1)
+            low, high = min(low, lo), max(high, hi)
+        for px, py, label in self.figure["points"]:
+            low, high = min(low, py), max(high, py)
+        if not (math.isfinite(low) and math.isfinite(high)):
+            return -1.0, 1.0
+        if high - low < 1e-12:
+            low, high = low - 1, high + 1
+        return low, high
+
+    # ================= VIEW CHANGES =================
+    def startDrag(self, event):
+        self.dragFrom = (event.x, event.y, self.view)
+
+    def drag(self, event):
+        if self.dragFrom is None or self.dragFrom[2] is None:
+            return
+        startX, startY, (x0, x1, y0, y1) = self.dragFrom
+        width, height = self.size()
+        dx = (event.x - startX) * (x1 - x0) / width
+        dy = (event.y - startY) * (y1 - y0) / height
+        self.view = (x0 - dx, x1 - dx, y0 + dy, y1 + dy)
+        self.redraw()
+
+    def zoom(self, event, factor):
+        if self.view is None:
+            return
+        x0, x1, y0, y1 = self.view
+        width, height = self.size()
+        # Keep the point under the cursor fixed
+        cx = x0 + event.x / width * (x1 - x0)
+        cy = y1 - event.y / height * (y1 - y0)
+        self.view = (cx + (x0 - cx) * factor, cx + (x1 - cx) * factor,
+                     cy + (y0 - cy) * factor, cy + (y1 - cy) * factor)
+        self.redraw()
+
+    def size(self):
+        return max(self.canvas.winfo_width(), 2), max(self.canvas.winfo_height(), 2)
+
+    # ================= DRAWING =================
+    def redraw(self):
+        self.canvas.delete("all")
+        width, height = self.size()
+        if self.view is None:
+            self.canvas.create_text(width / 2, height / 2, text="Solve a task to see its graph here.", fill=axisColour)
+            return
+
+        x0, x1, y0, y1 = self.view
+        self.drawGrid(width, height)
+        for upper, lower, a, b in self.figure["regions"]:
+            self.drawRegion(upper, lower, max(a, x0), min(b, x1), width, height)
+
+        errors = []
+        for index, (text, label) in enumerate(self.figure["curves"]):
+            colour = curveColours[index % len(curveColours)]
+            try:
+                self.drawCurve(text, colour, width, height)
+            except (ValueError, TypeError, SyntaxError, AttributeError) as e:
+                errors.append(f"{label}: {e}")
+                continue
+            self.canvas.create_text(10, 12 + 16 * index, text=label, fill=colour, anchor="w", font=("Courier", 9))
+
+        for px, py, label in self.figure["points"]:
+            sx, sy = self.toScreen(px, py, width, height)
+            self.canvas.create_oval(sx - 4, sy - 4, sx + 4, sy + 4, fill=curveColours[3], outline="")
+            if label:
+                self.canvas.create_text(sx + 8, sy - 8, text=label, fill=foregroundColour, anchor="w", font=("Courier", 9))
+
+        if errors:
+            self.canvas.create_text(10, height - 12, text="Cannot plot " + "; ".join(errors), fill=curveColours[3], anchor="w")
+
+    def toScreen(self, px, py, width, height):
+        x0, x1, y0, y1 = self.view
+        return (px - x0) * width / (x1 - x0), height - (py - y0) * height / (y1 - y0)
+
+    def drawGrid(self, width, height):
+        x0, x1, y0, y1 = self.view
+        for low, high, vertical in ((x0, x1, True), (y0, y1, False)):
+            step = nice_step((high - low) / gridLines)
+            value = math.ceil(low / step) * step
+            while value <= high:
+                sx, sy = self.toScreen(value, value, width, height)
+                on_axis = abs(value) < step / 2
+                colour = axisColour if on_axis else gridColour
+                label = f"{0.0 if on_axis else value:g}"
+                if vertical:
+                    self.canvas.create_line(sx, 0, sx, height, fill=colour)
+                    self.canvas.create_text(sx + 2, height - 2, text=label, fill=axisColour, anchor="sw", font=("Arial", 8))
+                else:
+                    self.canvas.create_line(0, sy, width, sy, fill=colour)
+                    self.canvas.create_text(width - 2, sy - 2, text=label, fill=axisColour, anchor="se", font=("Arial", 8))
+                value += step
+
+    def drawCurve(self, text, colour, width, height):
+        x0, x1, y0, y1 = self.view
+        xs, ys = self.cache.sample(text, x0, x1)
+        part = self.engine.visible_slice(xs, x0, x1)
+        # Whole arrays go to screen coordinates at once; Tk gets one flat
+        # coordinate list per unbroken piece of the curve
+        sx, sy = self.engine.to_screen(xs[part], ys[part], self.view, width, height)
+        for coords in self.engine.polylines(sx, sy, height):
+            self.canvas.create_line(coords, fill=colour, width=2)
+
+    def drawRegion(self, upper, lower, a, b, width, height):
+        if not a < b:
+            return
+        try:
+            xs, top = self.cache.grid(upper, a, b)
+            bottom = self.cache.grid(lower, a, b)[1]
+        except (ValueError, TypeError, SyntaxError, AttributeError):
+            return
+        sx, top = self.engine.to_screen(xs, top, self.view, width, height)
+        bottom = self.engine.to_screen(xs, bottom, self.view, width, height)[1]
+        coords = self.engine.region_outline(sx, top, bottom, height)
+        if coords:
+            self.canvas.create_polygon(coords, fill=regionColour, outline="")
+
+
+def nice_step(raw):
+    # 1, 2 or 5 times a power of ten, at least raw
+    if raw <= 0 or not math.isfinite(raw):
+        return 1.0
+    power = 10 ** math.floor(math.log10(raw))
+    for multiple in (1, 2, 5, 10):
+        if multiple * power >= raw:
+            return multiple * power
+    return 10 * power
@@ -0,0 +1,158 @@
+import math
+
+#+++++++++++++++ Root Finding Engine +++++++++++++++++++
+# Real roots of a plain float function on [a, b] without SymPy's solve:
+#
+#   1. sample f on an even grid and note every sign change
+#   2. close in on each bracket with Brent's method (inverse quadratic
+#      interpolation, secant and bisection steps; never leaves the bracket)
+#   3. look at local minima of |f| with no sign change for roots of even
+#      multiplicity (1 - cos(x) at 0), found by golden-section search
+#
+# A "sign change" across a pole (1/x at 0) also brackets; those are returned
+# separately as discontinuities because f is not small there, together with
+# the edges of any stretch where f is undefined (sqrt(x) at 0).
+
+# Grid points used to look for sign changes
+samplePoints = 2000
+# Brent stops once the bracket is this narrow (relative to |x|, at least 1)
+tolerance = 1e-13
+maxIterations = 200
+
+
+def brent(f, a, b, tol=tolerance, max_iter=maxIterations):
+    fa, fb = f(a), f(b)
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if fa * fb > 0:
+        raise ValueError("root is not bracketed")
+    if abs(fa) < abs(fb):
+        a, b, fa, fb = b, a, fb, fa
+    c, fc = a, fa
+    d = c
+    bisected = True
+
+    for _ in range(max_iter):
+        if fb == 0 or abs(b - a) <= tol * max(1.0, abs(b)):
+            return b
+        if fa != fc and fb != fc:
+            # Inverse quadratic interpolation through the last three points
+            s = (a * fb * fc / ((fa - fb) * (fa - fc)) +
+                 b * fa * fc / ((fb - fa) * (fb - fc)) +
+                 c * fa * fb / ((fc - fa) * (fc - fb)))
+        else:
+            s = b - fb * (b - a) / (fb - fa)
+
+        # Fall back to bisection whenever interpolation is not making progress
+        lo, hi = sorted(((3 * a + b) / 4, b))
+        small = tol * max(1.0, abs(b))
+        if (not lo < s < hi or
+                (bisected and abs(s - b) >= abs(b - c) / 2) or
+                (not bisected and abs(s - b) >= abs(c - d) / 2) or
+                (bisected and abs(b - c) < small) or
+                (not bisected and abs(c - d) < small)):
+            s = (a + b) / 2
+            bisected = True
+        else:
+            bisected = False
+
+        fs = f(s)
+        d, c, fc = c, b, fb
+        if fa * fs < 0:
+            b, fb = s, fs
+        else:
+            a, fa = s, fs
+        if abs(fa) < abs(fb):
+            a, b, fa, fb = b, a, fb, fa
+    return b
+
+
+def golden_minimum(g, a, b, tol=1e-12, max_iter=maxIterations):
+    # x in [a, b] minimising g (assumed unimodal there)
+    ratio = (math.sqrt(5) - 1) / 2
+    c, d = b - ratio * (b - a), a + ratio * (b - a)
+    gc, gd = g(c), g(d)
+    for _ in range(max_iter):
+        if abs(b - a) <= tol * max(1.0, abs(a)):
+            break
+        if gc < gd:
+            b, d, gd = d, c, gc
+            c = b - ratio * (b - a)
+            gc = g(c)
+        else:
+            a, c, gc = c, d, gd
+            d = a + ratio * (b - a)
+            gd = g(d)
+    return (a + b) / 2
+
+
+def _safe(f):
+    def g(t):
+        try:
+            value = float(f(t))
+        except (ValueError, ZeroDivisionError, OverflowError, TypeError):
+            return math.nan
+        return value if math.isfinite(value) else math.nan
+    return g
+
+
+def find_roots(f, a, b, samples=samplePoints):
+    # Returns (roots, discontinuities), both sorted lists of floats in [a, b]
+    f = _safe(f)
+    xs = [a + (b - a) * i / samples for i in range(samples + 1)]
+    ys = [f(t) for t in xs]
+    finite = sorted(abs(v) for v in ys if not math.isnan(v))
+    # Typical size of f, to tell "f is zero here" from "f changes sign here"
+    scale = finite[len(finite) // 2] if finite else 1.0
+    small = 1e-9 * (1.0 + scale)
+
+    roots, poles = [], []
+    for i in range(samples):
+        y0, y1 = ys[i], ys[i + 1]
+        if math.isnan(y0) != math.isnan(y1):
+            poles.append(_domain_edge(f, xs[i], xs[i + 1]))
+            continue
+        if math.isnan(y0):
+            continue
+        if y0 == 0:
+            roots.append(xs[i])
+        elif y0 * y1 < 0:
+            r = brent(f, xs[i], xs[i + 1])
+            value = f(r)
+            (roots if not math.isnan(value) and abs(value) <= small else poles).append(r)
+        elif (0 < i and not math.isnan(ys[i - 1]) and y0 * ys[i - 1] > 0 and
+              abs(y0) < abs(ys[i - 1]) and abs(y0) <= abs(y1) and abs(y0) <= 1e-2 * (1.0 + scale)):
+            # Small local minimum of |f| without a sign change: maybe a double root
+            r = golden_minimum(lambda t: abs(f(t)) if not math.isnan(f(t)) else math.inf, xs[i - 1], xs[i + 1])
+            value = f(r)
+            if not math.isnan(value) and abs(value) <= small * 1e-3:
+                roots.append(r)
+    if ys[-1] == 0:
+        roots.append(xs[-1])
+    return _distinct(roots, b - a), _distinct(poles, b - a)
+
+
+def _domain_edge(f, a, b):
+    # Bisect to where f stops (or starts) being defined
+    defined_at_a = not math.isnan(f(a))
+    for _ in range(60):
+        mid = (a + b) / 2
+        if (not math.isnan(f(mid))) == defined_at_a:
+            a = mid
+        else:
+            b = mid
+    return a if defined_at_a else b
+
+
+def _distinct(values, width):
+    # Neighbouring brackets can converge on the same root
+    result = []
+    for v in sorted(values):
+        # Snap to a whole number the float is indistinguishable from (0 rather than 1e-21)
+        if abs(v - round(v)) <= 1e-10 * max(1.0, width):
+            v = float(round(v))
+        if not result or abs(v - result[-1]) > 1e-9 * max(1.0, width):
+            result.append(v)
+    return result
@@ -0,0 +1,323 @@
+import heapq
+
+#+++++++++++++++ SAT Solver Backend +++++++++++++++++++
+# Answers tautology / contradiction / contingency for formulas that are far too
+# large to enumerate. The parsed formula (see logicEngine) is turned into CNF
+# with the Tseitin transformation and handed to a small CDCL solver:
+# two watched literals, 1-UIP clause learning, activity-based branching,
+# phase saving and geometric restarts.
+#
+# Literals are non-zero ints: v means "variable v is True", -v means False.
+
+
+def _index(lit):
+    return 2 * lit if lit > 0 else -2 * lit + 1
+
+
+class SatSolver:
+    def __init__(self, num_vars):
+        self.num_vars = num_vars
+        self.clauses = []
+        self.watches = [[] for _ in range(2 * num_vars + 2)]
+        self.value = [None] * (num_vars + 1)
+        self.level = [0] * (num_vars + 1)
+        self.reason = [None] * (num_vars + 1)
+        self.activity = [0.0] * (num_vars + 1)
+        self.phase = [False] * (num_vars + 1)
+        self.trail = []
+        self.trail_lim = []
+        self.qhead = 0
+        self.bump_amount = 1.0
+        self.order = [(0.0, v) for v in range(1, num_vars + 1)]
+        self.ok = True
+
+        # Statistics shown in the step-by-step output
+        self.decisions = 0
+        self.conflicts = 0
+        self.learnt_count = 0
+
+    def lit_value(self, lit):
+        v = self.value[abs(lit)]
+        if v is None:
+            return None
+        return v if lit > 0 else not v
+
+    def add_clause(self, lits):
+        # Clauses may only be added before solving (decision level 0)
+        if not self.ok:
+            return
+        clause = []
+        for lit in dict.fromkeys(lits):
+            if -lit in clause:
+                return  # contains p and ~p: always satisfied
+            val = self.lit_value(lit)
+            if val is True:
+                return
+            if val is None:
+                clause.append(lit)
+
+        if not clause:
+            self.ok = False
+        elif len(clause) == 1:
+            self.enqueue(clause[0], None)
+            if self.propagate() is not None:
+                self.ok = False
+        else:
+            self.clauses.append(clause)
+            self.watches[_index(clause[0])].append(clause)
+            self.watches[_index(clause[1])].append(clause)
+
+    def enqueue(self, lit, reason):
+        v = abs(lit)
+        self.value[v] = lit > 0
+        self.level[v] = len(self.trail_lim)
+        self.reason[v] = reason
+        self.trail.append(lit)
+
+    def propagate(self):
+        # Unit propagation; returns the conflicting clause or None.
+        # Every clause watches its first two literals and is only visited when
+        # one of them becomes False.
+        while self.qhead < len(self.trail):
+            false_lit = -self.trail[self.qhead]
+            self.qhead += 1
+
+            watchers = self.watches[_index(false_lit)]
+            kept = []
+            self.watches[_index(false_lit)] = kept
+
+            j = 0
+            while j < len(watchers):
+                clause = watchers[j]
+                j += 1
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], clause[0]
+                first = clause[0]
+                if self.lit_value(first) is True:
+                    kept.append(clause)
+                    continue
+
+                # Look for a replacement watch that is not False
+                for k in range(2, len(clause)):
+                    if self.lit_value(clause[k]) is not False:
+                        clause[1], clause[k] = clause[k], clause[1]
+                        self.watches[_index(clause[1])].append(clause)
+                        break
+                else:
+                    kept.append(clause)
+                    if self.lit_value(first) is False:
+                        kept.extend(watchers[j:])
+                        self.qhead = len(self.trail)
+                        return clause
+                    self.enqueue(first, clause)
+        return None
+
+    def bump(self, v):
+        self.activity[v] += self.bump_amount
+        if self.activity[v] > 1e100:
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.bump_amount *= 1e-100
+            self.order = [(-self.activity[u], u) for u in range(1, self.num_vars + 1) if self.value[u] is None]
+            heapq.heapify(self.order)
+        elif self.value[v] is None:
+            heapq.heappush(self.order, (-self.activity[v], v))
+
+    def analyze(self, conflict):
+        # First-UIP learning: resolve backwards along the trail until exactly one
+        # literal of the current decision level remains in the learnt clause.
+        seen = set()
+        learnt = [None]
+        counter = 0
+        current = len(self.trail_lim)
+        index = len(self.trail) - 1
+        clause = conflict
+        p = None
+
+        while True:
+            for q in (clause if p is None else clause[1:]):
+                v = abs(q)
+                if v not in seen and self.level[v] > 0:
+                    seen.add(v)
+                    self.bump(v)
+                    if self.level[v] >= current:
+                        counter += 1
+                    else:
+                        learnt.append(q)
+
+            while abs(self.trail[index]) not in seen:
+                index -= 1
+            p = self.trail[index]
+            index -= 1
+            clause = self.reason[abs(p)]
+            seen.discard(abs(p))
+            counter -= 1
+            if counter == 0:
+                break
+
+        learnt[0] = -p
+        if len(learnt) == 1:
+            return learnt, 0
+
+        # Second watch goes on the literal from the highest remaining level
+        best = max(range(1, len(learnt)), key=lambda i: self.level[abs(learnt[i])])
+        learnt[1], learnt[best] = learnt[best], learnt[1]
+        return learnt, self.level[abs(learnt[1])]
+
+    def backtrack(self, level):
+        if len(self.trail_lim) <= level:
+            return
+        stop = self.trail_lim[level]
+        for lit in self.trail[stop:]:
+            v = abs(lit)
+            self.phase[v] = lit > 0
+            self.value[v] = None
+            self.reason[v] = None
+            heapq.heappush(self.order, (-self.activity[v], v))
+        del self.trail[stop:]
+        del self.trail_lim[level:]
+        self.qhead = len(self.trail)
+
+    def pick_branch(self):
+        while self.order:
+            _, v = heapq.heappop(self.order)
+            if self.value[v] is None:
+                return v
+        return None
+
+    def solve(self):
+        # Returns {var: bool} for a satisfying assignment, or None if UNSAT
+        if not self.ok or self.propagate() is not None:
+            return None
+
+        restart_limit = 100
+        since_restart = 0
+        while True:
+            conflict = self.propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                since_restart += 1
+                if not self.trail_lim:
+                    return None
+
+                learnt, level = self.analyze(conflict)
+                self.backtrack(level)
+                if len(learnt) == 1:
+                    self.enqueue(learnt[0], None)
+                else:
+                    self.clauses.append(learnt)
+                    self.learnt_count += 1
+                    self.watches[_index(learnt[0])].append(learnt)
+                    self.watches[_index(learnt[1])].append(learnt)
+                    self.enqueue(learnt[0], learnt)
+                self.bump_amount /= 0.95
+            else:
+                if since_restart >= restart_limit:
+                    self.backtrack(0)
+                    restart_limit = int(restart_limit * 1.5)
+                    since_restart = 0
+
+                v = self.pick_branch()
+                if v is None:
+                    return {u: self.value[u] for u in range(1, self.num_vars + 1)}
+                self.decisions += 1
+                self.trail_lim.append(len(self.trail))
+                self.enqueue(v if self.phase[v] else -v, None)
+
+
+def tseitin(tree, variables):
+    # Gives every operator node its own variable g with clauses forcing
+    # g <-> (node), so the CNF grows linearly with the formula.
+    # Returns (root literal, clauses, total variable count).
+    ids = {name: i + 1 for i, name in enumerate(variables)}
+    clauses = []
+    count = len(variables)
+    lits = {}
+
+    # Iterative post-order walk so long chains do not hit the recursion limit
+    stack = [(tree, False)]
+    while stack:
+        node, ready = stack.pop()
+        kind = node[0]
+        if kind == "var":
+            lits[id(node)] = ids[node[1]]
+        elif not ready:
+            stack.append((node, True))
+            for child in node[1:] if kind != "const" else ():
+                stack.append((child, False))
+        elif kind == "const":
+            count += 1
+            clauses.append([count] if node[1] else [-count])
+            lits[id(node)] = count
+        elif kind == "not":
+            lits[id(node)] = -lits[id(node[1])]
+        else:
+            a = lits[id(node[1])]
+            b = lits[id(node[2])]
+            count += 1
+            g = count
+            if kind == "and":
+                clauses += [[-g, a], [-g, b], [g, -a, -b]]
+            elif kind == "or":
+                clauses += [[-g, a, b], [g, -a], [g, -b]]
+            elif kind == "imp":
+                clauses += [[-g, -a, b], [g, a], [g, -b]]
+            else:
+                clauses += [[-g, -a, b], [-g, a, -b], [g, a, b], [g, -a, -b]]
+            lits[id(node)] = g
+
+    return lits[id(tree)], clauses, count
+
+
+class SatAnalysis:
+    def __init__(self, tree, variables):
+        self.variables = list(variables)
+        root, clauses, count = tseitin(tree, self.variables)
+        self.clause_count = len(clauses)
+        self.gate_count = count - len(self.variables)
+
+        # One solve for "can it be True?" and one for "can it be False?"
+        self.stats = {}
+        self.true_witness = self._solve(count, clauses, root, "True")
+        self.false_witness = self._solve(count, clauses, -root, "False")
+
+    def _solve(self, count, clauses, root, label):
+        solver = SatSolver(count)
+        for clause in clauses:
+            solver.add_clause(clause)
+        solver.add_clause([root])
+        model = solver.solve()
+        self.stats[label] = (solver.decisions, solver.conflicts, solver.learnt_count)
+        if model is None:
+            return None
+        return tuple(model[i + 1] for i in range(len(self.variables)))
+
+    def classify(self):
+        if self.false_witness is None:
+            return "TAUTOLOGY"
+        if self.true_witness is None:
+            return "CONTRADICTION"
+        return "CONTINGENCY"
+
+
+def sat_summary_lines(analysis):
+    # Same shape as logicEngine.summary_lines, but answered by the SAT solver
+    yield f"Method: Tseitin CNF ({analysis.gate_count} gate variables, {analysis.clause_count} clauses) + CDCL SAT solver\n\n"
+
+    verdict = analysis.classify()
+    if verdict == "TAUTOLOGY":
+        yield "Conclusion: TAUTOLOGY (Always True)\n"
+        yield "  ~formula is unsatisfiable, so no row makes it False.\n"
+    elif verdict == "CONTRADICTION":
+        yield "Conclusion: CONTRADICTION (Always False)\n"
+        yield "  formula is unsatisfiable, so no row makes it True.\n"
+    else:
+        yield "Conclusion: CONTINGENCY (Sometimes True/False)\n"
+
+    for label, witness in (("True", analysis.true_witness), ("False", analysis.false_witness)):
+        if witness is not None:
+            text = ", ".join(f"{v}={'T' if b else 'F'}" for v, b in zip(analysis.variables, witness)) or "(no variables)"
+            yield f"  {label} when: {text}\n"
+
+    for label in ("True", "False"):
+        decisions, conflicts, learnt = analysis.stats[label]
+        yield f"  [solve formula={label}: {decisions} decisions, {conflicts} conflicts, {learnt} learnt clauses]\n"
@@ -0,0 +1,528 @@
+import math
+import re
+import sys
+from functools import lru_cache
+
+#+++++++++++++++ Set & Relation Engine +++++++++++++++++++
+# Helpers for the COS1501 set and relation tasks that avoid materialising
+# large intermediate results.
+
+# ================= PARSING =================
+# One tokenizer for every COS1501 input box. Understands
+#   plain atoms        1, 2, abc, New York
+#   quoted strings     "a, b" or 'x(y)'
+#   integer ranges     1..1000 (expanded in place)
+#   tuples / pairs     (1, 2)
+#   nested sets        {1, {2, 3}}
+# Atoms become interned strings, tuples become tuples and nested sets become
+# frozensets, so equal values share memory and compare cheaply. Parsed results
+# are cached per input string, so clicking Solve again does not re-parse.
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<string>"[^"]*"|'[^']*')
+      | (?P<range>-?\d+)\s*\.\.\s*(?P<range_end>-?\d+)
+      | (?P<punct>[,(){}])
+      | (?P<atom>[^,(){}"'\s](?:[^,(){}"']*[^,(){}"'\s])?)
+    )""", re.VERBOSE)
+
+
+# Longest a..b range expanded, so a typo such as 1..1000000000 is an input
+# error rather than a frozen window
+maxRangeLength = 10 ** 6
+
+
+class SetSyntaxError(ValueError):
+    pass
+
+
+def _tokens(text):
+    pos = 0
+    end = len(text.rstrip())
+    while pos < end:
+        match = _TOKEN.match(text, pos)
+        if match is None or match.end() == pos:
+            raise SetSyntaxError(f"Unexpected character '{text[pos]}' at position {pos + 1}")
+        pos = match.end()
+        kind = match.lastgroup
+        if kind == "range_end":
+            yield "range", (int(match.group("range")), int(match.group("range_end")))
+        elif kind == "string":
+            yield "atom", sys.intern(match.group("string")[1:-1])
+        elif kind == "atom":
+            yield "atom", sys.intern(match.group("atom"))
+        else:
+            yield "punct", match.group("punct")
+
+
+class _SetParser:
+    def __init__(self, text):
+        self.tokens = list(_tokens(text))
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def expect(self, symbol):
+        if self.peek() != ("punct", symbol):
+            found = self.peek()[1]
+            raise SetSyntaxError(f"Expected '{symbol}' but found {repr(found) if found is not None else 'end of input'}")
+        self.pos += 1
+
+    def parse_items(self, closing):
+        # Comma separated items up to `closing` (None = end of input)
+        items = []
+        while self.peek() != ("punct", closing) and self.peek()[0] is not None:
+            kind, value = self.peek()
+            if kind == "range":
+                self.pos += 1
+                first, last = value
+                if abs(last - first) >= maxRangeLength:
+                    raise SetSyntaxError(f"Range {first}..{last} has {abs(last - first) + 1} elements "
+                                         f"(at most {maxRangeLength} allowed)")
+                step = 1 if last >= first else -1
+                items.extend(sys.intern(str(v)) for v in range(first, last + step, step))
+            else:
+                items.append(self.parse_value())
+            if self.peek() == ("punct", ","):
+                self.pos += 1
+            elif self.peek() != ("punct", closing) and self.peek()[0] is not None:
+                raise SetSyntaxError(f"Expected ',' before {repr(self.peek()[1])}")
+        return items
+
+    def parse_value(self):
+        kind, value = self.peek()
+        if kind == "atom":
+            self.pos += 1
+            return value
+        if (kind, value) == ("punct", "("):
+            self.pos += 1
+            items = self.parse_items(")")
+            self.expect(")")
+            return tuple(items)
+        if (kind, value) == ("punct", "{"):
+            self.pos += 1
+            items = self.parse_items("}")
+            self.expect("}")
+            return frozenset(items)
+        if kind is None:
+            raise SetSyntaxError("Input ends unexpectedly")
+        raise SetSyntaxError(f"Unexpected {repr(value)}")
+
+    def _closing_index(self):
+        # Position of the bracket that closes the first token
+        depth = 0
+        for i, (kind, value) in enumerate(self.tokens):
+            if kind == "punct" and value in "({":
+                depth += 1
+            elif kind == "punct" and value in ")}":
+                depth -= 1
+                if depth == 0:
+                    return i
+        return None
+
+    def parse_top(self):
+        # An optional outer pair of braces around the whole list is allowed
+        if self.tokens and self.tokens[0] == ("punct", "{") and self._closing_index() == len(self.tokens) - 1:
+            self.pos = 1
+            items = self.parse_items("}")
+            self.expect("}")
+        else:
+            items = self.parse_items(None)
+        if self.pos != len(self.tokens):
+            raise SetSyntaxError(f"Unexpected {repr(self.peek()[1])} after the list")
+        return items
+
+
+@lru_cache(maxsize=128)
+def parse_elements(text):
+    # "1, 2, {3, 4}, 5..7" -> ("1", "2", frozenset({"3", "4"}), "5", "6", "7")
+    # Duplicates are dropped, first occurrence order is kept.
+    return tuple(dict.fromkeys(_SetParser(text).parse_top()))
+
+
+@lru_cache(maxsize=128)
+def parse_pairs(text):
+    # "(1,2), (a, b)" -> (("1", "2"), ("a", "b"))
+    pairs = _SetParser(text).parse_top()
+    for item in pairs:
+        if not isinstance(item, tuple) or len(item) != 2:
+            raise SetSyntaxError(f"{format_element(item)} is not an ordered pair (x,y)")
+    return tuple(pairs)
+
+
+def format_element(e):
+    if isinstance(e, tuple):
+        return "(" + ",".join(format_element(x) for x in e) + ")"
+    if isinstance(e, frozenset):
+        return "{" + ", ".join(sorted(format_element(x) for x in e)) + "}"
+    if any(c in e for c in ",(){}") or e != e.strip() or e == "":
+        return '"' + e + '"'
+    return e
+
+
+# ================= POWER SETS =================
+# Subsets are never stored: the i-th subset of the full power set is the
+# bitmask i (bit j set => element j included), and the i-th k-subset is found
+# by unranking combinations, so any page can be produced on demand.
+
+def power_set_size(n, k=None):
+    if k is None:
+        return 1 << n
+    if k < 0 or k > n:
+        return 0
+    return math.comb(n, k)
+
+
+def power_set_estimate(elements, k=None):
+    # Memory needed to hold every subset as a Python set, and as display text
+    n = len(elements)
+    count = power_set_size(n, k)
+    if count == 0:
+        return count, 0, 0
+
+    # Each element appears in 2^(n-1) subsets (or C(n-1, k-1) k-subsets)
+    appearances = (1 << (n - 1)) if k is None else math.comb(n - 1, k - 1) if k > 0 else 0
+    nonempty = count - 1 if k is None or k == 0 else count
+    separators = 2 * (appearances * n - nonempty) if nonempty else 0
+    text_bytes = appearances * sum(len(format_element(e)) for e in elements) + separators + count * 3
+
+    average = n // 2 if k is None else k
+    object_bytes = count * (sys.getsizeof(set(range(average))) + 8)
+    return count, object_bytes, text_bytes
+
+
+def _unrank_combination(n, k, rank):
+    # Lexicographic k-combination of range(n) with the given rank
+    combo = []
+    start = 0
+    for slots in range(k, 0, -1):
+        for j in range(start, n):
+            block = math.comb(n - j - 1, slots - 1)
+            if rank < block:
+                combo.append(j)
+                start = j + 1
+                break
+            rank -= block
+    return combo
+
+
+def iter_subsets(elements, k=None, start=0, stop=None):
+    # Lazily yields subsets (as tuples) with index start..stop-1
+    n = len(elements)
+    total = power_set_size(n, k)
+    if stop is None or stop > total:
+        stop = total
+
+    if k is None:
+        for i in range(start, stop):
+            yield tuple(elements[j] for j in range(i.bit_length()) if (i >> j) & 1)
+        return
+
+    if start >= stop:
+        return
+    combo = _unrank_combination(n, k, start)
+    for _ in range(start, stop):
+        yield tuple(elements[j] for j in combo)
+        # Advance to the next combination in lexicographic order
+        i = k - 1
+        while i >= 0 and combo[i] == n - k + i:
+            i -= 1
+        if i < 0:
+            return
+        combo[i] += 1
+        for j in range(i + 1, k):
+            combo[j] = combo[j - 1] + 1
+
+
+def format_subset(subset):
+    return "{" + ", ".join(format_element(e) for e in subset) + "}"
+
+
+def write_subsets(path, elements, k=None, chunk=4096):
+    # Streams the power set to a text file, one subset per line
+    count = 0
+    with open(path, "w", encoding="utf-8") as handle:
+        lines = []
+        for subset in iter_subsets(elements, k):
+            lines.append(format_subset(subset) + "\n")
+            if len(lines) >= chunk:
+                handle.write("".join(lines))
+                count += len(lines)
+                lines = []
+        handle.write("".join(lines))
+        count += len(lines)
+    return count
+
+
+def format_bytes(size):
+    if size >= 1024 ** 6:
+        return f"about 2^{size.bit_length() - 1} bytes"
+    for unit in ("bytes", "KB", "MB", "GB", "TB"):
+        if size < 1024 or unit == "TB":
+            return f"{size:.0f} {unit}" if unit == "bytes" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+# ================= RELATIONS =================
+# A relation on A = [a0, a1, ...] is stored as one int per element: bit j of
+# rows[i] is set when (ai, aj) is in R. Whole rows are combined with single
+# big-integer operations instead of looping over pairs.
+
+def _bits(x):
+    # Positions of the set bits in x, lowest first
+    while x:
+        low = x & -x
+        yield low.bit_length() - 1
+        x ^= low
+
+
+class BitRelation:
+    def __init__(self, elements, pairs=(), rows=None):
+        self.elements = list(elements)
+        self.index = {e: i for i, e in enumerate(self.elements)}
+        if rows is not None:
+            self.rows = list(rows)
+            return
+        self.rows = [0] * len(self.elements)
+        for a, b in pairs:
+            if a not in self.index or b not in self.index:
+                raise ValueError(f"Pair ({a},{b}) uses an element that is not in A")
+            self.rows[self.index[a]] |= 1 << self.index[b]
+
+    def _derived(self, rows):
+        return BitRelation(self.elements, rows=rows)
+
+    def size(self):
+        return sum(row.bit_count() for row in self.rows)
+
+    def pairs(self):
+        for i, row in enumerate(self.rows):
+            for j in _bits(row):
+                yield (self.elements[i], self.elements[j])
+
+    def __contains__(self, pair):
+        a, b = pair
+        return a in self.index and b in self.index and (self.rows[self.index[a]] >> self.index[b]) & 1 == 1
+
+    def transpose(self):
+        cols = [0] * len(self.rows)
+        for i, row in enumerate(self.rows):
+            bit = 1 << i
+            for j in _bits(row):
+                cols[j] |= bit
+        return self._derived(cols)
+
+    def difference(self, other):
+        return self._derived([a & ~b for a, b in zip(self.rows, other.rows)])
+
+    # ---------- Properties ----------
+    def missing_reflexive(self):
+        return [self.elements[i] for i, row in enumerate(self.rows) if not (row >> i) & 1]
+
+    def is_reflexive(self):
+        return all((row >> i) & 1 for i, row in enumerate(self.rows))
+
+    def is_irreflexive(self):
+        return not any((row >> i) & 1 for i, row in enumerate(self.rows))
+
+    def symmetry_counterexample(self):
+        cols = self.transpose().rows
+        for i, (row, col) in enumerate(zip(self.rows, cols)):
+            extra = row & ~col
+            if extra:
+                j = next(_bits(extra))
+                return (self.elements[i], self.elements[j])
+        return None
+
+    def antisymmetry_counterexample(self):
+        cols = self.transpose().rows
+        for i, (row, col) in enumerate(zip(self.rows, cols)):
+            both = row & col & ~(1 << i)
+            if both:
+                j = next(_bits(both))
+                return (self.elements[i], self.elements[j])
+        return None
+
+    def transitivity_counterexample(self):
+        # R is transitive exactly when it equals its transitive closure. A row
+        # that differs always contains a two-step counterexample (a,b), (b,c)
+        # with (a,c) missing, found by ORing the rows of a's successors.
+        closure = self.transitive_closure().rows
+        for i, row in enumerate(self.rows):
+            if closure[i] == row:
+                continue
+            two_step = 0
+            for j in _bits(row):
+                two_step |= self.rows[j]
+            c = next(_bits(two_step & ~row))
+            b = next(j for j in _bits(row) if (self.rows[j] >> c) & 1)
+            e = self.elements
+            return (e[i], e[b]), (e[b], e[c])
+        return None
+
+    # ---------- Closures ----------
+    def reflexive_closure(self):
+        return self._derived([row | (1 << i) for i, row in enumerate(self.rows)])
+
+    def symmetric_closure(self):
+        return self._derived([a | b for a, b in zip(self.rows, self.transpose().rows)])
+
+    def transitive_closure(self):
+        # Strongly connected components (Tarjan) come out with every component
+        # after the ones it can reach, so each reachability row is built once
+        # from its direct successors: O(|R|) big-integer ORs in total.
+        rows = self.rows
+        comp_of = [0] * len(rows)
+        reach = []
+        for c, members in enumerate(_strongly_connected(rows)):
+            mask = 0
+            direct = 0
+            for m in members:
+                comp_of[m] = c
+                mask |= 1 << m
+                direct |= rows[m]
+            # Successors already reachable through another successor add nothing
+            covered = 0
+            pending = direct & ~mask
+            while pending:
+                j = (pending & -pending).bit_length() - 1
+                covered |= reach[comp_of[j]]
+                pending &= ~covered & ~(1 << j)
+            closure = direct | covered
+            if len(members) > 1 or direct & mask:
+                closure |= mask  # members lie on a cycle and reach each other
+            reach.append(closure)
+        return self._derived([reach[comp_of[i]] for i in range(len(rows))])
+
+    # ---------- Composition ----------
+    def compose(self, other):
+        # self first, then other: row i of the result is the OR of other's
+        # rows for every j that i is related to under self
+        rows = []
+        for row in self.rows:
+            out = 0
+            for j in _bits(row):
+                out |= other.rows[j]
+            rows.append(out)
+        return self._derived(rows)
+
+    def power(self, k):
+        # R^k by repeated squaring: O(log k) compositions instead of k - 1
+        if k < 1:
+            raise ValueError("Power k must be at least 1")
+        result = None
+        base = self
+        while k:
+            if k & 1:
+                result = base if result is None else result.compose(base)
+            k >>= 1
+            if k:
+                base = base.compose(base)
+        return result
+
+    # ---------- Structure ----------
+    def equivalence_classes(self):
+        # Only meaningful for equivalence relations: equal rows = same class
+        classes = {}
+        for i, row in enumerate(self.rows):
+            classes.setdefault(row, []).append(self.elements[i])
+        return list(classes.values())
+
+    def minimal_elements(self):
+        # For a partial order: nothing else is related to these
+        cols = self.transpose().rows
+        return [self.elements[i] for i, col in enumerate(cols) if not col & ~(1 << i)]
+
+    def maximal_elements(self):
+        return [self.elements[i] for i, row in enumerate(self.rows) if not row & ~(1 << i)]
+
+
+def inverse_pairs(pairs):
+    return [(b, a) for a, b in pairs]
+
+
+def join_pairs(R, S):
+    # Hash join on the middle element: S is indexed by first component once,
+    # then each (a,b) in R looks up its matches, so the work is
+    # O(|R| + |S| + number of matches) rather than |R| * |S|.
+    by_first = {}
+    for b, c in S:
+        by_first.setdefault(b, []).append(c)
+    for a, b in R:
+        for c in by_first.get(b, ()):
+            yield a, b, c
+
+
+def _strongly_connected(rows):
+    # Iterative Tarjan; yields components in reverse topological order.
+    # Each frame keeps the successors it has not looked at yet as a bitmask,
+    # and nodes whose component is already finished are masked out in bulk.
+    n = len(rows)
+    index = [None] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack = []
+    finished = 0
+    counter = 0
+
+    for root in range(n):
+        if index[root] is not None:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [[root, rows[root]]]
+
+        while work:
+            frame = work[-1]
+            v = frame[0]
+            remaining = frame[1] & ~finished
+            descended = False
+            while remaining:
+                low_bit = remaining & -remaining
+                remaining ^= low_bit
+                w = low_bit.bit_length() - 1
+                if index[w] is None:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    frame[1] = remaining
+                    work.append([w, rows[w]])
+                    descended = True
+                    break
+                if on_stack[w]:
+                    low[v] = min(low[v], index[w])
+            if descended:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[v])
+            if low[v] == index[v]:
+                members = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    finished |= 1 << w
+                    members.append(w)
+                    if w == v:
+                        break
+                yield members
+
+
+def format_pairs(pairs, limit=None):
+    # "{(1,2), (2,3)}", optionally cut short after `limit` pairs
+    shown = []
+    total = 0
+    for a, b in pairs:
+        total += 1
+        if limit is None or total <= limit:
+            shown.append(f"({format_element(a)},{format_element(b)})")
+    text = "{" + ", ".join(shown)
+    if limit is not None and total > limit:
+        text += f", ... ({total - limit} more)"
+    return text + "}"
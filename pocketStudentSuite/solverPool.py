@@ -0,0 +1,259 @@
+import itertools
+import multiprocessing
+import threading
+import time
+from collections import deque
+
+#+++++++++++++++ Background Solver Pool +++++++++++++++++++
+# SymPy solves (integrate, limit, dsolve, ...) can run for tens of seconds, so
+# the calculus windows hand them to worker processes instead of running them
+# on the Tk thread. A worker that runs past its timeout, or whose job is
+# cancelled, is killed and replaced; nothing else can interrupt SymPy.
+#
+# Workers are started with "spawn" so they never inherit Tk or the pre-warm
+# thread's import locks, and each one imports SymPy once when it starts.
+
+# Modules whose solvers run in the pool (the others are instant)
+pooledModules = ("APM1514", "MAT1512", "MAT1613")
+# Worker processes kept alive
+poolSize = 2
+# Seconds a solve may run when its task has no timeout of its own
+defaultTimeout = 60
+# How often (ms) a window checks on its running solve
+pollInterval = 100
+
+_context = multiprocessing.get_context("spawn")
+
+
+def _worker_main(conn):
+    # Worker loop: receive (job id, code, task, inputs), send back messages
+    #   ("start", id, timeout)  ("step", id, title)  ("done", id, solution)  ("error", id, exception)
+    # and ("retire", id, None) just before "done" when a solve left a thread
+    # running (an abandoned symbolic attempt), after which the worker exits.
+    import solvers
+    from solvers import Step, Listing, listingRows
+    for code in pooledModules:
+        solvers.load(code)
+
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        job_id, code, task, inputs = message
+        try:
+            conn.send(("start", job_id, solvers.task_timeout(code, task)))
+            solution = solvers.solve(code, task, inputs, progress=lambda title: conn.send(("step", job_id, title)))
+            # Callbacks and lazy listings cannot be pickled
+            solution.progress = None
+            solution.steps = [Step(step.render(listingRows), step.title) if isinstance(step, Listing) else step
+                              for step in solution.steps]
+            retire = threading.active_count() > 1
+            if retire:
+                conn.send(("retire", job_id, None))
+            conn.send(("done", job_id, solution))
+            if retire:
+                break
+        except Exception as e:
+            try:
+                conn.send(("error", job_id, e))
+            except Exception:
+                conn.send(("error", job_id, RuntimeError(str(e))))
+
+
+class Job:
+    def __init__(self, job_id, code, task, inputs, timeout):
+        self.id = job_id
+        self.code = code
+        self.task = task
+        self.inputs = inputs
+        self.timeout = timeout
+        self.status = "queued"   # queued, running, done, error, timeout, cancelled
+        self.step = None          # title of the last finished step
+        self.solution = None
+        self.error = None
+        self.started = None
+        self.finished = None
+
+    def done(self):
+        return self.finished is not None
+
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+
+class _Worker:
+    def __init__(self):
+        self.conn, child = _context.Pipe()
+        self.process = _context.Process(target=_worker_main, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+        self.job = None
+        self.retiring = False
+
+    def kill(self):
+        self.process.kill()
+        self.conn.close()
+
+
+class SolverPool:
+    def __init__(self, size=poolSize, timeout=defaultTimeout):
+        self.size = size
+        self.timeout = timeout
+        self.workers = []
+        self.queue = deque()
+        self.ids = itertools.count(1)
+
+    def warm(self):
+        # Start every worker now so SymPy is imported before the first solve
+        while len(self.workers) < self.size:
+            self.workers.append(_Worker())
+
+    def submit(self, code, task, inputs, timeout=None):
+        job = Job(next(self.ids), code, task, dict(inputs), timeout)
+        self.queue.append(job)
+        self._dispatch()
+        return job
+
+    def cancel(self, job):
+        if job.done():
+            return
+        if job in self.queue:
+            self.queue.remove(job)
+        for worker in self.workers:
+            if worker.job is job:
+                self._replace(worker)
+        self._finish(job, "cancelled")
+        self._dispatch()
+
+    def poll(self):
+        # Collects messages from the workers and enforces timeouts.
+        # Must be called from one thread only (the Tk thread, via after()).
+        for worker in list(self.workers):
+            job = worker.job
+            if job is None:
+                continue
+            try:
+                while job is not None and worker.conn.poll():
+                    kind, job_id, value = worker.conn.recv()
+                    if job_id != job.id:
+                        continue
+                    if kind == "start":
+                        if value is not None:
+                            job.timeout = value
+                    elif kind == "step":
+                        job.step = value
+                    elif kind == "retire":
+                        worker.retiring = True
+                    else:
+                        if kind == "done":
+                            job.solution = value
+                        else:
+                            job.error = value
+                        self._finish(job, kind)
+                        worker.job = job = None
+                        if worker.retiring:
+                            self._replace(worker)
+                            break
+            except (EOFError, OSError):
+                # The worker died (out of memory, killed from outside, ...)
+                job.error = RuntimeError("The solver process stopped unexpectedly.")
+                self._replace(worker)
+                self._finish(job, "error")
+                continue
+
+            if job is not None and job.elapsed() > (job.timeout or self.timeout):
+                self._replace(worker)
+                self._finish(job, "timeout")
+        self._dispatch()
+
+    def shutdown(self):
+        for worker in self.workers:
+            worker.kill()
+        self.workers = []
+        for job in self.queue:
+            self._finish(job, "cancelled")
+        self.queue.clear()
+
+    def _dispatch(self):
+        while self.queue:
+            worker = next((w for w in self.workers if w.job is None), None)
+            if worker is None:
+                if len(self.workers) >= self.size:
+                    return
+                worker = _Worker()
+                self.workers.append(worker)
+            job = self.queue.popleft()
+            worker.job = job
+            job.status = "running"
+            job.started = time.perf_counter()
+            worker.conn.send((job.id, job.code, job.task, job.inputs))
+
+    def _replace(self, worker):
+        worker.kill()
+        self.workers.remove(worker)
+        self.workers.append(_Worker())
+
+    def _finish(self, job, status):
+        job.status = status
+        if job.started is None:
+            job.started = time.perf_counter()
+        job.finished = time.perf_counter()
+
+
+_pool = None
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        _pool = SolverPool()
+    return _pool
+
+
+#+++++++++++++++ Tk Glue +++++++++++++++++++
+class BackgroundSolve:
+    # Runs one solve at a time for a window. The pool is polled with after(),
+    # so on_status(text) and on_done(job) are always called on the Tk thread.
+    def __init__(self, widget, code, on_done, on_status):
+        self.widget = widget
+        self.code = code
+        self.on_done = on_done
+        self.on_status = on_status
+        self.job = None
+        self.after_id = None
+
+    def busy(self):
+        return self.job is not None and not self.job.done()
+
+    def start(self, task, inputs):
+        self.cancel()
+        self.job = get_pool().submit(self.code, task, inputs)
+        self.on_status("Starting solver...")
+        self.after_id = self.widget.after(pollInterval, self._check)
+
+    def cancel(self):
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+        if self.busy():
+            get_pool().cancel(self.job)
+            self.on_done(self.job)
+
+    def _check(self):
+        self.after_id = None
+        job = self.job
+        get_pool().poll()
+        if job.done():
+            self.on_done(job)
+            return
+
+        if job.status == "queued":
+            text = "Waiting for a free solver..."
+        else:
+            text = f"Solving... {job.elapsed():.1f} s (stops at {job.timeout or get_pool().timeout:.0f} s)"
+            if job.step:
+                text += f"\nDone: {job.step}"
+        self.on_status(text)
+        self.after_id = self.widget.after(pollInterval, self._check)
@@ -0,0 +1,148 @@
+from solvers import ModuleSolvers
+
+#+++++++++++++++ APM1513 Code Generators +++++++++++++++++++
+# The input is the raw text box ("Input"); the solution is Octave code
+module = ModuleSolvers(
+    "APM1513",
+    errorText="% Error generating code: {error}",
+    missingText="% Code generation for {task} not implemented yet."
+)
+
+
+def parse_matrix(text):
+    # Helper to parse matrix text into list of lists
+    matrix = []
+    rows = text.strip().split('\n')
+    for row in rows:
+        if not row.strip() or row.strip().startswith("#"): continue
+        try:
+            matrix.append([float(x) for x in row.split()])
+        except ValueError:
+            pass
+    return matrix
+
+
+def format_octave_matrix(matrix):
+    # Converts [[1,2],[3,4]] to "[1 2; 3 4]" string for Octave
+    row_strs = []
+    for row in matrix:
+        row_strs.append(" ".join(str(x) for x in row))
+    return "[" + "; ".join(row_strs) + "]"
+
+
+# ================= SYSTEMS =================
+@module.task("Direct Method (Ax=b)")
+def direct_method(inputs, sol):
+    parts = inputs["Input"].split('\n\n')
+    if len(parts) < 2:
+        sol.add("% Error: Separate A and b with a blank line in input box.")
+        return
+
+    matrix_A = parse_matrix(parts[0])
+    vector_b = parse_matrix(parts[1])
+
+    str_A = format_octave_matrix(matrix_A)
+    str_b = format_octave_matrix(vector_b)
+
+    sol.add(f"""% Octave Script: Solve Ax = b
+A = {str_A};
+b = {str_b};
+
+% Solve using left division operator
+x = A \\ b;
+
+disp("Solution vector x:");
+disp(x);
+""", title="Octave Script")
+
+
+@module.task("Solve LP (glpk)")
+def linear_programming(inputs, sol):
+    # Expecting c, A, b
+    parts = inputs["Input"].split('\n\n')
+    if len(parts) < 3:
+        sol.add("% Error: Separate c, A, and b with blank lines.")
+        return
+
+    str_c = format_octave_matrix(parse_matrix(parts[0]))
+    str_A = format_octave_matrix(parse_matrix(parts[1]))
+    str_b = format_octave_matrix(parse_matrix(parts[2]))
+
+    sol.add(f"""% Octave Script: Linear Programming (Simplex)
+c = {str_c}';  % Objective function coefficients
+A = {str_A};   % Constraint matrix
+b = {str_b};   % Constraint limits
+
+% Standard bounds (x >= 0)
+lb = [0; 0]; 
+ub = []; 
+ctype = "UU"; % Upper bounds constraints
+vartype = "CC"; % Continuous variables
+s = -1; % Maximize (-1) or Minimize (1)
+
+[xmax, fmax] = glpk(c, A, b, lb, ub, ctype, vartype, s);
+
+disp("Optimal x:");
+disp(xmax);
+disp("Maximum Value:");
+disp(fmax);
+""", title="Octave Script")
+
+
+# ================= SINGLE MATRIX OPERATIONS =================
+singleMatrixScripts = {
+    "Calculate Determinant": """% Calculate Determinant
+A = {A};
+d = det(A);
+disp("Determinant:");
+disp(d);
+""",
+    "Find Matrix Inverse": """% Calculate Inverse
+A = {A};
+if det(A) == 0
+    disp("Matrix is singular, no inverse.");
+else
+    invA = inv(A);
+    disp("Inverse Matrix:");
+    disp(invA);
+end
+""",
+    "Calculate Trace": """% Calculate Trace
+A = {A};
+t = trace(A);
+disp("Trace:");
+disp(t);
+""",
+    "Transpose Matrix": """% Transpose
+A = {A};
+AT = A';
+disp("Transposed Matrix:");
+disp(AT);
+""",
+    "Calculate Eigenvalues": """% Eigenvalues and Eigenvectors
+A = {A};
+[V, D] = eig(A);
+disp("Eigenvalues (Diagonal of D):");
+disp(diag(D));
+disp("Eigenvectors (Columns of V):");
+disp(V);
+""",
+    "Method of Least Squares": """% Least Squares Solution (Overdetermined)
+A = {A};
+% Note: You need a b vector. Assuming placeholder b.
+b = ones(rows(A), 1); 
+x = (A' * A) \\ (A' * b);
+disp("Least Squares Solution x:");
+disp(x);
+""",
+}
+
+
+@module.task(*singleMatrixScripts)
+def single_matrix(inputs, sol):
+    matrix = parse_matrix(inputs["Input"])
+    if not matrix:
+        sol.add("% Error: Invalid Matrix Input")
+        return
+    sol.add(singleMatrixScripts[sol.task].format(A=format_octave_matrix(matrix)), title="Octave Script")
+    sol.answer["matrix"] = matrix
@@ -0,0 +1,286 @@
+from solvers import ModuleSolvers, SolverInputError, flag
+from logicEngine import compile_formula, to_text, table_header, table_lines, summary_lines
+from satSolver import sat_summary_lines, SatAnalysis
+from setEngine import power_set_estimate, iter_subsets, format_subset, format_bytes
+from setEngine import BitRelation, parse_elements, parse_pairs, format_pairs, inverse_pairs, join_pairs
+
+#+++++++++++++++ COS1501 Solvers +++++++++++++++++++
+module = ModuleSolvers("COS1501", errorText="Error: {error}\nCheck input format.", missingText="Logic coming soon.")
+
+# Formulas with more variables than this skip enumeration and go to the SAT solver
+maxEnumerationVariables = 20
+# Longest list of pairs / classes written out before it is cut short
+maxListedPairs = 50
+
+
+def power_set_input(inputs):
+    # Distinct elements in input order, plus the optional subset size k
+    A = parse_elements(inputs["Set A"])
+    k_str = str(inputs.get("Only size k", "")).strip()
+    if not k_str:
+        return A, None
+    try:
+        k = int(k_str)
+    except ValueError:
+        raise SolverInputError("Size k must be a whole number.")
+    return A, k
+
+
+# ================= LOGIC =================
+@module.task("Generate Truth Table", "Check Tautology/Contradiction")
+def truth_table(inputs, sol):
+    task = sol.task
+    summary_only = flag(inputs.get("Summary only", False))
+
+    # Parse once and evaluate every row in a single bit-parallel pass
+    formula = compile_formula(inputs["Expression"])
+    n = len(formula.variables)
+
+    sol.add(f"Parsed: {to_text(formula.tree)}\n"
+            f"Variables: {n}  =>  2^{n} rows\n\n", title="Parse")
+    sol.answer["variables"] = list(formula.variables)
+
+    if n > maxEnumerationVariables:
+        # Too many rows to enumerate: ask the SAT solver instead
+        if "Truth Table" in task and not summary_only:
+            sol.add(f"A table with 2^{n} rows is too large to list; showing the SAT analysis instead.\n\n")
+        analysis = SatAnalysis(formula.tree, formula.variables)
+        sol.add("".join(sat_summary_lines(analysis)), title="SAT Analysis")
+        sol.answer["classification"] = analysis.classify()
+        return
+
+    sol.answer["classification"] = formula.classify()
+    sol.answer["true_rows"] = formula.true_count()
+    if summary_only:
+        sol.add("".join(summary_lines(formula)), title="Conclusion")
+        return
+
+    # Rows are only turned into text when displayed
+    sol.add(table_header(formula))
+    sol.add_listing(lambda a, b: table_lines(formula, a, b), formula.row_count, title="Truth Table")
+    if "Tautology" in task:
+        sol.add("\n" + "".join(summary_lines(formula)), title="Conclusion")
+
+
+# ================= SETS =================
+@module.task("Set Operations (Union, Intersect)")
+def set_operations(inputs, sol):
+    A = parse_elements(inputs["Set A"])
+    B = parse_elements(inputs["Set B"])
+    inA, inB = set(A), set(B)
+
+    # Results keep the order elements were typed in
+    results = [
+        ("Union (A u B)", A + tuple(x for x in B if x not in inA)),
+        ("Intersection (A n B)", tuple(x for x in A if x in inB)),
+        ("Difference (A - B)", tuple(x for x in A if x not in inB)),
+        ("Difference (B - A)", tuple(x for x in B if x not in inA)),
+        ("Symmetric Diff (A + B)", tuple(x for x in A if x not in inB) + tuple(x for x in B if x not in inA)),
+    ]
+
+    sol.add(f"Set A: {format_subset(A)}\nSet B: {format_subset(B)}\n\n")
+    for name, result in results:
+        sol.add(f"{name}: {format_subset(result)}\n", title=name)
+        sol.answer[name] = list(result)
+
+
+@module.task("Power Set Generator")
+def power_set(inputs, sol):
+    A, k = power_set_input(inputs)
+    n = len(A)
+
+    # Report the size before generating anything
+    count, object_bytes, text_bytes = power_set_estimate(A, k)
+    intro = f"Set A = {format_subset(A)}  (n = {n})\n"
+    if k is None:
+        intro += f"Power Set P(A) (Size 2^{n} = {count}):\n"
+    else:
+        intro += f"Subsets of size {k} (C({n}, {k}) = {count}):\n"
+    intro += f"  Memory to store them all as sets: ~{format_bytes(object_bytes)}\n"
+    intro += f"  Size when written out as text: ~{format_bytes(text_bytes)}\n"
+    intro += "  (Subsets are generated one page at a time, nothing is stored.)\n\n"
+    sol.add(intro, title="Size")
+    sol.answer["count"] = count
+
+    sol.add_listing(
+        lambda a, b: (format_subset(s) + "\n" for s in iter_subsets(A, k, a, b)),
+        count, title="Subsets"
+    )
+
+
+# ================= RELATIONS =================
+@module.task("Check Properties (Reflexive, etc.)")
+def relation_properties(inputs, sol):
+    A = parse_elements(inputs["Set A"])
+    R = BitRelation(A, parse_pairs(inputs["Relation R"]))
+
+    sol.add(f"Set A: {format_subset(A)}  (|A| = {len(A)})\n"
+            f"Relation R: {format_pairs(R.pairs(), maxListedPairs)}  (|R| = {R.size()})\n\n")
+
+    # Reflexive
+    is_refl = R.is_reflexive()
+    text = f"Reflexive: {'YES' if is_refl else 'NO'}\n"
+    if not is_refl:
+        a = R.missing_reflexive()[0]
+        text += f"  Counterexample: ({a},{a}) is missing.\n"
+    sol.add(text, title="Reflexive")
+
+    # Irreflexive
+    is_irrefl = R.is_irreflexive()
+    text = f"Irreflexive: {'YES' if is_irrefl else 'NO'}\n"
+    if not is_irrefl:
+        a = next(e for e in A if (e, e) in R)
+        text += f"  Counterexample: ({a},{a}) is in R.\n"
+    sol.add(text, title="Irreflexive")
+
+    # Symmetric
+    sym_ce = R.symmetry_counterexample()
+    text = f"Symmetric: {'YES' if sym_ce is None else 'NO'}\n"
+    if sym_ce is not None:
+        a, b = sym_ce
+        text += f"  Counterexample: ({a},{b}) is in R but ({b},{a}) is not.\n"
+    sol.add(text, title="Symmetric")
+
+    # Antisymmetric
+    anti_ce = R.antisymmetry_counterexample()
+    text = f"Antisymmetric: {'YES' if anti_ce is None else 'NO'}\n"
+    if anti_ce is not None:
+        a, b = anti_ce
+        text += f"  Counterexample: both ({a},{b}) and ({b},{a}) are in R.\n"
+    sol.add(text, title="Antisymmetric")
+
+    # Transitive
+    trans_ce = R.transitivity_counterexample()
+    is_trans = trans_ce is None
+    text = f"Transitive: {'YES' if is_trans else 'NO'}\n"
+    if not is_trans:
+        (a, b), (_, c) = trans_ce
+        text += f"  Counterexample: ({a},{b}) and ({b},{c}) are in R, but ({a},{c}) is not.\n"
+    sol.add(text, title="Transitive")
+
+    # Equivalence relation / partial order
+    is_sym = sym_ce is None
+    is_anti = anti_ce is None
+    is_equiv = is_refl and is_sym and is_trans
+    is_order = is_refl and is_anti and is_trans
+    text = f"\nEquivalence Relation: {'YES' if is_equiv else 'NO'}\n"
+    if is_equiv:
+        for cls in R.equivalence_classes()[:maxListedPairs]:
+            text += f"  [{cls[0]}] = {format_subset(cls)}\n"
+    text += f"Partial Order: {'YES' if is_order else 'NO'}\n"
+    if is_order:
+        text += f"  Minimal elements: {format_subset(R.minimal_elements())}\n"
+        text += f"  Maximal elements: {format_subset(R.maximal_elements())}\n"
+    sol.add(text, title="Classification")
+
+    # Closures: list only the pairs that had to be added
+    text = "\nClosures (pairs added to R):\n"
+    for name, closure in (("Reflexive", R.reflexive_closure()),
+                          ("Symmetric", R.symmetric_closure()),
+                          ("Transitive", R.transitive_closure())):
+        added = closure.difference(R)
+        text += f"  {name} closure (+{added.size()}): {format_pairs(added.pairs(), maxListedPairs)}\n"
+    sol.add(text, title="Closures")
+
+    sol.answer.update({
+        "reflexive": is_refl, "irreflexive": is_irrefl, "symmetric": is_sym, "antisymmetric": is_anti,
+        "transitive": is_trans, "equivalence": is_equiv, "partial_order": is_order,
+    })
+
+
+@module.task("Find Inverse Relation")
+def inverse_relation(inputs, sol):
+    R = parse_pairs(inputs["Relation R"])
+    inverse = inverse_pairs(R)
+
+    sol.add(f"Relation R: {format_pairs(R, maxListedPairs)}  (|R| = {len(R)})\n\n"
+            "Definition: R^-1 = {(b,a) | (a,b) in R}\n\n")
+
+    text = "1. Swap the components of every pair:\n"
+    for (a, b), (c, d) in list(zip(R, inverse))[:maxListedPairs]:
+        text += f"   ({a},{b})  ->  ({c},{d})\n"
+    if len(R) > maxListedPairs:
+        text += f"   ... ({len(R) - maxListedPairs} more)\n"
+    sol.add(text, title="Swap the components of every pair")
+
+    sol.add(f"\n2. Result:\n   R^-1 = {format_pairs(inverse, maxListedPairs)}\n"
+            "   (The domain of R^-1 is the range of R, and vice versa.)\n", title="Result")
+    sol.answer["inverse"] = inverse
+
+
+@module.task("Composition of Relations")
+def composition(inputs, sol):
+    R = parse_pairs(inputs["Relation R"])
+    S = parse_pairs(inputs["Relation S"])
+
+    sol.add(f"Relation R: {format_pairs(R, maxListedPairs)}  (|R| = {len(R)})\n"
+            f"Relation S: {format_pairs(S, maxListedPairs)}  (|S| = {len(S)})\n\n"
+            "Definition: S o R = {(a,c) | (a,b) in R and (b,c) in S}\n\n")
+
+    text = "1. Match each (a,b) in R with every (b,c) in S:\n"
+    composed = {}
+    matches = 0
+    for a, b, c in join_pairs(R, S):
+        if matches < maxListedPairs:
+            text += f"   ({a},{b}) in R, ({b},{c}) in S  =>  ({a},{c})\n"
+        matches += 1
+        composed[(a, c)] = None
+    if matches > maxListedPairs:
+        text += f"   ... ({matches - maxListedPairs} more matches)\n"
+    if not matches:
+        text += "   No second component of R is a first component of S.\n"
+    sol.add(text, title="Match pairs")
+
+    sol.add(f"\n2. Result:\n   S o R = {format_pairs(composed, maxListedPairs)}  ({len(composed)} pairs)\n", title="Result")
+    sol.answer["composition"] = list(composed)
+
+    k_str = str(inputs.get("Power k", "")).strip()
+    if k_str:
+        try:
+            k = int(k_str)
+        except ValueError:
+            k = 0
+        if k < 1:
+            raise SolverInputError("Power k must be a whole number >= 1")
+        elements = list(dict.fromkeys(e for pair in R for e in pair))
+        power = BitRelation(elements, R).power(k)
+        sol.add(f"\n3. Power R^{k} (R composed with itself, by repeated squaring):\n"
+                f"   R^{k} = {format_pairs(power.pairs(), maxListedPairs)}  ({power.size()} pairs)\n", title="Power")
+        sol.answer["power"] = list(power.pairs())
+
+
+# ================= FUNCTIONS =================
+@module.task("Check Function Properties")
+def function_properties(inputs, sol):
+    A = set(parse_elements(inputs["Domain A"]))
+    B = set(parse_elements(inputs["Codomain B"]))
+    pairs = dict.fromkeys(parse_pairs(inputs["Function f (pairs)"]))
+
+    f = {}
+    valid_func = True
+    for a, b in pairs:
+        if a in f: valid_func = False # One-to-many check
+        f[a] = b
+
+    # Domain Check
+    if set(f.keys()) != A:
+        sol.add("NOT a Function (Domain mismatch)\n")
+        sol.answer["function"] = False
+    elif not valid_func:
+        sol.add("NOT a Function (One element maps to multiple)\n")
+        sol.answer["function"] = False
+    else:
+        sol.add("Valid Function: YES\n")
+
+        # Injective (One-to-One)
+        values = list(f.values())
+        is_inj = len(values) == len(set(values))
+        sol.add(f"Injective: {'YES' if is_inj else 'NO'}\n", title="Injective")
+
+        # Surjective (Onto)
+        is_sur = set(values) == B
+        sol.add(f"Surjective: {'YES' if is_sur else 'NO'}\n", title="Surjective")
+
+        # Bijective
+        sol.add(f"Bijective: {'YES' if (is_inj and is_sur) else 'NO'}\n", title="Bijective")
+        sol.answer.update({"function": True, "injective": is_inj, "surjective": is_sur, "bijective": is_inj and is_sur})
@@ -0,0 +1,611 @@
+import math
+from fractions import Fraction
+from solvers import ModuleSolvers, SolverInputError, numbers
+from matrixEngine import MatrixSyntaxError, SingularMatrixError, parse_number, parse_matrix, parse_vector, to_float
+from matrixEngine import fmt, format_matrix, lu_decompose, back_substitute, integer_solve, classify, numpy_solve, residual
+from matrixEngine import determinant, cofactor_expansion, float_log_determinant
+from matrixEngine import multiply, chain_order, parenthesize, chain_multiply
+from vectorEngine import VectorSyntaxError, parse_pairs, read_pairs_csv, parse_operations, batch_operations
+from matrixEngine import exactLimit, numpyLimit
+
+#+++++++++++++++ MAT1503 Solvers +++++++++++++++++++
+module = ModuleSolvers("MAT1503")
+
+
+# ================= MATRICES & SYSTEMS =================
+@module.task("Solve 2x2 System (Cramer's Rule)")
+def cramer_2x2(inputs, sol):
+    data, exact = read_numbers(inputs, ["a", "b", "e", "c", "d", "f"], 2)
+    a, b, e = data["a"], data["b"], data["e"]
+    c, d, f = data["c"], data["d"], data["f"]
+
+    detA = a*d - b*c
+    dx = e*d - b*f
+    dy = a*f - e*c
+
+    sol.add("TOPIC: CRAMER'S RULE (2x2)\n----------------------------\n"
+            f"System:\n   {fmt(a)}x + {fmt(b)}y = {fmt(e)}\n   {fmt(c)}x + {fmt(d)}y = {fmt(f)}\n\n")
+    sol.add("1. Calculate Determinant D:\n"
+            f"   D = (a*d) - (b*c) = ({fmt(a)}*{fmt(d)}) - ({fmt(b)}*{fmt(c)}) = {fmt(detA)}\n\n", title="Calculate Determinant D")
+    sol.answer["D"] = result(detA, exact)
+
+    if detA == 0:
+        sol.add("   Since D = 0, the system has no unique solution.\n", title="Conclusion")
+        return
+
+    x, y = dx / detA, dy / detA
+    sol.add("2. Calculate Dx (Replace x-column with constants):\n"
+            f"   Dx = (e*d) - (b*f) = ({fmt(e)}*{fmt(d)}) - ({fmt(b)}*{fmt(f)}) = {fmt(dx)}\n\n", title="Calculate Dx")
+    sol.add("3. Calculate Dy (Replace y-column with constants):\n"
+            f"   Dy = (a*f) - (e*c) = ({fmt(a)}*{fmt(f)}) - ({fmt(e)}*{fmt(c)}) = {fmt(dy)}\n\n", title="Calculate Dy")
+    sol.add("4. Solve for x and y:\n"
+            f"   x = Dx / D = {fmt(dx)} / {fmt(detA)} = {rounded(x, exact)}\n"
+            f"   y = Dy / D = {fmt(dy)} / {fmt(detA)} = {rounded(y, exact)}\n", title="Solve for x and y")
+    sol.answer.update({"x": result(x, exact), "y": result(y, exact)})
+
+
+# Largest system whose row operations are written out
+stepLimit = 6
+
+
+def read_matrix(text, name):
+    try:
+        return parse_matrix(text)
+    except MatrixSyntaxError as e:
+        raise SolverInputError(f"{name}: {e}")
+
+
+def read_vector(text, name):
+    try:
+        return parse_vector(text)
+    except MatrixSyntaxError as e:
+        raise SolverInputError(f"{name}: {e}")
+
+
+def arithmetic_mode(text, size):
+    # "exact", "float" or "auto" (exact up to exactLimit x exactLimit)
+    mode = (text or "auto").strip().lower()
+    if mode not in ("auto", "exact", "float"):
+        raise SolverInputError("Mode must be auto, exact or float.")
+    if mode == "auto":
+        return size <= exactLimit
+    return mode == "exact"
+
+
+def read_numbers(inputs, names, size):
+    # The named inputs as Fractions, or floats in float mode: ({name: value}, exact)
+    exact = arithmetic_mode(inputs.get("Mode"), size)
+    try:
+        values = {name: parse_number(inputs[name]) for name in names}
+    except MatrixSyntaxError:
+        raise SolverInputError("Please enter valid numbers (e.g. 3, -1/2 or 0.25).")
+    if not exact:
+        values = {name: float(v) for name, v in values.items()}
+    return values, exact
+
+
+def result(value, exact):
+    # Answers are fraction strings ("-7/10") in exact mode and floats otherwise
+    return fmt(value) if exact else value
+
+
+def rounded(value, exact):
+    # Final values as shown: exact fractions, or two decimals in float mode
+    return fmt(value) if exact else f"{value:.2f}"
+
+
+@module.task("Solve Linear System (n x n)")
+def linear_system(inputs, sol):
+    A = read_matrix(inputs["Matrix A"], "Matrix A")
+    b = read_vector(inputs["Vector b"], "Vector b")
+    n = len(A)
+    if len(A[0]) != n:
+        raise SolverInputError(f"A must be square (it is {n} x {len(A[0])}).")
+    if len(b) != n:
+        raise SolverInputError(f"b needs {n} entries to match A (it has {len(b)}).")
+    exact = arithmetic_mode(inputs.get("Mode"), n)
+    if not exact:
+        A, b = to_float(A), [float(v) for v in b]
+    show = n <= stepLimit
+
+    sol.add("TOPIC: LINEAR SYSTEM Ax = b\n---------------------------\n"
+            f"{n} equations in {n} unknowns, "
+            + ("exact fractions\n\n" if exact else "floating point\n\n"))
+    if show:
+        sol.add("Augmented matrix [A | b]:\n" + format_matrix([row + [v] for row, v in zip(A, b)], split=n) + "\n")
+
+    x, steps = None, ([] if show else None)
+    if not exact and n >= numpyLimit:
+        x = numpy_solve(A, b)
+        if x is not None:
+            sol.add("1. LU decomposition with partial pivoting (NumPy / LAPACK)\n\n", title="LU Decomposition")
+    if x is None and exact and not show:
+        try:
+            x = integer_solve(A, b)
+        except SingularMatrixError as e:
+            singular_system(A, b, exact, show, e, sol)
+            return
+        sol.add("1. Fraction-free elimination on integer rows, each divided by its gcd,\n"
+                "   then back substitution over one common denominator\n\n", title="Elimination")
+    if x is None:
+        try:
+            lu = lu_decompose(A, [[v] for v in b], exact, steps)
+        except SingularMatrixError as e:
+            singular_system(A, b, exact, show, e, sol)
+            return
+        text = "1. Row reduce to upper triangular form (LU with partial pivoting):\n"
+        sol.add(text + ("".join(steps) if show else f"   {n - 1} elimination passes, {lu.swaps} row swaps\n\n"),
+                title="LU Decomposition")
+        if show:
+            sol.add("   L (multipliers) =\n" + format_matrix(lu.lower) +
+                    "   U =\n" + format_matrix([row[:n] for row in lu.upper]) +
+                    "   Row order P: " + ", ".join(f"R{p + 1}" for p in lu.perm) + "\n\n", title="L and U")
+        steps = [] if show else None
+        x = back_substitute(lu.upper, n, steps)
+        if show:
+            sol.add("2. Back substitution:\n" + "".join(steps) + "\n", title="Back substitution")
+
+    sol.add("Solution:\n" + "".join(f"   x{i + 1} = {fmt(v)}\n" for i, v in enumerate(x)), title="Solution")
+    sol.answer.update({"kind": "unique", "x": [fmt(v) for v in x] if exact else x})
+    if not exact:
+        error = residual(A, x, b)
+        sol.add(f"\nCheck: largest |Ax - b| = {error:.3g}\n", title="Check")
+        sol.answer["residual"] = error
+
+
+def singular_system(A, b, exact, show, error, sol):
+    # No pivot in some column: row reduce [A | b] fully to see whether there
+    # are no solutions or infinitely many
+    sol.add(f"1. Elimination stops: {error}, so det(A) = 0.\n"
+            "   Reduce [A | b] to reduced row echelon form:\n", title="Singular Matrix")
+    steps = [] if show else None
+    result = classify(A, b, exact, steps)
+    if show:
+        sol.add("".join(steps))
+    if result.kind == "none":
+        sol.add(f"2. Row {result.conflict + 1} reads 0 = (nonzero): the system is inconsistent.\n"
+                "   => No solution.\n", title="Conclusion")
+    else:
+        names = ", ".join(f"x{j + 1}" for j in result.free)
+        text = (f"2. Consistent with {len(result.free)} free variable(s): {names}\n"
+                "   => Infinitely many solutions:\n"
+                f"   x = {[fmt(v) for v in result.x]}\n")
+        text += "".join(f"       + t{k + 1} * {[fmt(v) for v in vector]}\n" for k, vector in enumerate(result.basis))
+        sol.add(text, title="Conclusion")
+        sol.answer.update({"particular": [fmt(v) for v in result.x],
+                           "null_space": [[fmt(v) for v in vector] for vector in result.basis]})
+    sol.answer["kind"] = result.kind
+
+
+# Largest product whose entries are worked out one dot product at a time
+entryStepLimit = 16
+# Largest matrix printed in full
+shownSize = 12
+
+
+def shape(M):
+    return f"{len(M)} x {len(M[0])}"
+
+
+def show_matrix(name, M):
+    if max(len(M), len(M[0])) <= shownSize:
+        return f"{name} ({shape(M)}) =\n" + format_matrix(M)
+    return f"{name} is {shape(M)} (too large to print)\n"
+
+
+@module.task("Matrix Multiplication")
+def matrix_multiplication(inputs, sol):
+    A = read_matrix(inputs["Matrix A"], "Matrix A")
+    B = read_matrix(inputs["Matrix B"], "Matrix B")
+    if len(A[0]) != len(B):
+        raise SolverInputError(f"Cannot multiply {shape(A)} by {shape(B)}: "
+                               "A needs as many columns as B has rows.")
+    m, k, n = len(A), len(B), len(B[0])
+    exact = arithmetic_mode(inputs.get("Mode"), max(m, k, n))
+    if not exact:
+        A, B = to_float(A), to_float(B)
+
+    sol.add("TOPIC: MATRIX MULTIPLICATION\n----------------------------\n"
+            f"({m} x {k}) times ({k} x {n}) gives {m} x {n}, "
+            + ("exact fractions\n\n" if exact else "floating point\n\n"))
+    sol.add(show_matrix("A", A) + show_matrix("B", B) + "\n")
+
+    steps = [] if m * n <= entryStepLimit and k <= stepLimit else None
+    C = multiply(A, B, exact, steps)
+    if steps is not None:
+        sol.add("1. Each entry c_ij is row i of A dotted with column j of B:\n" + "".join(steps) + "\n",
+                title="Dot Products")
+    else:
+        sol.add(f"1. {m * n} dot products of length {k} ({m * k * n} multiplications)\n\n", title="Dot Products")
+    sol.add(show_matrix("Result C = AB", C), title="Result")
+    sol.answer["product"] = [[fmt(v) for v in row] for row in C] if exact else C
+
+
+@module.task("Matrix Chain Product")
+def matrix_chain(inputs, sol):
+    # Matrices separated by "|", multiplied in the order that needs the
+    # fewest scalar multiplications
+    texts = [t for t in inputs["Matrices"].split("|") if t.strip()]
+    if len(texts) < 2:
+        raise SolverInputError("Give at least two matrices separated by |")
+    names = [chr(ord("A") + i) if i < 26 else f"M{i + 1}" for i in range(len(texts))]
+    matrices = [read_matrix(text, name) for text, name in zip(texts, names)]
+    for i in range(len(matrices) - 1):
+        if len(matrices[i][0]) != len(matrices[i + 1]):
+            raise SolverInputError(f"{names[i]} is {shape(matrices[i])} but {names[i + 1]} is "
+                                   f"{shape(matrices[i + 1])}: the inner sizes must match.")
+    dims = [len(matrices[0])] + [len(M[0]) for M in matrices]
+    exact = arithmetic_mode(inputs.get("Mode"), max(dims))
+    if not exact:
+        matrices = [to_float(M) for M in matrices]
+
+    sol.add("TOPIC: MATRIX CHAIN PRODUCT\n---------------------------\n"
+            + "".join(f"   {name}: {shape(M)}\n" for name, M in zip(names, matrices)) + "\n")
+
+    cost, split = chain_order(dims)
+    last = len(matrices) - 1
+    naive = sum(dims[0] * dims[i] * dims[i + 1] for i in range(1, last + 1))
+    order = parenthesize(split, 0, last, names)
+    sol.add("1. Choose the order (matrix-chain dynamic programming):\n"
+            "   cost(i..j) = min over s of cost(i..s) + cost(s+1..j) + rows_i * cols_s * cols_j\n"
+            f"   Best order: {order}\n"
+            f"   Scalar multiplications: {cost[0][last]} (left to right: {naive})\n\n", title="Parenthesization")
+
+    C = chain_multiply(matrices, split, exact)
+    sol.add("2. Multiply in that order.\n" + show_matrix("Result", C), title="Result")
+    sol.answer.update({"order": order, "multiplications": cost[0][last], "left_to_right": naive,
+                       "product": [[fmt(v) for v in row] for row in C] if exact else C})
+
+
+@module.task("Inverse of 2x2 Matrix")
+def inverse_2x2(inputs, sol):
+    data, exact = read_numbers(inputs, ["A11", "A12", "A21", "A22"], 2)
+    a, b, c, d = data["A11"], data["A12"], data["A21"], data["A22"]
+    det = a*d - b*c
+
+    sol.add("TOPIC: INVERSE MATRIX (2x2)\n---------------------------\n"
+            f"Matrix A = [[{fmt(a)}, {fmt(b)}], [{fmt(c)}, {fmt(d)}]]\n\n")
+    sol.add("1. Calculate Determinant:\n"
+            f"   det(A) = ad - bc = ({fmt(a)})({fmt(d)}) - ({fmt(b)})({fmt(c)}) = {fmt(det)}\n\n", title="Calculate Determinant")
+    sol.answer["det"] = result(det, exact)
+
+    if det == 0:
+        sol.add("   Since det(A) = 0, the matrix is Singular and has NO Inverse.\n", title="Conclusion")
+        return
+
+    inverse = [[d/det, -b/det], [-c/det, a/det]]
+    sol.add("2. Swap main diagonal, change signs of off-diagonal:\n"
+            f"   Adjoint = [[{fmt(d)}, {fmt(-b)}], [{fmt(-c)}, {fmt(a)}]]\n\n", title="Adjoint")
+    sol.add("3. Multiply by 1/det(A):\n"
+            f"   A^(-1) = (1/{fmt(det)}) * Adjoint\n"
+            f"   A^(-1) = [[{rounded(inverse[0][0], exact)}, {rounded(inverse[0][1], exact)}], "
+            f"[{rounded(inverse[1][0], exact)}, {rounded(inverse[1][1], exact)}]]\n",
+            title="Multiply by 1/det(A)")
+    sol.answer["inverse"] = [[result(v, exact) for v in row] for row in inverse]
+
+
+# ================= DETERMINANTS =================
+# Largest matrix whose determinant is expanded by cofactors
+cofactorLimit = 4
+
+
+@module.task("Determinant (2x2)")
+def determinant_2x2(inputs, sol):
+    data, exact = read_numbers(inputs, ["a11", "a12", "a21", "a22"], 2)
+    A = [[data["a11"], data["a12"]], [data["a21"], data["a22"]]]
+    text, det = cofactor_expansion(A, exact)
+
+    sol.add("TOPIC: DETERMINANT (2x2)\n------------------------\n"
+            "A =\n" + format_matrix(A) + "\n")
+    sol.add("Formula: det(A) = a11*a22 - a12*a21\n"
+            f"   det(A) = {text}\n", title="Formula")
+    sol.answer["det"] = result(det, exact)
+
+
+@module.task("Determinant (3x3)")
+def determinant_3x3(inputs, sol):
+    data, exact = read_numbers(inputs, list("abcdefghi"), 3)
+    A = [[data[name] for name in row] for row in ("abc", "def", "ghi")]
+    text, det = cofactor_expansion(A, exact)
+
+    sol.add("TOPIC: DETERMINANT (3x3)\n------------------------\n"
+            "A =\n" + format_matrix(A) + "\n")
+    sol.add("Cofactor expansion:\n" + text + "\n", title="Cofactor Expansion")
+    sol.answer["det"] = result(det, exact)
+
+
+@module.task("Determinant (n x n)")
+def determinant_nxn(inputs, sol):
+    A = read_matrix(inputs["Matrix A"], "Matrix A")
+    n = len(A)
+    if len(A[0]) != n:
+        raise SolverInputError(f"A must be square (it is {n} x {len(A[0])}).")
+    exact = arithmetic_mode(inputs.get("Mode"), n)
+    if not exact:
+        A = to_float(A)
+
+    sol.add("TOPIC: DETERMINANT\n------------------\n"
+            f"{n} x {n} matrix, " + ("exact fractions\n\n" if exact else "floating point\n\n"))
+    if n <= stepLimit:
+        sol.add("A =\n" + format_matrix(A) + "\n")
+
+    if n <= cofactorLimit:
+        text, det = cofactor_expansion(A, exact)
+        sol.add("1. Cofactor expansion:\n" + text + "\n\n", title="Cofactor Expansion")
+    elif exact:
+        steps = [] if n <= stepLimit else None
+        det = determinant(A, exact, steps)
+        if steps is not None:
+            sol.add("1. Bareiss elimination (fraction-free: rows are cleared of fractions,\n"
+                    "   each step divides exactly by the previous pivot, and the last entry,\n"
+                    "   with one sign change per swap, is the determinant):\n" + "".join(steps) + "\n",
+                    title="Bareiss Elimination")
+        else:
+            sol.add("1. Exact elimination on the integer-scaled matrix\n\n", title="Elimination")
+    else:
+        det = determinant(A, exact)
+        sol.add("1. LU decomposition: det(A) = (-1)^swaps * product of the pivots of U\n\n",
+                title="LU Decomposition")
+
+    if not exact and math.isinf(det):
+        sign, log = float_log_determinant(A)
+        power = math.floor(log)
+        sol.add(f"det(A) = {'-' if sign < 0 else ''}{10 ** (log - power):.6g} x 10^{power}\n"
+                "   (too large for floating point; use exact mode for every digit)\n", title="Result")
+        sol.answer["log10_abs_det"] = log
+    else:
+        sol.add(f"det(A) = {fmt(det)}\n" + ("   => A is singular (not invertible).\n" if det == 0 else ""),
+                title="Result")
+    sol.answer["det"] = fmt(det) if exact else det
+
+
+# ================= VECTORS =================
+@module.task("Dot Product")
+def dot_product(inputs, sol):
+    u, v, exact = read_pair(inputs)
+    dot_prod = sum(i*j for i, j in zip(u, v))
+    names = [f"u{i}*v{i}" for i in range(1, len(u) + 1)]
+
+    sol.add("TOPIC: DOT PRODUCT\n------------------\n"
+            f"Vectors:\n   u = {vector_text(u)}\n   v = {vector_text(v)}\n\n")
+    sol.add(f"Formula: u.v = {' + '.join(names)}\n"
+            f"   = {' + '.join(f'({fmt(a)}*{fmt(b)})' for a, b in zip(u, v))}\n"
+            f"   = {' + '.join(fmt(a * b) for a, b in zip(u, v))}\n"
+            f"   = {fmt(dot_prod)}\n", title="Formula")
+    sol.answer["dot"] = result(dot_prod, exact)
+
+
+@module.task("Cross Product")
+def cross_product(inputs, sol):
+    data, exact = read_numbers(inputs, ["u1", "u2", "u3", "v1", "v2", "v3"], 3)
+    u1, u2, u3 = data["u1"], data["u2"], data["u3"]
+    v1, v2, v3 = data["v1"], data["v2"], data["v3"]
+
+    cx = u2*v3 - u3*v2
+    cy = u3*v1 - u1*v3
+    cz = u1*v2 - u2*v1
+
+    sol.add("TOPIC: CROSS PRODUCT\n--------------------\n"
+            f"u = {vector_text([u1, u2, u3])}, v = {vector_text([v1, v2, v3])}\n\n")
+    sol.add("Formula (Determinant method):\n"
+            "   i(u2v3 - u3v2) - j(u1v3 - u3v1) + k(u1v2 - u2v1)\n\n", title="Formula")
+    sol.add(f"1. i-component: ({fmt(u2)}*{fmt(v3)}) - ({fmt(u3)}*{fmt(v2)}) = {fmt(cx)}\n"
+            f"2. j-component: -[({fmt(u1)}*{fmt(v3)}) - ({fmt(u3)}*{fmt(v1)})] = -[{fmt(u1*v3 - u3*v1)}] = {fmt(cy)}\n"
+            f"3. k-component: ({fmt(u1)}*{fmt(v2)}) - ({fmt(u2)}*{fmt(v1)}) = {fmt(cz)}\n\n", title="Components")
+    sol.add(f"Result: u x v = {vector_text([cx, cy, cz])}\n", title="Result")
+    sol.answer["cross"] = [result(c, exact) for c in (cx, cy, cz)]
+
+
+def vector_text(v):
+    return "<" + ", ".join(fmt(c) for c in v) + ">"
+
+
+def read_pair(inputs):
+    # u and v of any dimension from "Vector u" / "Vector v" (e.g. 1 2 3 4),
+    # or 3-D from the u1..u3, v1..v3 boxes
+    if "Vector u" not in inputs:
+        data, exact = read_numbers(inputs, ["u1", "u2", "u3", "v1", "v2", "v3"], 3)
+        return [data["u1"], data["u2"], data["u3"]], [data["v1"], data["v2"], data["v3"]], exact
+    u = read_vector(inputs["Vector u"], "Vector u")
+    v = read_vector(inputs.get("Vector v", ""), "Vector v")
+    if len(u) != len(v):
+        raise SolverInputError(f"u has {len(u)} entries but v has {len(v)}.")
+    exact = arithmetic_mode(inputs.get("Mode"), len(u))
+    if not exact:
+        u, v = [float(a) for a in u], [float(b) for b in v]
+    return u, v, exact
+
+
+def exact_sqrt(value):
+    # sqrt(value) as a Fraction when value is the square of a fraction, else None
+    if isinstance(value, Fraction):
+        top, bottom = math.isqrt(value.numerator), math.isqrt(value.denominator)
+        if top * top == value.numerator and bottom * bottom == value.denominator:
+            return Fraction(top, bottom)
+    return None
+
+
+def root_text(value, root=None):
+    # sqrt(value), written exactly when it is a fraction (root, if already known)
+    root = root if root is not None else exact_sqrt(value)
+    return fmt(root) if root is not None else f"sqrt({fmt(value)})"
+
+
+@module.task("Angle Between Vectors")
+def angle_between(inputs, sol):
+    u, v, exact = read_pair(inputs)
+    dot = sum(a * b for a, b in zip(u, v))
+    uu = sum(a * a for a in u)
+    vv = sum(b * b for b in v)
+    if uu == 0 or vv == 0:
+        raise SolverInputError("The angle is undefined when u or v is the zero vector.")
+    cosine = dot / math.sqrt(uu * vv)
+    theta = math.acos(max(-1.0, min(1.0, cosine)))
+    # |u| |v| as a Fraction, or None when it is irrational (or in float mode)
+    length_product = exact_sqrt(uu * vv) if exact else None
+
+    sol.add("TOPIC: ANGLE BETWEEN VECTORS\n----------------------------\n"
+            f"u = {vector_text(u)}, v = {vector_text(v)}\n\n")
+    sol.add("Formula: cos(theta) = u.v / (|u| |v|)\n\n", title="Formula")
+    sol.add(f"1. u.v = {' + '.join(f'({fmt(a)})({fmt(b)})' for a, b in zip(u, v))} = {fmt(dot)}\n"
+            f"2. |u| = {root_text(uu)} = {math.sqrt(uu):.4f}, |v| = {root_text(vv)} = {math.sqrt(vv):.4f}\n",
+            title="Dot Product and Lengths")
+    text = f"3. cos(theta) = {fmt(dot)} / {root_text(uu * vv, length_product)}"
+    if length_product is not None:
+        text += f" = {fmt(dot / length_product)}"
+    sol.add(text + f" = {cosine:.4f}\n"
+            f"4. theta = arccos({cosine:.4f}) = {theta:.4f} radians ({math.degrees(theta):.2f} degrees)\n",
+            title="Angle")
+    if dot == 0:
+        sol.add("   u.v = 0, so u and v are orthogonal.\n")
+    sol.answer.update({"cos": cosine, "radians": theta, "degrees": math.degrees(theta)})
+
+
+@module.task("Projection of u onto v")
+def projection(inputs, sol):
+    u, v, exact = read_pair(inputs)
+    dot = sum(a * b for a, b in zip(u, v))
+    vv = sum(b * b for b in v)
+    if vv == 0:
+        raise SolverInputError("Cannot project onto the zero vector.")
+    scale = dot / vv
+    proj = [scale * b for b in v]
+    orthogonal = [a - p for a, p in zip(u, proj)]
+
+    sol.add("TOPIC: PROJECTION OF u ONTO v\n-----------------------------\n"
+            f"u = {vector_text(u)}, v = {vector_text(v)}\n\n")
+    sol.add("Formula: proj_v u = (u.v / v.v) v\n\n", title="Formula")
+    sol.add(f"1. u.v = {fmt(dot)}\n"
+            f"2. v.v = {' + '.join(f'({fmt(b)})^2' for b in v)} = {fmt(vv)}\n"
+            f"3. u.v / v.v = {fmt(dot)} / {fmt(vv)} = {fmt(scale)}\n\n", title="Scale Factor")
+    sol.add(f"proj_v u = {fmt(scale)} * {vector_text(v)} = {vector_text(proj)}\n"
+            f"Scalar component: u.v / |v| = {fmt(dot)} / {root_text(vv)} = {dot / math.sqrt(vv):.4f}\n"
+            f"Orthogonal part: u - proj_v u = {vector_text(orthogonal)}\n", title="Result")
+    sol.answer.update({"projection": [result(c, exact) for c in proj], "scalar": dot / math.sqrt(vv),
+                       "orthogonal": [result(c, exact) for c in orthogonal]})
+
+
+# Pairs shown in full in a batch; larger batches get a table
+detailLimit = 5
+# Rows of the batch table
+tableRows = 20
+
+
+def short(value):
+    if value is None:
+        return "-"
+    # + 0.0 turns -0.0 into 0.0
+    if isinstance(value, list):
+        return "<" + ", ".join(f"{c + 0.0:.4g}" for c in value) + ">"
+    return f"{value + 0.0:.4g}"
+
+
+@module.task("Vector Batch (n-D)")
+def vector_batch(inputs, sol):
+    # Many u | v pairs of any dimension, pasted or from a CSV file
+    try:
+        pairs = parse_pairs(inputs.get("Vector Pairs") or "")
+        if (inputs.get("CSV File") or "").strip():
+            pairs += read_pairs_csv(inputs["CSV File"].strip())
+        operations = parse_operations(inputs.get("Operations"))
+    except VectorSyntaxError as e:
+        raise SolverInputError(str(e))
+    if not pairs:
+        raise SolverInputError("Enter vector pairs as u | v (e.g. 1 2 3 | 4 5 6; 1 0 | 0 1) or choose a CSV file.")
+
+    results = batch_operations(pairs, operations)
+    dimensions = sorted({len(u) for u, v in pairs})
+    sol.add("TOPIC: VECTOR OPERATIONS (BATCH)\n--------------------------------\n"
+            f"{len(pairs)} pair(s), dimension {', '.join(map(str, dimensions))}; "
+            f"computing {', '.join(operations)}\n\n")
+
+    if len(pairs) <= detailLimit:
+        for i, (u, v) in enumerate(pairs):
+            text = f"Pair {i + 1}: u = {short(u)}, v = {short(v)}\n"
+            text += f"   |u| = {short(results['norm_u'][i])}, |v| = {short(results['norm_v'][i])}\n"
+            if "dot" in operations:
+                text += f"   u.v = {short(results['dot'][i])}\n"
+            if "cross" in operations:
+                text += f"   u x v = {short(results['cross'][i])}" + ("" if len(u) in (2, 3) else " (3-D only)") + "\n"
+            if "angle" in operations:
+                angle = results["angle"][i]
+                text += f"   angle = {short(angle)} degrees\n" if angle is not None else "   angle undefined (zero vector)\n"
+            if "projection" in operations:
+                proj = results["projection"][i]
+                text += f"   proj_v u = {short(proj)}\n" if proj is not None else "   proj_v u undefined (v = 0)\n"
+            sol.add(text + "\n", title=f"Pair {i + 1}")
+    else:
+        cells = [[short(results[name][i]) for name in operations] for i in range(min(tableRows, len(pairs)))]
+        widths = [max(len(name), *(len(row[j]) for row in cells)) for j, name in enumerate(operations)]
+        header = (f"{'#':>5}  " + "  ".join(name.ljust(width) for name, width in zip(operations, widths))).rstrip()
+        rows = [f"{i + 1:>5}  " + "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+                for i, row in enumerate(cells)]
+        more = f"   ... {len(pairs) - tableRows} more pairs (all values are in the answer)\n" if len(pairs) > tableRows else ""
+        sol.add(header + "\n" + "\n".join(rows) + "\n" + more + "\n", title="Results")
+
+    summary = []
+    if "dot" in operations:
+        scale = [max(a, 1.0) * max(b, 1.0) for a, b in zip(results["norm_u"], results["norm_v"])]
+        orthogonal = sum(1 for d, s in zip(results["dot"], scale) if abs(d) <= 1e-12 * s)
+        summary.append(f"Orthogonal pairs (u.v = 0): {orthogonal}")
+    if "angle" in operations:
+        angles = [a for a in results["angle"] if a is not None]
+        parallel = sum(1 for a in angles if a < 1e-6 or a > 180 - 1e-6)
+        summary.append(f"Parallel pairs (angle 0 or 180): {parallel}")
+        if angles:
+            summary.append(f"Angles from {min(angles):.2f} to {max(angles):.2f} degrees")
+        if len(angles) < len(pairs):
+            summary.append(f"Pairs with a zero vector (no angle): {len(pairs) - len(angles)}")
+    if summary:
+        sol.add("Summary:\n" + "".join(f"   {line}\n" for line in summary), title="Summary")
+    sol.answer.update({name: results[name] for name in operations})
+    sol.answer["count"] = len(pairs)
+
+
+# ================= COMPLEX NUMBERS =================
+@module.task("Convert to Polar Form")
+def polar_form(inputs, sol):
+    data = numbers(inputs)
+    a, b = data["Real Part (a)"], data["Imag Part (b)"]
+    r = math.sqrt(a**2 + b**2)
+    theta = math.atan2(b, a)
+    deg = math.degrees(theta)
+
+    sol.add("TOPIC: COMPLEX POLAR FORM\n---------------------------\n"
+            f"z = {a} + {b}i\n\n")
+    sol.add("1. Calculate Modulus |z| (r):\n"
+            f"   r = sqrt(a^2 + b^2) = sqrt({a}^2 + {b}^2)\n"
+            f"   r = sqrt({a**2 + b**2}) = {r:.4f}\n\n", title="Calculate Modulus")
+    sol.add("2. Calculate Argument (theta):\n"
+            f"   theta = atan(b/a) = atan({b}/{a})\n"
+            f"   theta = {theta:.4f} radians ({deg:.2f} degrees)\n\n", title="Calculate Argument")
+    sol.add("3. Polar Form:\n"
+            f"   z = {r:.2f}(cos({deg:.2f}°) + i*sin({deg:.2f}°))\n", title="Polar Form")
+    sol.answer.update({"r": r, "theta": theta})
+
+
+@module.task("De Moivre's Theorem (Powers)")
+def de_moivre(inputs, sol):
+    data = numbers(inputs)
+    a, b, n = data["Real Part"], data["Imag Part"], int(data["Power n"])
+    r = math.sqrt(a**2 + b**2)
+    theta = math.atan2(b, a)
+
+    sol.add("TOPIC: DE MOIVRE'S THEOREM\n--------------------------\n"
+            f"Calculate ({a} + {b}i)^{n}\n\n")
+    sol.add("1. Convert to Polar:\n"
+            f"   r = {r:.2f}, theta = {math.degrees(theta):.2f}°\n\n", title="Convert to Polar")
+    sol.add("2. Apply Theorem: z^n = r^n * (cos(n*theta) + i*sin(n*theta))\n"
+            f"   r^{n} = {r}^{n} = {r**n:.2f}\n"
+            f"   angle = {n} * {math.degrees(theta):.2f}° = {n*math.degrees(theta):.2f}°\n\n", title="Apply Theorem")
+
+    new_r = r**n
+    new_theta = n * theta
+    final_real = new_r * math.cos(new_theta)
+    final_imag = new_r * math.sin(new_theta)
+
+    sol.add("3. Convert back to Rectangular:\n"
+            f"   Real = {new_r:.2f} * cos({math.degrees(new_theta):.2f}°) = {final_real:.2f}\n"
+            f"   Imag = {new_r:.2f} * sin({math.degrees(new_theta):.2f}°) = {final_imag:.2f}\n\n", title="Convert back to Rectangular")
+    sol.add(f"Result: {final_real:.2f} + {final_imag:.2f}i\n", title="Result")
+    sol.answer.update({"real": final_real, "imag": final_imag})
@@ -0,0 +1,435 @@
+import math
+import sympy
+from sympy import symbols
+from solvers import ModuleSolvers, SolverInputError
+from solvers.cache import memoized
+from solvers.derivatives import derivative, derivatives
+from solvers.integrals import race_integral, numeric_text, cross_check, numeric_integral
+from rootEngine import find_roots
+
+#+++++++++++++++ MAT1512 Solvers +++++++++++++++++++
+module = ModuleSolvers(
+    "MAT1512",
+    errorText="Error in calculation: {error}\nCheck your syntax (e.g., use * for multiply, ** for power).",
+    missingText="Solver logic for this specific task is coming soon."
+)
+
+x, y, z = symbols('x y z')
+
+# Repeat queries (this session or earlier ones) come from solvers.cache
+# Derivatives come from solvers.derivatives, shared between tasks
+limit = memoized(sympy.limit)
+integrate = memoized(sympy.integrate)
+solve_for = memoized(sympy.solve)
+solve_set = memoized(sympy.solveset)
+
+
+# ================= LIMITS =================
+@module.task("Limit as x->a")
+def limit_at_point(inputs, sol):
+    expr_str = inputs["Function f(x)"]
+    a = float(inputs["Point a"])
+    f = sympy.sympify(expr_str)
+    res = limit(f, x, a)
+
+    sol.add("TOPIC: LIMIT OF A FUNCTION\n--------------------------\n"
+            f"Calculate limit of f(x) = {expr_str} as x -> {a}\n\n")
+    text = "1. Direct Substitution Check:\n"
+    try:
+        val = f.subs(x, a)
+        text += f"   f({a}) = {val}\n"
+    except:
+        text += f"   f({a}) is undefined or indeterminate.\n"
+    sol.add(text, title="Direct Substitution Check")
+
+    sol.add(f"\n2. Calculated Limit:\n   lim(x->{a}) = {res}\n", title="Calculated Limit")
+    sol.answer["limit"] = str(res)
+    sol.plot(f, "f(x)")
+    sol.plot_range(a - 5, a + 5)
+
+
+@module.task("Limit at Infinity")
+def limit_at_infinity(inputs, sol):
+    expr_str = inputs["Function f(x)"]
+    f = sympy.sympify(expr_str)
+    res = limit(f, x, sympy.oo)
+
+    sol.add("TOPIC: LIMIT AT INFINITY\n------------------------\n"
+            f"Calculate limit of f(x) = {expr_str} as x -> oo\n\n")
+    sol.add(f"Result: {res}\n", title="Result")
+    sol.answer["limit"] = str(res)
+    sol.plot(f, "f(x)")
+    sol.plot_range(0, 100)
+
+
+@module.task("Left/Right Hand Limits")
+def one_sided_limit(inputs, sol):
+    expr_str = inputs["Function f(x)"]
+    a = sympy.sympify(inputs["Point a"])
+    side = inputs["Direction (+ or -)"].strip().lower()
+    if side not in ("+", "-", "right", "left"):
+        raise SolverInputError("Direction must be + (from the right) or - (from the left).")
+    side = "+" if side in ("+", "right") else "-"
+    f = sympy.sympify(expr_str)
+
+    left = limit(f, x, a, "-")
+    right = limit(f, x, a, "+")
+    res = right if side == "+" else left
+    name = "right" if side == "+" else "left"
+
+    sol.add("TOPIC: ONE-SIDED LIMIT\n----------------------\n"
+            f"Calculate limit of f(x) = {expr_str} as x -> {a}{side}\n\n")
+    sol.add(f"1. Approach from the {name} (x {'>' if side == '+' else '<'} {a}):\n"
+            f"   lim(x->{a}{side}) = {res}\n\n", title="One-sided Limit")
+    other = "-" if side == "+" else "+"
+    text = (f"2. Compare with the other side:\n"
+            f"   lim(x->{a}{other}) = {left if side == '+' else right}\n")
+    if left == right and left.is_finite:
+        text += f"   Both sides agree, so lim(x->{a}) f(x) = {left}.\n"
+    else:
+        text += f"   The sides differ, so lim(x->{a}) f(x) does not exist.\n"
+    sol.add(text, title="Two-sided Limit")
+    sol.answer.update({"limit": str(res), "left": str(left), "right": str(right),
+                       "two_sided": str(left) if left == right and left.is_finite else None})
+    sol.plot(f, "f(x)")
+    sol.plot_range(float(a) - 5, float(a) + 5)
+
+
+# ================= DIFFERENTIATION =================
+@module.task("Find Derivative f'(x)")
+def first_derivative(inputs, sol):
+    expr_str = inputs["Function f(x)"]
+    f = sympy.sympify(expr_str)
+    res = derivative(f, x)
+
+    sol.add("TOPIC: DIFFERENTIATION\n----------------------\n"
+            f"Function: f(x) = {expr_str}\n\n")
+    sol.add("1. Apply Differentiation Rules:\n"
+            f"   f'(x) = d/dx [{expr_str}]\n\n", title="Apply Differentiation Rules")
+    sol.add(f"Result:\n   f'(x) = {res}\n", title="Result")
+    sol.answer["derivative"] = str(res)
+    sol.plot(f, "f(x)")
+    sol.plot(res, "f'(x)")
+
+
+@module.task("Equation of Tangent Line")
+def tangent_line(inputs, sol):
+    expr_str = inputs["Function f(x)"]
+    a = float(inputs["Point x=a"])
+    f = sympy.sympify(expr_str)
+
+    # 1. Find f(a)
+    fa = f.subs(x, a)
+    # 2. Find f'(x)
+    f_prime = derivative(f, x)
+    # 3. Find slope m = f'(a)
+    m = f_prime.subs(x, a)
+
+    sol.add("TOPIC: TANGENT LINE\n-------------------\n"
+            f"Find tangent to f(x) = {expr_str} at x = {a}\n\n")
+    sol.add(f"1. Find point coordinates:\n   f({a}) = {fa}\n   Point: ({a}, {fa})\n\n", title="Find point coordinates")
+    sol.add(f"2. Find Derivative (Slope function):\n   f'(x) = {f_prime}\n\n", title="Find Derivative")
+    sol.add(f"3. Calculate Slope at x={a}:\n   m = f'({a}) = {m}\n\n", title="Calculate Slope")
+    sol.add("4. Equation of Line (y - y1 = m(x - x1)):\n"
+            f"   y - {fa} = {m}(x - {a})\n"
+            f"   y = {m}*x + ({fa - m*a})\n", title="Equation of Line")
+    sol.answer.update({"slope": str(m), "intercept": str(fa - m*a)})
+    sol.plot(f, "f(x)")
+    sol.plot(m*x + (fa - m*a), "tangent")
+    sol.plot_point(a, fa, f"({a:g}, {float(fa):g})")
+    sol.plot_range(a - 5, a + 5)
+
+
+def equation(text):
+    # "lhs = rhs" -> lhs - rhs; a bare expression is taken as expr = 0
+    if "=" in text:
+        lhs, rhs = text.split("=", 1)
+        return sympy.sympify(lhs) - sympy.sympify(rhs)
+    return sympy.sympify(text)
+
+
+@module.task("Implicit Differentiation")
+def implicit_derivative(inputs, sol):
+    eq_str = inputs["Equation F(x,y)=0"]
+    F = equation(eq_str)
+    if F.free_symbols - {x, y}:
+        raise SolverInputError("Only x and y may appear in the equation.")
+
+    Fx, Fy = derivative(F, x), derivative(F, y)
+    if Fy == 0:
+        raise SolverInputError("The equation does not involve y.")
+    dydx = sympy.simplify(-Fx / Fy)
+
+    sol.add("TOPIC: IMPLICIT DIFFERENTIATION\n-------------------------------\n"
+            f"Equation: {eq_str}\n"
+            f"F(x,y) = {F} = 0\n\n")
+    sol.add("1. Partial derivatives of F:\n"
+            f"   F_x = {Fx}\n"
+            f"   F_y = {Fy}\n\n", title="Partial derivatives")
+    sol.add("2. Differentiate both sides (y = y(x)): F_x + F_y * dy/dx = 0\n"
+            f"   dy/dx = -F_x / F_y = {dydx}\n\n", title="dy/dx")
+
+    # y'' = -(F_xx F_y^2 - 2 F_xy F_x F_y + F_yy F_x^2) / F_y^3
+    Fxx, Fxy, Fyy = derivative(F, x, x), derivative(F, x, y), derivative(F, y, y)
+    d2ydx2 = sympy.simplify(-(Fxx * Fy**2 - 2 * Fxy * Fx * Fy + Fyy * Fx**2) / Fy**3)
+    sol.add("3. Second derivative:\n"
+            "   d2y/dx2 = -(F_xx F_y^2 - 2 F_xy F_x F_y + F_yy F_x^2) / F_y^3\n"
+            f"           = {d2ydx2}\n", title="Second derivative")
+    sol.answer.update({"dy/dx": str(dydx), "d2y/dx2": str(d2ydx2)})
+
+    # Curves that are at most quadratic in y are drawn branch by branch
+    if F.is_polynomial(y) and sympy.degree(F, y) <= 2:
+        for branch in solve_for(F, y):
+            sol.plot(branch, f"y = {branch}")
+
+
+@module.task("Higher Order Derivative")
+def higher_derivative(inputs, sol):
+    expr_str = inputs["Function f(x)"]
+    order = int(inputs["Order n"])
+    if order < 1:
+        raise SolverInputError("The order n must be a whole number of at least 1.")
+    f = sympy.sympify(expr_str)
+
+    sol.add("TOPIC: HIGHER ORDER DERIVATIVE\n------------------------------\n"
+            f"Function: f(x) = {expr_str}, order n = {order}\n\n")
+    # Each derivative is taken from the one before it (solvers.derivatives)
+    chain = derivatives(f, x, order)
+    text = "Differentiate repeatedly:\n"
+    for k, d in enumerate(chain[1:], 1):
+        text += f"   f^({k})(x) = {d}\n"
+    sol.add(text + "\n", title="Differentiate repeatedly")
+    sol.add(f"Result:\n   f^({order})(x) = {chain[-1]}\n", title="Result")
+    sol.answer["derivative"] = str(chain[-1])
+    sol.plot(f, "f(x)")
+    sol.plot(chain[-1], f"f^({order})(x)")
+
+
+# ================= INTEGRALS =================
+@module.task("Indefinite Integral")
+def indefinite_integral(inputs, sol):
+    expr_str = inputs["Function f(x)"]
+    f = sympy.sympify(expr_str)
+    res = integrate(f, x)
+
+    sol.add("TOPIC: INDEFINITE INTEGRAL\n--------------------------\n"
+            f"Integral of: {expr_str} dx\n\n")
+    sol.add("1. Find Antiderivative:\n"
+            f"   F(x) = {res} + C\n", title="Find Antiderivative")
+    sol.answer["antiderivative"] = str(res)
+    sol.plot(f, "f(x)")
+    sol.plot(res, "F(x)")
+
+
+@module.task("Definite Integral")
+def definite_integral(inputs, sol):
+    expr_str = inputs["Function f(x)"]
+    a = float(inputs["Lower Limit a"])
+    b = float(inputs["Upper Limit b"])
+    f = sympy.sympify(expr_str)
+
+    def symbolic():
+        F = integrate(f, x)
+        if F.has(sympy.Integral):
+            return None
+        val_b = F.subs(x, b)
+        val_a = F.subs(x, a)
+        return F, val_b, val_a, val_b - val_a
+
+    # Quadrature runs alongside the antiderivative search (solvers.integrals)
+    race = race_integral(f, x, a, b, symbolic)
+
+    sol.add("TOPIC: DEFINITE INTEGRAL\n------------------------\n"
+            f"Calculate Integral from {a} to {b} of {expr_str} dx\n\n")
+    if race.exact is None:
+        sol.add(f"1. Find Antiderivative F(x):\n   {race.note}; evaluating numerically instead.\n\n",
+                title="Find Antiderivative")
+        sol.add("2. Numeric Result:\n" + numeric_text(race.numeric), title="Result")
+        sol.answer["value"] = str(race.numeric.value)
+    else:
+        F, val_b, val_a, res = race.exact
+        sol.add(f"1. Find Antiderivative F(x):\n   F(x) = {F}\n\n", title="Find Antiderivative")
+        sol.add("2. Apply Fundamental Theorem (F(b) - F(a)):\n"
+                f"   F({b}) = {val_b}\n"
+                f"   F({a}) = {val_a}\n\n", title="Apply Fundamental Theorem")
+        sol.add(f"3. Result:\n   {val_b} - ({val_a}) = {res}\n", title="Result")
+        sol.answer["value"] = str(res)
+        if race.numeric is not None:
+            text, agree = cross_check(res, race.numeric)
+            sol.add("\n4. Numeric Cross-check:\n" + text, title="Numeric Cross-check")
+            sol.answer["agrees"] = agree
+    if race.numeric is not None:
+        sol.answer.update({"numeric": race.numeric.value, "error_estimate": race.numeric.error})
+    sol.plot(f, "f(x)")
+    sol.plot_region(f, 0, a, b)
+    sol.plot_range(a - (b - a) / 4, b + (b - a) / 4)
+
+
+def sign_changes(f, a, b):
+    # Zeros of f strictly inside (a, b): exact when solveset finds finitely
+    # many, otherwise (periodic f, or solveset gives up) located numerically
+    try:
+        zeros = solve_set(f, x, sympy.Interval.open(a, b))
+    except NotImplementedError:
+        zeros = None
+    if isinstance(zeros, sympy.FiniteSet) and all(r.is_real for r in zeros):
+        return sorted(zeros, key=float)
+    fn = sympy.lambdify(x, f, modules=["math", "mpmath"])
+    return [r for r in find_roots(fn, float(a), float(b))[0] if a < r < b]
+
+
+@module.task("Area Under Curve")
+def area_under_curve(inputs, sol):
+    expr_str = inputs["Function f(x)"]
+    a = sympy.sympify(inputs["Lower Limit a"])
+    b = sympy.sympify(inputs["Upper Limit b"])
+    f = sympy.sympify(expr_str)
+
+    sol.add("TOPIC: AREA UNDER A CURVE\n-------------------------\n"
+            f"Area between f(x) = {expr_str} and the x-axis for {a} <= x <= {b}\n"
+            "Formula: A = integral(|f(x)| dx)\n\n")
+
+    # Parts below the axis count positively, so split where f changes sign
+    zeros = sign_changes(f, a, b)
+    edges = [a, *zeros, b]
+    text = "1. f(x) = 0 at: " + (", ".join(str(r) for r in zeros) if zeros else "no point inside the interval") + "\n"
+    net, area = sympy.S.Zero, sympy.S.Zero
+    for lo, hi in zip(edges, edges[1:]):
+        piece = integrate(f, (x, lo, hi))
+        if piece.has(sympy.Integral):
+            piece = sympy.Float(numeric_integral(f, x, lo, hi).value)
+        text += f"   integral({lo} to {hi}) f dx = {piece}\n"
+        net += piece
+        area += sympy.Abs(piece)
+    sol.add(text + "\n", title="Split at the zeros")
+    sol.add(f"2. Net signed integral = {sympy.simplify(net)}\n\n", title="Net integral")
+    sol.add(f"3. Add the absolute values:\n   A = {sympy.simplify(area)}\n"
+            f"   A approx {float(area.evalf()):.4f} square units\n", title="Result")
+    sol.answer.update({"area": str(sympy.simplify(area)), "approx": float(area.evalf()), "net": str(sympy.simplify(net))})
+
+    sol.plot(f, "f(x)")
+    sol.plot_region(f, 0, float(a), float(b))
+    sol.plot_range(float(a) - float(b - a) / 4, float(b) + float(b - a) / 4)
+
+
+# ================= DIFFERENTIAL EQUATIONS =================
+yp = sympy.Symbol("yp")
+C = sympy.Symbol("C")
+
+
+@module.task("Separable First-Order DE")
+def separable_de(inputs, sol):
+    eq_str = inputs["Equation (use y')"]
+    eq = equation(eq_str.replace("y'", "yp"))
+    slopes = solve_for(eq, yp)
+    if not slopes:
+        raise SolverInputError("Write the equation with y', e.g. y' = x*y")
+    g = slopes[0]
+    parts = sympy.separatevars(g, [x, y], dict=True)
+    if parts is None:
+        raise SolverInputError(f"y' = {g} is not separable into X(x) * Y(y).")
+    X, Y = parts["coeff"] * parts[x], parts[y]
+
+    sol.add("TOPIC: SEPARABLE DIFFERENTIAL EQUATION\n--------------------------------------\n"
+            f"Solve {eq_str}\n\n")
+    sol.add(f"1. Write as dy/dx = X(x) * Y(y):\n   dy/dx = ({X}) * ({Y})\n\n", title="Separate")
+    sol.add(f"2. Separate the variables:\n   dy / ({Y}) = ({X}) dx\n\n", title="Separate the variables")
+
+    Gy, Gx = integrate(1 / Y, y), integrate(X, x)
+    sol.add("3. Integrate both sides:\n"
+            f"   integral dy/({Y}) = {Gy}\n"
+            f"   integral ({X}) dx = {Gx}\n"
+            f"   {Gy} = {Gx} + C\n\n", title="Integrate both sides")
+
+    text = "4. Solve for y:\n"
+    try:
+        general = solve_for(sympy.Eq(Gy, Gx + C), y)
+    except NotImplementedError:
+        general = []
+    if general:
+        text += "".join(f"   y = {s}\n" for s in general)
+        text += "   (ln|y| = ... + C gives y = A*e^(...), with A = +-e^C any nonzero constant.)\n" if Gy.has(sympy.log) else ""
+    else:
+        text += "   Cannot isolate y; the implicit solution above is the answer.\n"
+    equilibria = [] if not Y.has(y) else [e for e in solve_for(Y, y) if e.is_real]
+    if equilibria:
+        text += "   Equilibrium (constant) solutions where Y(y) = 0: " + ", ".join(f"y = {e}" for e in equilibria) + "\n"
+    sol.add(text, title="Solve for y")
+    sol.answer.update({"implicit": f"{Gy} = {Gx} + C", "general": [str(s) for s in general],
+                       "equilibria": [str(e) for e in equilibria]})
+
+    for s in general[:1]:
+        for c in (-1, 1):
+            sol.plot(s.subs(C, c), f"C = {c}")
+
+
+@module.task("Exponential Growth/Decay")
+def growth_decay(inputs, sol):
+    y0 = float(inputs["Initial Amount y0"])
+    k = float(inputs["Rate k"])
+    t = float(inputs["Time t"])
+    value = y0 * math.exp(k * t)
+
+    sol.add("TOPIC: EXPONENTIAL GROWTH / DECAY\n---------------------------------\n"
+            f"dy/dt = k*y with y(0) = {y0:g}, k = {k:g}\n\n")
+    sol.add("1. Solution of dy/dt = k*y:\n"
+            f"   y(t) = y0 * e^(k*t) = {y0:g} * e^({k:g}*t)\n\n", title="Solution")
+    sol.add(f"2. At t = {t:g}:\n"
+            f"   y({t:g}) = {y0:g} * e^({k * t:g}) = {value:.6g}\n\n", title="Evaluate")
+    if k > 0:
+        text = f"3. Growth (k > 0). Doubling time = ln 2 / k = {math.log(2) / k:.6g}\n"
+        sol.answer["doubling_time"] = math.log(2) / k
+    elif k < 0:
+        text = f"3. Decay (k < 0). Half-life = ln 2 / |k| = {math.log(2) / -k:.6g}\n"
+        sol.answer["half_life"] = math.log(2) / -k
+    else:
+        text = "3. k = 0: the amount stays constant.\n"
+    sol.add(text, title="Doubling time / Half-life")
+    sol.answer["value"] = value
+
+    sol.plot(y0 * sympy.exp(k * x), "y(t)")
+    sol.plot_point(t, value, f"t = {t:g}")
+    sol.plot_range(0, 2 * t if t > 0 else 10)
+
+
+# ================= PARTIAL DERIVATIVES =================
+@module.task("Partial Derivative fx", "Partial Derivative fy")
+def partial_derivative(inputs, sol):
+    expr_str = inputs["Function f(x,y)"]
+    f = sympy.sympify(expr_str)
+
+    if "fx" in sol.task:
+        res = derivative(f, x)
+        var = "x"
+    else:
+        res = derivative(f, y)
+        var = "y"
+
+    sol.add(f"TOPIC: PARTIAL DERIVATIVE ({var})\n-----------------------------\n"
+            f"Function f(x,y) = {expr_str}\n\n")
+    sol.add(f"Differentiate with respect to {var} (treating other variables as constants):\n\n", title="Differentiate")
+    sol.add(f"Result:\n   df/d{var} = {res}\n", title="Result")
+    sol.answer["derivative"] = str(res)
+
+
+@module.task("Second Order Partials")
+def second_partials(inputs, sol):
+    expr_str = inputs["Function f(x,y)"]
+    f = sympy.sympify(expr_str)
+
+    # f_xy is taken from the cached f_x, f_yx from f_y
+    fx, fy = derivative(f, x), derivative(f, y)
+    fxx, fyy = derivative(f, x, x), derivative(f, y, y)
+    fxy, fyx = derivative(f, x, y), derivative(f, y, x)
+
+    sol.add("TOPIC: SECOND ORDER PARTIALS\n----------------------------\n"
+            f"Function f(x,y) = {expr_str}\n\n")
+    sol.add(f"1. First partials:\n   f_x = {fx}\n   f_y = {fy}\n\n", title="First partials")
+    sol.add("2. Differentiate again:\n"
+            f"   f_xx = {fxx}\n"
+            f"   f_yy = {fyy}\n"
+            f"   f_xy = d/dy (f_x) = {fxy}\n"
+            f"   f_yx = d/dx (f_y) = {fyx}\n\n", title="Second partials")
+    same = sympy.simplify(fxy - fyx) == 0
+    sol.add("3. Mixed partials " + ("agree (Clairaut's theorem).\n" if same else "differ.\n"), title="Clairaut")
+    sol.answer.update({"f_xx": str(fxx), "f_yy": str(fyy), "f_xy": str(fxy), "f_yx": str(fyx), "mixed_equal": same})
@@ -0,0 +1,639 @@
+import sympy
+from sympy import symbols, oo
+from solvers import ModuleSolvers, SolverInputError
+from solvers.cache import memoized
+from solvers.integrals import race_integral, numeric_text, cross_check, divergent
+from solvers.taylor import taylor, NotAnalytic, remainder_bound, sample_error
+from solvers.taylor import save as taylor_save
+from solvers.convergence import SeriesAnalyzer, as_sequence
+from solvers.convergence import n as index_n
+from rootEngine import find_roots, samplePoints
+
+#+++++++++++++++ MAT1613 Solvers +++++++++++++++++++
+module = ModuleSolvers(
+    "MAT1613",
+    errorText="Calculation Error: {error}\nCheck syntax (e.g. use ** for power)",
+    missingText="Solution logic coming soon."
+)
+
+x, n = symbols('x n')
+
+# Repeat queries (this session or earlier ones) come from solvers.cache
+limit = memoized(sympy.limit)
+diff = memoized(sympy.diff)
+integrate = memoized(sympy.integrate)
+series = memoized(sympy.series)
+apart = memoized(sympy.apart)
+
+
+# ================= DERIVATIVES & LIMITS =================
+@module.task("L'Hopital's Rule (Limits)")
+def lhopital(inputs, sol):
+    func_str = inputs["Function f(x)"]
+    pt = float(inputs["Limit Point a"])
+    f = sympy.sympify(func_str)
+
+    # Check direct sub
+    try:
+        val = f.subs(x, pt)
+    except:
+        val = "undefined"
+
+    # Calculate Limit
+    lim_val = limit(f, x, pt)
+
+    sol.add("TOPIC: L'HOPITAL'S RULE\n-----------------------\n"
+            f"Limit of {func_str} as x -> {pt}\n\n")
+    sol.add(f"1. Direct Substitution: {val}\n"
+            "   (Likely 0/0 or inf/inf)\n\n", title="Direct Substitution")
+    sol.add("2. Applying L'Hopital (differentiating num and denom)...\n"
+            f"   Limit Value = {lim_val}\n", title="Applying L'Hopital")
+    sol.answer["limit"] = str(lim_val)
+    sol.plot(f, "f(x)")
+    sol.plot_range(pt - 5, pt + 5)
+
+
+# Critical points and the MVT work with a real x, so |x| differentiates to sign(x)
+xr = sympy.Symbol("x", real=True)
+
+
+def parse_interval(text):
+    # "[a, b]" or "a, b" -> exact bounds a < b
+    try:
+        a_str, b_str = text.strip().strip("[]()").split(",")
+        a, b = sympy.sympify(a_str), sympy.sympify(b_str)
+        ok = a.is_real and b.is_real and bool(a < b)
+    except (ValueError, TypeError, sympy.SympifyError):
+        ok = False
+    if not ok:
+        raise SolverInputError("Enter the interval as two numbers a < b, e.g. -1, 2")
+    return a, b
+
+
+def roots_on_interval(g, a, b):
+    # Real zeros of g(xr) on [a, b] and the points there where g is undefined.
+    # Rational g: exact real roots of the numerator and denominator, so
+    # polynomials never go near solve(). Anything else: sign changes on a
+    # grid, then Brent's method on the lambdified g (rootEngine).
+    if g.free_symbols - {xr}:
+        raise SolverInputError("Only the variable x may appear in f(x).")
+    if g.is_rational_function(xr):
+        numer, denom = sympy.fraction(sympy.cancel(sympy.together(g)))
+
+        def real_roots_in(p):
+            if not p.has(xr):
+                return []
+            return sorted({r for r in sympy.Poly(p, xr).real_roots() if a <= r <= b}, key=float)
+        return real_roots_in(numer), real_roots_in(denom), "exact roots of a rational function"
+
+    fn = sympy.lambdify(xr, g, modules=["math", "mpmath"])
+    roots, poles = find_roots(fn, float(a), float(b))
+    return roots, poles, f"numeric: sign changes on {samplePoints} samples + Brent's method"
+
+
+def show_value(v):
+    # Exact values as typed by SymPy, with a decimal when that helps
+    if isinstance(v, float):
+        return f"{v:.6g}"
+    if v.is_Integer or (v.is_Rational and len(str(v)) <= 12):
+        return str(v)
+    if v.has(sympy.CRootOf):
+        return f"{float(v):.6g}"
+    return f"{v} (approx {float(v):.6g})"
+
+
+def value_at(expr, c):
+    try:
+        value = complex(sympy.N(expr.subs(xr, c)))
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+    if abs(value.imag) > 1e-12 * max(1.0, abs(value.real)) or value.real != value.real or abs(value.real) == float("inf"):
+        return None
+    return value.real
+
+
+def first_derivative_test(fp, c):
+    h = 1e-4 * (1 + abs(float(c)))
+    left, right = value_at(fp, float(c) - h), value_at(fp, float(c) + h)
+    if left is None or right is None:
+        return "cannot be classified (f' undefined nearby)"
+    if left < 0 < right:
+        return "local minimum (f' changes - to +)"
+    if left > 0 > right:
+        return "local maximum (f' changes + to -)"
+    return "neither (f' keeps its sign)"
+
+
+@module.task("Find Critical Points")
+def critical_points(inputs, sol):
+    func_str = inputs["Function f(x)"]
+    f = sympy.sympify(func_str).subs(x, xr)
+    a, b = parse_interval(inputs.get("Search Interval a, b", "-10, 10"))
+
+    fp = diff(f, xr)
+    f2 = diff(fp, xr)
+    roots, undefined, method = roots_on_interval(fp, a, b)
+    # Points where f' is undefined count only if f itself is defined there
+    corners = [c for c in undefined if value_at(f, c) is not None]
+
+    sol.add("TOPIC: CRITICAL POINTS\n----------------------\n"
+            f"Function: f(x) = {func_str}\n"
+            f"Search interval: [{a}, {b}]\n\n")
+    sol.add(f"1. Differentiate:\n   f'(x) = {fp}\n\n", title="Differentiate")
+
+    text = f"2. Solve f'(x) = 0 ({method}):\n"
+    text += "".join(f"   x = {show_value(c)}\n" for c in roots) or "   no solutions in the interval\n"
+    if corners:
+        text += "   f'(x) undefined (f defined) at: " + ", ".join(show_value(c) for c in corners) + "\n"
+    sol.add(text + "\n", title="Solve f'(x) = 0")
+
+    text = f"3. Classify (second derivative test, f''(x) = {f2}):\n"
+    points = []
+    for c in roots + corners:
+        fc = value_at(f, c)
+        curvature = value_at(f2, c) if c in roots else None
+        if curvature is not None and curvature > 1e-12:
+            kind = "local minimum (f'' > 0)"
+        elif curvature is not None and curvature < -1e-12:
+            kind = "local maximum (f'' < 0)"
+        else:
+            kind = first_derivative_test(fp, c)
+        text += f"   x = {show_value(c)}: f = {fc:.6g}, {kind}\n"
+        points.append({"x": float(c), "f": fc, "type": kind.split(" (")[0]})
+        sol.plot_point(float(c), fc)
+    sol.add(text if points else "3. No critical points to classify.\n", title="Classify")
+    sol.answer["critical_points"] = points
+
+    sol.plot(f, "f(x)")
+    sol.plot(fp, "f'(x)")
+    sol.plot_range(float(a), float(b))
+
+
+@module.task("Mean Value Theorem Check")
+def mean_value_theorem(inputs, sol):
+    func_str = inputs["Function f(x)"]
+    f = sympy.sympify(func_str).subs(x, xr)
+    a, b = parse_interval(inputs["Interval [a, b]"])
+    fp = diff(f, xr)
+
+    sol.add("TOPIC: MEAN VALUE THEOREM\n-------------------------\n"
+            f"f(x) = {func_str} on [{a}, {b}]\n"
+            "If f is continuous on [a, b] and differentiable on (a, b), some c in (a, b)\n"
+            "has f'(c) = (f(b) - f(a)) / (b - a).\n\n")
+
+    # 1. Hypotheses: look for points where f or f' is undefined
+    bad_f = roots_on_interval(f, a, b)[1]
+    bad_fp = [c for c in roots_on_interval(fp, a, b)[1] if a < c < b]
+    fa, fb = value_at(f, a), value_at(f, b)
+    text = "1. Check the hypotheses:\n"
+    if bad_f or fa is None or fb is None:
+        where = ", ".join(show_value(c) for c in bad_f) or (str(a) if fa is None else str(b))
+        text += f"   f is not continuous on [a, b] (undefined at x = {where})\n"
+    else:
+        text += "   f is continuous on [a, b]\n"
+    if bad_fp:
+        text += "   f is not differentiable at x = " + ", ".join(show_value(c) for c in bad_fp) + "\n"
+    else:
+        text += "   f is differentiable on (a, b)\n"
+    hypotheses = not bad_f and not bad_fp and fa is not None and fb is not None
+    sol.add(text + ("   => MVT applies\n\n" if hypotheses else "   => MVT does not apply\n\n"), title="Check the hypotheses")
+    sol.answer["hypotheses"] = hypotheses
+    if fa is None or fb is None:
+        return
+
+    slope = sympy.simplify((f.subs(xr, b) - f.subs(xr, a)) / (b - a))
+    sol.add("2. Average rate of change:\n"
+            f"   (f({b}) - f({a})) / ({b} - ({a})) = {show_value(slope)}\n\n", title="Average rate of change")
+
+    roots, _, method = roots_on_interval(fp - slope, a, b)
+    roots = [c for c in roots if a < c < b]
+    text = f"3. Solve f'(c) = {show_value(slope)} for c in ({a}, {b}) ({method}):\n   f'(x) = {fp}\n"
+    text += "".join(f"   c = {show_value(c)}\n" for c in roots)
+    if not roots:
+        text += "   no such c" + (" - allowed, since the hypotheses fail\n" if not hypotheses else "\n")
+    sol.add(text, title="Solve for c")
+    sol.answer.update({"slope": float(slope), "c": [float(c) for c in roots]})
+
+    sol.plot(f, "f(x)")
+    sol.plot(slope * (xr - a) + f.subs(xr, a), "secant")
+    for c in roots[:3]:
+        fc = value_at(f, c)
+        sol.plot(slope * (xr - float(c)) + fc, f"tangent at c = {float(c):.4g}")
+        sol.plot_point(float(c), fc)
+    sol.plot_point(float(a), fa)
+    sol.plot_point(float(b), fb)
+    sol.plot_range(float(a) - float(b - a) / 4, float(b) + float(b - a) / 4)
+
+
+# ================= INTEGRATION TECHNIQUES =================
+# LIATE order for choosing u: the earliest kind in this list becomes u
+liateOrder = [
+    ("Logarithmic", (sympy.log,)),
+    ("Inverse trig", (sympy.asin, sympy.acos, sympy.atan, sympy.acot, sympy.asec, sympy.acsc)),
+    ("Algebraic", ()),
+    ("Trigonometric", (sympy.sin, sympy.cos, sympy.tan, sympy.sec, sympy.csc, sympy.cot)),
+    ("Exponential", (sympy.exp,)),
+]
+
+# dv factors whose repeated integrals stay the same size (tabular method)
+cyclicFunctions = (sympy.exp, sympy.sin, sympy.cos, sympy.sinh, sympy.cosh)
+
+
+def liate_rank(factor):
+    if factor.is_Pow and not factor.exp.has(x):
+        factor = factor.base
+    if factor.is_Pow:
+        return 4  # a**x is exponential
+    for rank, (name, funcs) in enumerate(liateOrder):
+        if funcs and isinstance(factor, funcs):
+            return rank
+    return 2
+
+
+def choose_parts(f):
+    # u is the factor that comes first in LIATE; everything else is dv
+    factors = [g for g in sympy.Mul.make_args(f) if g.has(x)]
+    if not factors:
+        return f, sympy.S.One
+    u = min(factors, key=liate_rank)
+    return u, sympy.cancel(f / u)
+
+
+def tabular_applies(u, dv):
+    # u must differentiate down to 0, and dv must integrate without growing
+    if not (u.has(x) and u.is_polynomial(x)):
+        return False
+    g = dv.as_independent(x, as_Add=False)[1]
+    if isinstance(g, cyclicFunctions):
+        arg = g.args[0]
+    elif g.is_Pow and not g.base.has(x):
+        arg = g.exp
+    else:
+        return False
+    return arg.is_polynomial(x) and sympy.degree(arg, x) == 1
+
+
+@module.task("Integration by Parts")
+def integration_by_parts(inputs, sol):
+    func_str = inputs["Integrand f(x)"]
+    u_str = inputs.get("Parts u", "").strip()
+    dv_str = inputs.get("Parts dv", "").strip()
+    method = inputs.get("Method", "auto").strip().lower() or "auto"
+
+    f = sympy.sympify(func_str)
+
+    sol.add("TOPIC: INTEGRATION BY PARTS\n---------------------------\n"
+            f"Integral: {func_str} dx\n"
+            "Formula: integral(u dv) = uv - integral(v du)\n\n")
+
+    # Choose u and dv: whichever part is blank is filled in from f
+    if u_str and dv_str:
+        u, dv = sympy.sympify(u_str), sympy.sympify(dv_str)
+        if sympy.simplify(u*dv - f) != 0:
+            sol.add(f"   Note: u*dv = {u*dv}, which is not the integrand {f}.\n\n")
+    elif u_str:
+        u = sympy.sympify(u_str)
+        dv = sympy.cancel(f / u)
+    elif dv_str:
+        dv = sympy.sympify(dv_str)
+        u = sympy.cancel(f / dv)
+    else:
+        u, dv = choose_parts(f)
+        others = [g for g in sympy.Mul.make_args(dv) if g.has(x)]
+        text = "0. Choose u by LIATE (Log, Inverse trig, Algebraic, Trig, Exponential):\n"
+        text += f"   u = {u} ({liateOrder[liate_rank(u)][0]})"
+        if others:
+            text += " comes before " + ", ".join(f"{g} ({liateOrder[liate_rank(g)][0]})" for g in others)
+        text += "\n\n"
+        sol.add(text, title="Choose u by LIATE")
+
+    tabular = tabular_applies(u, dv)
+    if method == "tabular" and not tabular:
+        sol.add("   (Tabular method needs a polynomial u and an exp/sin/cos dv; using the standard formula.)\n\n")
+    if tabular and method != "standard":
+        result = _tabular_parts(u, dv, sol)
+    else:
+        result = _standard_parts(u, dv, sol)
+
+    sol.add(f"Final Result: {result} + C\n", title="Final Result")
+    sol.answer["antiderivative"] = str(result)
+    sol.answer.update({"u": str(u), "dv": str(dv)})
+    sol.plot(f, "f(x)")
+    sol.plot(result, "F(x)")
+
+
+def _standard_parts(u, dv, sol):
+    # Every intermediate integral is computed exactly once
+    du = diff(u, x)
+    v = integrate(dv, x)
+    uv = u*v
+    remaining = integrate(v*du, x)
+
+    sol.add(f"1. Choose u = {u}  =>  du = {du} dx\n", title="Choose u")
+    sol.add(f"2. Choose dv = {dv} dx =>  v = {v}\n\n", title="Choose dv")
+    sol.add("3. Apply Formula:\n"
+            f"   = ({u})*({v}) - integral({v} * {du})\n"
+            f"   = {uv} - {remaining}\n\n", title="Apply Formula")
+    return uv - remaining
+
+
+def _tabular_parts(u, dv, sol):
+    # Differentiate u down to 0 and integrate dv the same number of times,
+    # then add the diagonal products with alternating signs. Each integral is
+    # of the previous one, so nothing grows.
+    derivatives = [u]
+    while derivatives[-1] != 0:
+        derivatives.append(diff(derivatives[-1], x))
+
+    integrals = [dv]
+    for _ in range(len(derivatives) - 1):
+        integrals.append(integrate(integrals[-1], x))
+
+    rows = [(k, "+" if k % 2 == 0 else "-", str(derivatives[k]), str(integrals[k + 1]))
+            for k in range(len(derivatives) - 1)]
+    width_d = max(len("u^(k)"), len(str(derivatives[-1])), *(len(r[2]) for r in rows))
+
+    text = "1. Tabular method (u is a polynomial, dv integrates without growing):\n"
+    text += f"   k | sign | {'u^(k)'.ljust(width_d)} | v_(k+1)\n"
+    for k, sign, d, v in rows:
+        text += f"   {k} |  {sign}   | {d.ljust(width_d)} | {v}\n"
+    text += f"   {len(rows)} |      | {str(derivatives[-1]).ljust(width_d)} |\n\n"
+    sol.add(text, title="Tabular method")
+
+    terms = [(-1)**k * derivatives[k] * integrals[k + 1] for k in range(len(rows))]
+    sol.add("2. Add the diagonal products with alternating signs:\n"
+            "   = " + " ".join(f"{sign} ({d})*({v})" for k, sign, d, v in rows).lstrip("+ ") + "\n\n",
+            title="Add the diagonal products")
+    return sympy.Add(*terms)
+
+
+@module.task("Partial Fractions")
+def partial_fractions(inputs, sol):
+    func_str = inputs["Rational Function"]
+    f = sympy.sympify(func_str)
+    part_frac = apart(f)
+    integral = integrate(part_frac, x)
+
+    sol.add("TOPIC: PARTIAL FRACTIONS\n------------------------\n"
+            f"Integrate: {func_str}\n\n")
+    sol.add("1. Decompose into Partial Fractions:\n"
+            f"   {part_frac}\n\n", title="Decompose into Partial Fractions")
+    sol.add("2. Integrate each term:\n"
+            f"   {integral} + C\n", title="Integrate each term")
+    sol.answer.update({"partial_fractions": str(part_frac), "antiderivative": str(integral)})
+    sol.plot(f, "f(x)")
+    sol.plot(integral, "F(x)")
+
+
+def limit_value(text):
+    # "oo", "-oo" (or "inf") for the infinite ends of an improper integral
+    text = text.strip().replace("inf", "oo")
+    if "oo" in text:
+        return -oo if text.startswith("-") else oo
+    value = float(text)
+    # Whole numbers stay exact so SymPy can still find the limit
+    return sympy.Integer(int(value)) if value.is_integer() else value
+
+
+@module.task("Improper Integral Check")
+def improper_integral(inputs, sol):
+    func_str = inputs["Integrand"]
+    f = sympy.sympify(func_str)
+    a = limit_value(inputs["Lower Limit"])
+    b = limit_value(inputs["Upper Limit"])
+
+    def symbolic():
+        res = integrate(f, (x, a, b))
+        return None if res.has(sympy.Integral) else res
+
+    # Quadrature runs alongside SymPy (solvers.integrals)
+    race = race_integral(f, x, a, b, symbolic)
+
+    sol.add("TOPIC: IMPROPER INTEGRAL\n------------------------\n"
+            f"Integral from {a} to {b} of {func_str}\n\n")
+    sol.add("1. Set up Limit:\n"
+            f"   lim(t->{b}) integral({a} to t)\n\n", title="Set up Limit")
+    sol.plot(f, "f(x)")
+    sol.plot_region(f, 0, a, b)
+    left = float(a) if a != -oo else (float(b) - 10 if b != oo else -10)
+    right = float(b) if b != oo else left + 10
+    sol.plot_range(left - (right - left) / 10, right + (right - left) / 10)
+    text = "2. Evaluate:\n"
+    if race.exact is None:
+        numeric = race.numeric
+        converges = numeric.converged
+        text += f"   {race.note}; evaluating numerically instead.\n" + numeric_text(numeric)
+        if converges:
+            text += "   Estimates settle (CONVERGES)\n"
+        else:
+            text += "   Estimates do not settle (likely DIVERGES)\n"
+        sol.add(text, title="Evaluate")
+        sol.answer.update({"value": str(numeric.value), "converges": converges})
+    else:
+        res = race.exact
+        converges = res not in divergent
+        if converges:
+            text += f"   Result = {res} (CONVERGES)\n"
+        else:
+            text += "   Result is Infinity (DIVERGES)\n"
+        sol.add(text, title="Evaluate")
+        sol.answer.update({"value": str(res), "converges": converges})
+        if race.numeric is not None:
+            check, agree = cross_check(res, race.numeric)
+            sol.add("\n3. Numeric Cross-check:\n" + check, title="Numeric Cross-check")
+            sol.answer["agrees"] = agree
+
+
+# ================= APPLICATIONS =================
+@module.task("Area Between Curves")
+def area_between_curves(inputs, sol):
+    f_str = inputs["Upper Function f(x)"]
+    g_str = inputs["Lower Function g(x)"]
+    a_str, b_str = inputs["Interval a, b"].split(",")
+
+    f, g = sympy.sympify(f_str), sympy.sympify(g_str)
+    a, b = limit_value(a_str), limit_value(b_str)
+    height = sympy.simplify(f - g)
+
+    sol.add("TOPIC: AREA BETWEEN CURVES\n--------------------------\n"
+            f"Area between f(x) = {f_str} and g(x) = {g_str} for {a} <= x <= {b}\n"
+            "Formula: A = integral(|f(x) - g(x)| dx)\n\n")
+    sol.add(f"1. Height of a strip: f(x) - g(x) = {height}\n\n", title="Height of a strip")
+
+    # Split [a, b] where the curves cross so every piece has one sign
+    crossings = sorted(r for r in sympy.solve(height, x) if r.is_real and a < r < b)
+    edges = [a, *crossings, b]
+    text = "2. Curves cross at: " + (", ".join(str(r) for r in crossings) if crossings else "none in the interval") + "\n"
+    area = sympy.S.Zero
+    for lo, hi in zip(edges, edges[1:]):
+        piece = integrate(height, (x, lo, hi))
+        text += f"   integral({lo} to {hi}) (f - g) dx = {piece}\n"
+        area += sympy.Abs(piece)
+    sol.add(text + "\n", title="Curves cross")
+    sol.add(f"3. Add the absolute values:\n   A = {area}\n   A approx {float(area.evalf()):.4f} square units\n", title="Result")
+    sol.answer.update({"area": str(area), "approx": float(area.evalf())})
+
+    sol.plot(f, "f(x)")
+    sol.plot(g, "g(x)")
+    sol.plot_region(f, g, a, b)
+    sol.plot_range(float(a) - (b - a) / 4, float(b) + (b - a) / 4)
+
+
+@module.task("Volume of Revolution (Disk)")
+def volume_disk(inputs, sol):
+    r_str = inputs["Radius Function R(x)"]
+    a_str, b_str = inputs["Interval a, b"].split(",")
+
+    R = sympy.sympify(r_str)
+    a, b = float(a_str), float(b_str)
+
+    def symbolic():
+        area = integrate(R**2, (x, a, b))
+        return None if area.has(sympy.Integral) else sympy.pi * area
+
+    race = race_integral(sympy.pi * R**2, x, a, b, symbolic)
+
+    sol.add("TOPIC: VOLUME OF REVOLUTION (DISK)\n----------------------------------\n"
+            f"Rotate region under {r_str} about x-axis.\n"
+            "Formula: V = pi * integral(R(x)^2 dx)\n\n")
+    sol.add(f"1. R(x)^2 = ({R})**2 = {R**2}\n", title="Square the radius")
+    sol.plot(R, "R(x)")
+    sol.plot(-R, "-R(x)")
+    sol.plot_region(R, -R, a, b)
+    sol.plot_range(a - (b - a) / 4, b + (b - a) / 4)
+    if race.exact is None:
+        numeric = race.numeric
+        sol.add(f"2. Integrate from {a} to {b}:\n"
+                f"   {race.note}; evaluating numerically instead.\n"
+                f"   V approx {numeric.value:.4f} cubic units (+/- {numeric.error:.1e})\n", title="Integrate")
+        sol.answer.update({"volume": str(numeric.value), "approx": numeric.value})
+    else:
+        vol = race.exact
+        sol.add(f"2. Integrate from {a} to {b}:\n"
+                f"   V = {vol} cubic units\n"
+                f"   V approx {vol.evalf():.4f}\n", title="Integrate")
+        sol.answer.update({"volume": str(vol), "approx": float(vol.evalf())})
+        if race.numeric is not None:
+            check, agree = cross_check(vol, race.numeric)
+            sol.add("\n3. Numeric Cross-check:\n" + check, title="Numeric Cross-check")
+            sol.answer["agrees"] = agree
+
+
+# ================= SERIES =================
+@module.task("Taylor Series Expansion", timeout=30)
+def taylor_series(inputs, sol):
+    func_str = inputs["Function f(x)"]
+    a = sympy.sympify(inputs["Point a"])
+    order = int(inputs["Order n"])
+    radius = float(inputs.get("Error Radius r", "") or 1)
+    f = sympy.sympify(func_str)
+
+    sol.add("TOPIC: TAYLOR SERIES\n--------------------\n"
+            f"Expand {func_str} at x={a} to order {order}\n\n")
+    try:
+        # Coefficients are shared and extended between calls (solvers.taylor)
+        expansion = taylor(f, x, a)
+        coefficients = expansion.terms(order)
+    except NotAnalytic as e:
+        ser = series(f, x, a, order).removeO()
+        sol.add(f"No Taylor series at x={a} ({e}); SymPy's series instead:\n"
+                f"{ser}\n", title="Resulting Polynomial")
+        sol.answer["polynomial"] = str(ser)
+        return
+    taylor_save(f, a, expansion)
+
+    ser = expansion.polynomial(x - a, order)
+    text = "Coefficients c_k = f^(k)(a) / k!:\n"
+    text += "".join(f"   c_{k} = {c}\n" for k, c in enumerate(coefficients) if c != 0) or "   all zero\n"
+    sol.add(text + "\n", title="Coefficients")
+    sol.add("Resulting Polynomial:\n"
+            f"{ser}\n", title="Resulting Polynomial")
+    sol.answer.update({"polynomial": str(ser), "coefficients": [str(c) for c in coefficients]})
+
+    # How good is it near a?
+    text = f"\nError on |x - {a}| <= {radius:g}:\n"
+    bound = remainder_bound(f, x, a, order, radius)
+    if bound is not None:
+        text += (f"   Lagrange bound: |R(x)| <= max|f^({order})| / {order}! * r^{order}"
+                 f" = {bound[1]:.4g} * {radius:g}^{order} = {bound[0]:.4g}\n"
+                 "   (max taken over 21 sample points)\n")
+        sol.answer["remainder_bound"] = bound[0]
+    worst, where = sample_error(f, ser, x, a, radius)
+    text += f"   Largest |f(x) - P(x)| on 41 sample points: {worst:.4g} at x = {where:.4g}\n"
+    sol.add(text, title="Error")
+    sol.answer["max_error"] = worst
+
+    sol.plot(f, "f(x)")
+    sol.plot(ser, f"Taylor polynomial (order {order})")
+    sol.plot_region(ser, f, float(a) - radius, float(a) + radius)
+    sol.plot_range(float(a) - 4, float(a) + 4)
+
+
+
+# Terms listed before the limit is taken
+shownTerms = 6
+
+
+def term_text(a_n, k):
+    value = sympy.simplify(a_n.subs(index_n, k))
+    if value.is_number and not value.is_Integer:
+        return f"{value} = {float(value):.6g}"
+    return str(value)
+
+
+@module.task("Limit of Sequence")
+def sequence_limit(inputs, sol):
+    term_str = inputs["General Term a_n"]
+    a_n = as_sequence(term_str, n)
+    analyzer = SeriesAnalyzer(a_n)
+
+    sol.add("TOPIC: LIMIT OF A SEQUENCE\n--------------------------\n"
+            f"a_n = {term_str}\n\n")
+    sol.add("1. First Terms:\n" +
+            "".join(f"   a_{k} = {term_text(a_n, k)}\n" for k in range(1, shownTerms + 1)) + "\n",
+            title="First Terms")
+
+    L = analyzer.term_limit()
+    if L is sympy.nan:
+        verdict = "diverges (it has no limit)"
+    elif isinstance(L, sympy.AccumBounds):
+        verdict = f"diverges (oscillates between {L.min} and {L.max})"
+    elif L in (oo, -oo):
+        verdict = f"diverges to {L}"
+    else:
+        verdict = f"converges to {L}"
+    sol.add(f"2. lim(n->oo) a_n = {L}\n"
+            f"   => The sequence {verdict}.\n", title="Limit")
+    sol.answer.update({"limit": str(L), "converges": verdict.startswith("converges")})
+
+    sol.plot(a_n.subs(index_n, x), "a(x)")
+    for k in range(1, 4 * shownTerms + 1):
+        value = a_n.subs(index_n, k)
+        if value.is_real and value.is_finite:
+            sol.plot_point(k, float(value), "")
+    sol.plot_range(0, 4 * shownTerms + 1)
+
+
+@module.task("Series Convergence Test", timeout=30)
+def series_convergence(inputs, sol):
+    term_str = inputs["General Term a_n"]
+    try:
+        start = int(str(inputs.get("Start n", "")).strip() or 1)
+    except ValueError:
+        raise SolverInputError("Start n must be a whole number, e.g. 1")
+    a_n = as_sequence(term_str, n)
+
+    sol.add("TOPIC: SERIES CONVERGENCE\n-------------------------\n"
+            f"sum(n={start} to oo) of {term_str}\n\n")
+    # Cheapest tests first; stops at the first one that decides
+    results = SeriesAnalyzer(a_n, start).analyze()
+    for step, (name, verdict, text) in enumerate(results, 1):
+        sol.add(f"{step}. {name}:\n   {text}\n\n", title=name)
+
+    name, verdict, text = results[-1]
+    if verdict is None:
+        sol.add("=> No test was conclusive.\n", title="Conclusion")
+    else:
+        sol.add(f"=> The series {verdict} ({name}).\n", title="Conclusion")
+    sol.answer.update({"verdict": verdict, "test": name if verdict else None,
+                       "converges": None if verdict is None else verdict.startswith("converges")})
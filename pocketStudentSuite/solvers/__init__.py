@@ -0,0 +1,170 @@
+import importlib
+import time
+
+#+++++++++++++++ Headless Solver Core +++++++++++++++++++
+# All of the maths behind the module windows lives in solvers/<CODE>.py and is
+# registered here by (module code, task name). Solvers take a plain dict of
+# inputs (the same labels the windows use) and fill in a Solution, so they
+# can be called from tests, scripts and worker processes without Tk:
+#
+#     from solvers import solve
+#     solution = solve("MAT1503", "Dot Product", {"u1": 1, "u2": 2, ...})
+#     print(solution.text())
+
+# Longest listing (truth table rows, subsets) written out by Solution.text()
+listingRows = 1000
+
+_modules = {}
+
+
+class SolverInputError(ValueError):
+    # Raised for unusable input; the windows show it in an "Input Error" box
+    pass
+
+
+class Step:
+    # One titled piece of a worked solution
+    def __init__(self, text, title=None):
+        self.text = text
+        self.title = title
+
+    def render(self, max_rows=None):
+        return self.text
+
+
+class Listing(Step):
+    # A long run of rows produced on demand: lines(start, stop) yields the text
+    # for rows start..stop-1, so nothing is built until it is displayed
+    def __init__(self, lines, total, title=None):
+        super().__init__("", title)
+        self.lines = lines
+        self.total = total
+
+    def render(self, max_rows=None):
+        stop = self.total if max_rows is None else min(self.total, max_rows)
+        text = "".join(self.lines(0, stop))
+        if stop < self.total:
+            text += f"... ({self.total - stop} more rows not shown)\n"
+        return text
+
+
+class Solution:
+    def __init__(self, module, task, progress=None):
+        self.module = module
+        self.task = task
+        self.progress = progress  # called with each step title as the solve runs
+        self.steps = []
+        self.answer = {}  # final results as plain values, for batch use
+        self.error = None
+        self.elapsed = None
+        self.figure = None  # what the plot panel draws, built by the plot_* methods
+
+    def add(self, text, title=None):
+        self.steps.append(Step(text, title))
+        if self.progress and title:
+            self.progress(title)
+
+    def add_listing(self, lines, total, title=None):
+        self.steps.append(Listing(lines, total, title))
+
+    def listing(self):
+        for step in self.steps:
+            if isinstance(step, Listing):
+                return step
+        return None
+
+    # Curves are kept as expression strings in x so the figure pickles and the
+    # window can plot it without the solver's SymPy objects
+    def _figure(self):
+        if self.figure is None:
+            self.figure = {"curves": [], "regions": [], "points": [], "range": None}
+        return self.figure
+
+    def plot(self, expr, label=None):
+        self._figure()["curves"].append((str(expr), label or str(expr)))
+
+    def plot_region(self, upper, lower, a, b):
+        # Shaded area between two curves for a <= x <= b (a or b may be +-inf)
+        self._figure()["regions"].append((str(upper), str(lower), float(a), float(b)))
+
+    def plot_point(self, px, py, label=None):
+        self._figure()["points"].append((float(px), float(py), label))
+
+    def plot_range(self, a, b):
+        self._figure()["range"] = (float(a), float(b))
+
+    def text(self, max_rows=listingRows):
+        parts = [step.render(max_rows) for step in self.steps]
+        if self.error:
+            parts.append(self.error)
+        return "".join(parts)
+
+
+class ModuleSolvers:
+    # The task table for one module, created at the top of solvers/<CODE>.py
+    def __init__(self, code, errorText="Error: {error}", missingText="Solution logic for this task is coming soon."):
+        self.code = code
+        self.errorText = errorText
+        self.missingText = missingText
+        self.tasks = {}
+        self.timeouts = {}
+        _modules[code] = self
+
+    def task(self, *names, timeout=None):
+        # timeout: seconds before a background solve of this task is stopped
+        def register(fn):
+            for name in names:
+                self.tasks[name] = fn
+                if timeout is not None:
+                    self.timeouts[name] = timeout
+            return fn
+        return register
+
+
+def load(code):
+    # Imports solvers/<code>.py the first time a module is needed
+    if code not in _modules:
+        importlib.import_module(f"solvers.{code}")
+    return _modules[code]
+
+
+def tasks(code):
+    return list(load(code).tasks)
+
+
+def task_timeout(code, task, default=None):
+    return load(code).timeouts.get(task, default)
+
+
+def solve(code, task, inputs, progress=None):
+    module = load(code)
+    solution = Solution(code, task, progress)
+    solver = module.tasks.get(task)
+    if solver is None:
+        solution.add(module.missingText.format(task=task))
+        return solution
+
+    start = time.perf_counter()
+    try:
+        solver(inputs, solution)
+    except SolverInputError:
+        raise
+    except Exception as e:
+        solution.error = module.errorText.format(error=e)
+    solution.elapsed = time.perf_counter() - start
+    return solution
+
+
+def numbers(inputs, message="Please enter valid numbers."):
+    # Converts every input to float, as the numeric windows expect
+    try:
+        return {k: float(v) for k, v in inputs.items()}
+    except (TypeError, ValueError):
+        raise SolverInputError(message)
+
+
+def flag(value):
+    # Checkbox-style inputs may arrive as bools or as text such as "yes"
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "y", "on")
+    return bool(value)
@@ -0,0 +1,155 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import sympy
+
+#+++++++++++++++ Result Cache +++++++++++++++++++
+# Memoises the expensive SymPy calls (integrate, diff, limit, series) under a
+# hash of the operation and the srepr of its arguments. sympify already puts
+# expressions in canonical form, so "x^2+1" and "1 + x**2" share an entry.
+# Only the symbolic results are cached; the step text is rebuilt every time,
+# so it always shows the expression as the student typed it.
+#
+# Two tiers: a small in-memory LRU per process and an SQLite file shared by
+# every session and worker process. Every row is stamped with the SymPy
+# version; rows from another version are dropped when the file is opened.
+# A solve may call SymPy from a helper thread (see solvers.integrals), so the
+# connection is shared between threads behind a lock.
+
+# Entries kept in memory per process
+memoryItems = 256
+# The database is trimmed back below this size (least recently used first)
+maxDiskBytes = 50 * 1024 * 1024
+# Override the location with the POCKET_SUITE_CACHE environment variable
+defaultPath = os.path.join(os.path.expanduser("~"), ".pocketStudentSuite", "results.sqlite3")
+
+versionStamp = f"sympy-{sympy.__version__}"
+
+
+class ResultCache:
+    def __init__(self, path=None, memory_items=memoryItems, max_bytes=maxDiskBytes):
+        self.path = path or os.environ.get("POCKET_SUITE_CACHE") or defaultPath
+        self.memory = OrderedDict()
+        self.memory_items = memory_items
+        self.max_bytes = max_bytes
+        self.db = None
+        self.lock = threading.RLock()
+        self.hits = self.misses = 0
+        try:
+            self._open()
+        except (OSError, sqlite3.Error):
+            # No writable disk: keep going with the memory tier only
+            self.db = None
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""CREATE TABLE IF NOT EXISTS results (
+            key TEXT PRIMARY KEY, version TEXT, value BLOB, size INTEGER, used REAL)""")
+        self.db.execute("DELETE FROM results WHERE version != ?", (versionStamp,))
+
+    def key(self, operation, args, kwargs):
+        text = sympy.srepr((operation, args, tuple(sorted(kwargs.items()))))
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        with self.lock:
+            return self._get(key)
+
+    def _get(self, key):
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            return self.memory[key]
+
+        value = None
+        if self.db is not None:
+            try:
+                row = self.db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    value = pickle.loads(row[0])
+                    self.db.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+            except (sqlite3.Error, pickle.UnpicklingError, EOFError, AttributeError):
+                value = None
+
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._remember(key, value)
+        return value
+
+    def put(self, key, value):
+        with self.lock:
+            self._put(key, value)
+
+    def _put(self, key, value):
+        self._remember(key, value)
+        if self.db is None:
+            return
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            self.db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                            (key, versionStamp, blob, len(blob), time.time()))
+            self._trim()
+        except (sqlite3.Error, pickle.PicklingError, TypeError, AttributeError):
+            # Unpicklable results simply stay in the memory tier
+            pass
+
+    def clear(self):
+        with self.lock:
+            self.memory.clear()
+            if self.db is not None:
+                self.db.execute("DELETE FROM results")
+
+    def _remember(self, key, value):
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_items:
+            self.memory.popitem(last=False)
+
+    def _trim(self):
+        # Size-based eviction: drop the least recently used rows until the
+        # stored values fit in 90% of the limit
+        total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * 0.9
+        for key, size in self.db.execute("SELECT key, size FROM results ORDER BY used").fetchall():
+            if total <= target:
+                break
+            self.db.execute("DELETE FROM results WHERE key = ?", (key,))
+            total -= size
+
+
+_cache = None
+_cacheLock = threading.Lock()
+
+
+def get_cache():
+    global _cache
+    with _cacheLock:
+        if _cache is None:
+            _cache = ResultCache()
+    return _cache
+
+
+def memoized(fn):
+    # Wraps a SymPy function so repeated calls with equal arguments are served
+    # from the cache, e.g. integrate = memoized(sympy.integrate)
+    def call(*args, **kwargs):
+        cache = get_cache()
+        key = cache.key(fn.__name__, args, kwargs)
+        result = cache.get(key)
+        if result is None:
+            result = fn(*args, **kwargs)
+            cache.put(key, result)
+        return result
+    call.__name__ = fn.__name__
+    return call
@@ -0,0 +1,190 @@
+import sympy
+
+from solvers.cache import memoized
+
+#+++++++++++++++ Sequence & Series Analyzer +++++++++++++++++++
+# Decides whether sum(a_n) converges by trying the usual tests from cheapest
+# to most expensive and stopping at the first conclusive one:
+#
+#   nth-term, geometric, p-series / limit comparison, ratio, root,
+#   alternating series, integral
+#
+# Limits go through solvers.cache, and each analyzer keeps the ones it has
+# already taken (lim a_n is shared by the nth-term and alternating tests, for
+# example), so checking a whole exercise set repeats no work.
+
+limit = memoized(sympy.limit)
+integrate = memoized(sympy.integrate)
+
+# n is a positive integer here, so |(-1)^n| simplifies to 1
+n = sympy.Symbol("n", positive=True, integer=True)
+_x = sympy.Symbol("x", positive=True)
+
+# Terms sampled when a test needs the sign or monotonicity of a_n "eventually"
+sampleFrom = 10
+sampleCount = 200
+
+
+class SeriesAnalyzer:
+    def __init__(self, term, start=1):
+        self.term = term
+        self.start = start
+        self.absolute = sympy.simplify(sympy.Abs(term))
+        self.limits = {}
+        # Set once a test shows sum |a_n| diverges
+        self.notAbsolute = False
+
+    def limit_of(self, name, expr):
+        # lim(n->oo) of expr, computed once per analyzer under a short name
+        if name not in self.limits:
+            self.limits[name] = limit(expr, n, sympy.oo)
+        return self.limits[name]
+
+    def term_limit(self):
+        # lim a_n; SymPy cannot always take it when n is an integer (the sign
+        # of (-1)^n), but |a_n| -> 0 settles the case that matters
+        try:
+            return self.limit_of("a_n", self.term)
+        except (ValueError, TypeError, NotImplementedError):
+            if self.limit_of("|a_n|", self.absolute) == 0:
+                self.limits["a_n"] = sympy.S.Zero
+            else:
+                self.limits["a_n"] = sympy.nan
+            return self.limits["a_n"]
+
+    def samples(self, expr):
+        values = []
+        for k in range(self.start + sampleFrom, self.start + sampleFrom + sampleCount):
+            try:
+                values.append(float(expr.subs(n, k)))
+            except (TypeError, ValueError, ZeroDivisionError):
+                return None
+        return values
+
+    def signs(self):
+        # "positive", "negative", "alternating" or "mixed", judged on sample terms
+        values = self.samples(self.term)
+        if values is None:
+            return "mixed"
+        if all(v > 0 for v in values):
+            return "positive"
+        if all(v < 0 for v in values):
+            return "negative"
+        if all(u * v < 0 for u, v in zip(values, values[1:])):
+            return "alternating"
+        return "mixed"
+
+    # ================= TESTS =================
+    # Each returns (verdict, explanation); verdict is "converges",
+    # "converges absolutely", "converges conditionally", "diverges" or None
+    # when inconclusive.
+    def nth_term_test(self):
+        L = self.term_limit()
+        if L == 0:
+            return None, "lim a_n = 0, so this test is inconclusive."
+        if L is sympy.nan:
+            return "diverges", "a_n has no limit (it does not tend to 0), so the series diverges."
+        return "diverges", f"lim a_n = {L}, not 0, so the series diverges."
+
+    def geometric_test(self):
+        ratio = sympy.simplify(self.term.subs(n, n + 1) / self.term)
+        if ratio.has(n):
+            return None, "a_(n+1)/a_n depends on n: not geometric."
+        if abs(ratio) < 1:
+            total = sympy.simplify(self.term.subs(n, self.start) / (1 - ratio))
+            return "converges", f"Geometric with r = {ratio}, |r| < 1: sum = a_{self.start}/(1 - r) = {total}."
+        return "diverges", f"Geometric with r = {ratio}, |r| >= 1."
+
+    def comparison_test(self):
+        # Compare |a_n| with 1/n^p, where p is read off from the growth of |a_n|
+        p = -self.limit_of("log|a_n|/log n", sympy.log(self.absolute) / sympy.log(n))
+        if not (p.is_real and p.is_finite):
+            return None, f"|a_n| does not behave like a power of n (p = {p})."
+        L = self.limit_of("|a_n| n^p", self.absolute * n**p)
+        positive = self.signs() == "positive"
+        # L = 0 still bounds |a_n| above by 1/n^p, and L = oo below by it
+        if L == 0 and p > 1:
+            return "converges absolutely", f"lim |a_n| / (1/n^{p}) = 0 and the p-series with p = {p} > 1 converges."
+        if L == sympy.oo and p <= 1 and positive:
+            return "diverges", f"lim a_n / (1/n^{p}) = oo and the p-series with p = {p} <= 1 diverges."
+        if not (L.is_positive and L.is_finite):
+            return None, f"|a_n| ~ 1/n^{p} fails: lim |a_n| * n^{p} = {L}."
+        converges = bool(p > 1)
+        text = f"lim |a_n| / (1/n^{p}) = {L}, finite and positive, so sum |a_n| behaves like the p-series with p = {p}"
+        if converges:
+            return "converges absolutely", text + " > 1: converges."
+        if positive:
+            return "diverges", text + " <= 1: diverges."
+        self.notAbsolute = True
+        return None, text + " <= 1: not absolutely convergent."
+
+    def ratio_test(self):
+        L = self.limit_of("|a_(n+1)/a_n|", sympy.simplify(self.absolute.subs(n, n + 1) / self.absolute))
+        return self._rate_verdict("lim |a_(n+1)/a_n|", L)
+
+    def root_test(self):
+        L = self.limit_of("|a_n|^(1/n)", self.absolute ** (sympy.S.One / n))
+        return self._rate_verdict("lim |a_n|^(1/n)", L)
+
+    def _rate_verdict(self, name, L):
+        if L.is_real and L < 1:
+            return "converges absolutely", f"{name} = {L} < 1."
+        if L == sympy.oo or (L.is_real and L > 1):
+            return "diverges", f"{name} = {L} > 1."
+        return None, f"{name} = {L}: inconclusive."
+
+    def alternating_test(self):
+        if self.signs() != "alternating":
+            return None, "The terms do not alternate in sign."
+        if self.term_limit() != 0:
+            return None, "|a_n| does not tend to 0."
+        values = self.samples(self.absolute)
+        if values is None or any(b > a for a, b in zip(values, values[1:])):
+            return None, "|a_n| is not decreasing."
+        return "converges conditionally" if self.notAbsolute else "converges", ("Alternating, |a_n| -> 0 and decreasing "
+                             f"(checked for n = {self.start + sampleFrom}..{self.start + sampleFrom + sampleCount - 1}).")
+
+    def integral_test(self):
+        if self.signs() != "positive":
+            return None, "Needs positive terms."
+        f = self.absolute.subs(n, _x)
+        values = self.samples(self.absolute)
+        if values is None or any(b > a for a, b in zip(values, values[1:])):
+            return None, "The terms are not decreasing."
+        area = integrate(f, (_x, self.start + sampleFrom, sympy.oo))
+        if area.has(sympy.Integral):
+            return None, "SymPy cannot evaluate the integral."
+        text = f"integral({self.start + sampleFrom} to oo) of {f} dx = {area}"
+        if area == sympy.oo:
+            return "diverges", text + "."
+        if area.evalf().is_finite:
+            return "converges", text + ", finite."
+        return None, text + ": cannot tell whether it is finite."
+
+    tests = [
+        ("nth-Term (Divergence) Test", "nth_term_test"),
+        ("Geometric Series", "geometric_test"),
+        ("p-Series / Limit Comparison", "comparison_test"),
+        ("Ratio Test", "ratio_test"),
+        ("Root Test", "root_test"),
+        ("Alternating Series Test", "alternating_test"),
+        ("Integral Test", "integral_test"),
+    ]
+
+    def analyze(self):
+        # [(test name, verdict, explanation), ...] up to the first conclusive test
+        results = []
+        for name, method in self.tests:
+            try:
+                verdict, text = getattr(self, method)()
+            except (ValueError, TypeError, NotImplementedError, ZeroDivisionError) as e:
+                verdict, text = None, f"could not be applied ({e})."
+            results.append((name, verdict, text))
+            if verdict is not None:
+                break
+        return results
+
+
+def as_sequence(expr, var):
+    # The solver symbols are plain; swap in the positive integer n
+    return sympy.sympify(expr).subs(var, n)
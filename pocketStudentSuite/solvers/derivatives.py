@@ -0,0 +1,42 @@
+from collections import OrderedDict
+
+import sympy
+
+from solvers.cache import memoized
+
+#+++++++++++++++ Shared Derivative Cache +++++++++++++++++++
+# Derivatives of an expression are kept per (expression, variables) in this
+# process, and each one is taken from the cached derivative one order lower:
+# f''' is diff(f''), f_xy is diff(f_x, y). Tasks that need the same
+# derivative (tangent line and f'(x), implicit differentiation and second
+# order partials) share it, and single diff steps still go through
+# solvers.cache for later sessions.
+
+# Derivatives kept per process
+derivativeItems = 256
+
+diff = memoized(sympy.diff)
+
+_derivatives = OrderedDict()
+
+
+def derivative(f, *variables):
+    # d/d(variables[-1]) ... d/d(variables[0]) of f, e.g. derivative(f, x, y) = f_xy
+    base = sympy.srepr(f)
+    result = f
+    for i, var in enumerate(variables):
+        key = (base, tuple(str(v) for v in variables[:i + 1]))
+        cached = _derivatives.get(key)
+        if cached is None:
+            cached = diff(result, var)
+            _derivatives[key] = cached
+            while len(_derivatives) > derivativeItems:
+                _derivatives.popitem(last=False)
+        _derivatives.move_to_end(key)
+        result = cached
+    return result
+
+
+def derivatives(f, var, order):
+    # [f, f', ..., f^(order)]
+    return [f] + [derivative(f, *[var] * k) for k in range(1, order + 1)]
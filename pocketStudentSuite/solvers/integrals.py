@@ -0,0 +1,108 @@
+import math
+import threading
+
+import sympy
+
+from quadratureEngine import integrate_numeric
+
+#+++++++++++++++ Symbolic / Numeric Integral Race +++++++++++++++++++
+# A definite integral is attempted two ways at once: SymPy looks for an exact
+# value on a helper thread while quadratureEngine computes a float (with an
+# error estimate) in the solving thread. The numeric value is nearly always
+# ready first; the exact attempt then gets symbolicWait more seconds. If both
+# finish, the exact value is shown and cross-checked against the numeric one,
+# otherwise the numeric value is the answer.
+#
+# A symbolic attempt that is still running is left behind on its (daemon)
+# thread. In a pool worker that makes the worker retire after the solve (see
+# solverPool), so the abandoned SymPy call never slows the next job.
+
+# Seconds the symbolic attempt may keep going once the numeric value is known
+symbolicWait = 5.0
+
+# Exact values that mean the integral diverges
+divergent = (sympy.oo, -sympy.oo, sympy.zoo, sympy.nan)
+
+
+class IntegralRace:
+    def __init__(self):
+        self.exact = None     # whatever symbolic() returned, if it finished in time
+        self.numeric = None   # quadratureEngine.QuadResult, None if f cannot be evaluated
+        self.note = None      # why there is no exact result
+
+
+def bound_value(value):
+    # SymPy / float bound -> float, with oo as math.inf
+    value = sympy.sympify(value)
+    if value == sympy.oo:
+        return math.inf
+    if value == -sympy.oo:
+        return -math.inf
+    return float(value)
+
+
+def numeric_integral(f, var, a, b):
+    if f.free_symbols - {var}:
+        return None
+    fn = sympy.lambdify(var, f, modules=["math", "mpmath"])
+    return integrate_numeric(fn, bound_value(a), bound_value(b))
+
+
+def race_integral(f, var, a, b, symbolic, wait=symbolicWait):
+    # symbolic() returns the exact result (any object) or None when SymPy
+    # only gives back an unevaluated Integral
+    race = IntegralRace()
+    outcome = {}
+    finished = threading.Event()
+
+    def attempt():
+        try:
+            outcome["exact"] = symbolic()
+        except Exception as e:
+            outcome["failure"] = e
+        finished.set()
+
+    threading.Thread(target=attempt, daemon=True, name="symbolic-integral").start()
+    try:
+        race.numeric = numeric_integral(f, var, a, b)
+    except (TypeError, ValueError, NameError):
+        race.numeric = None  # lambdify could not translate f
+
+    if race.numeric is None:
+        # Nothing to fall back on; the task's own timeout still applies
+        finished.wait()
+    elif not finished.wait(wait):
+        race.note = f"No exact result within {wait:g} s"
+        return race
+
+    if "failure" in outcome:
+        if race.numeric is None:
+            raise outcome["failure"]
+        race.note = f"SymPy could not evaluate it ({outcome['failure']})"
+    elif outcome["exact"] is None:
+        race.note = "SymPy found no closed form"
+    else:
+        race.exact = outcome["exact"]
+    return race
+
+
+def numeric_text(numeric):
+    return (f"   approx {numeric.value:.10g}  (+/- {numeric.error:.1e})\n"
+            f"   [{numeric.method}, {numeric.evaluations} evaluations]\n")
+
+
+def cross_check(exact, numeric):
+    # Returns (text, agree)
+    if exact in divergent:
+        agree = not numeric.converged
+        text = ("   Numeric estimates do not settle either (agrees: diverges)\n" if agree else
+                f"   Numeric value {numeric.value:.10g} looks finite (DISAGREES - check the input)\n")
+        return text, agree
+
+    value = complex(sympy.N(exact))
+    difference = abs(value - numeric.value)
+    tolerance = max(10 * numeric.error, 1e-8 * max(1.0, abs(value)))
+    agree = numeric.converged and difference <= tolerance
+    text = numeric_text(numeric)
+    text += f"   Difference from exact value: {difference:.1e} ({'agrees' if agree else 'DISAGREES - check the input'})\n"
+    return text, agree
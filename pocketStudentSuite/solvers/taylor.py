@@ -0,0 +1,316 @@
+import math
+from collections import OrderedDict
+
+import sympy
+
+from solvers.cache import get_cache
+
+#+++++++++++++++ Incremental Taylor Series +++++++++++++++++++
+# Taylor coefficients are computed straight from the expression tree with
+# power-series arithmetic instead of repeated differentiation (which swells
+# for composite functions). Every node of the tree is a PowerSeries whose
+# coefficients are produced one at a time by a recurrence and kept, e.g.
+#
+#     exp(u):  e0 = exp(u0),  e_n = (1/n) * sum(k * u_k * e_(n-k), k = 1..n)
+#
+# so asking for order 11 after order 10 only computes the new coefficient at
+# each node. Built series are kept per (f, a) in this process, and their
+# coefficients are also stored in solvers.cache so later sessions start warm.
+#
+# The same code runs on plain floats (numeric=True), which is how the
+# remainder bound gets f^(n+1) at many points cheaply.
+
+# Built series kept per process
+seriesItems = 64
+
+
+class NotAnalytic(ValueError):
+    # f has a pole or branch point at a, so there is no Taylor series
+    pass
+
+
+class PowerSeries:
+    # Coefficients of a power series in t = x - a, computed in order on
+    # first use by rule(n) and kept
+    def __init__(self, rule=None, numeric=False):
+        self.rule = rule
+        self.numeric = numeric
+        self.coeffs = []
+
+    def __getitem__(self, n):
+        while len(self.coeffs) <= n:
+            value = self.rule(len(self.coeffs))
+            if not self.numeric and not value.is_Rational:
+                value = sympy.expand(value)
+            self.coeffs.append(value)
+        return self.coeffs[n]
+
+    def terms(self, count):
+        return [self[k] for k in range(count)]
+
+    def _new(self, rule):
+        return PowerSeries(rule, self.numeric)
+
+    def __add__(self, other):
+        return self._new(lambda n: self[n] + other[n])
+
+    def __sub__(self, other):
+        return self._new(lambda n: self[n] - other[n])
+
+    def __neg__(self):
+        return self._new(lambda n: -self[n])
+
+    def __mul__(self, other):
+        return self._new(lambda n: sum((self[k] * other[n - k] for k in range(n + 1)), _zero(self)))
+
+    def __truediv__(self, other):
+        q = self._new(None)
+        if _is_zero(other[0]):
+            raise NotAnalytic("division by a series that vanishes at a")
+        q.rule = lambda n: (self[n] - sum((other[k] * q[n - k] for k in range(1, n + 1)), _zero(self))) / other[0]
+        return q
+
+    def derivative(self):
+        return self._new(lambda n: (n + 1) * self[n + 1])
+
+    def integral(self, constant):
+        return self._new(lambda n: constant if n == 0 else self[n - 1] / n)
+
+    def compose(self, inner):
+        # self(inner(t)) for an inner series with inner[0] == 0
+        if not _is_zero(inner[0]):
+            raise ValueError("the inner series must vanish at t = 0")
+        powers = [constant_series(1, self.numeric)]
+
+        def power(k):
+            while len(powers) <= k:
+                powers.append(powers[-1] * inner)
+            return powers[k]
+        # inner^k starts at t^k, so only k <= n contribute to coefficient n
+        return self._new(lambda n: sum((self[k] * power(k)[n] for k in range(n + 1)), _zero(self)))
+
+    def polynomial(self, t, count):
+        return sum((c * t**k for k, c in enumerate(self.terms(count))), sympy.S.Zero)
+
+
+def _zero(series):
+    return 0.0 if series.numeric else sympy.S.Zero
+
+
+def _is_zero(value):
+    if isinstance(value, float):
+        return value == 0.0
+    return sympy.simplify(value) == 0
+
+
+def constant_series(c, numeric=False):
+    c = float(c) if numeric else sympy.sympify(c)
+    zero = 0.0 if numeric else sympy.S.Zero
+    return PowerSeries(lambda n: c if n == 0 else zero, numeric)
+
+
+# ================= ELEMENTARY FUNCTIONS =================
+# Each takes the series u of the argument; u[0] is its value at a.
+def _exp(u, fn):
+    e = u._new(None)
+    e.rule = lambda n: fn.exp(u[0]) if n == 0 else sum((k * u[k] * e[n - k] for k in range(1, n + 1)), _zero(u)) / n
+    return e
+
+
+def _log(u, fn):
+    if _is_zero(u[0]):
+        raise NotAnalytic("log of a series that vanishes at a")
+    g = u._new(None)
+    g.rule = lambda n: fn.log(u[0]) if n == 0 else (
+        u[n] - sum((k * g[k] * u[n - k] for k in range(1, n)), _zero(u)) / n) / u[0]
+    return g
+
+
+def _power(u, alpha, fn):
+    # u**alpha by J.C.P. Miller's recurrence; needs u[0] != 0 unless alpha is
+    # a whole number
+    if _is_zero(u[0]):
+        if float(alpha).is_integer() and alpha >= 0:
+            result = constant_series(1, u.numeric)
+            for _ in range(int(alpha)):
+                result = result * u
+            return result
+        raise NotAnalytic(f"power {alpha} of a series that vanishes at a")
+    p = u._new(None)
+    p.rule = lambda n: fn.pow(u[0], alpha) if n == 0 else sum(
+        (((alpha + 1) * k - n) * u[k] * p[n - k] for k in range(1, n + 1)), _zero(u)) / (n * u[0])
+    return p
+
+
+def _sin_cos(u, fn, hyperbolic=False):
+    s, c = u._new(None), u._new(None)
+    sign = 1 if hyperbolic else -1
+    s.rule = lambda n: (fn.sinh if hyperbolic else fn.sin)(u[0]) if n == 0 else sum(
+        (k * u[k] * c[n - k] for k in range(1, n + 1)), _zero(u)) / n
+    c.rule = lambda n: (fn.cosh if hyperbolic else fn.cos)(u[0]) if n == 0 else sign * sum(
+        (k * u[k] * s[n - k] for k in range(1, n + 1)), _zero(u)) / n
+    return s, c
+
+
+def _inverse(u, fn, name):
+    # Inverse trig/hyperbolic functions: integrate (derivative) * u'
+    one = constant_series(1, u.numeric)
+    square = u * u
+    half = sympy.Rational(-1, 2) if not u.numeric else -0.5
+    inner = {
+        "atan": lambda: _power(one + square, -1, fn),
+        "asin": lambda: _power(one - square, half, fn),
+        "acos": lambda: -_power(one - square, half, fn),
+        "atanh": lambda: _power(one - square, -1, fn),
+        "asinh": lambda: _power(one + square, half, fn),
+    }[name]()
+    return (inner * u.derivative()).integral(getattr(fn, name)(u[0]))
+
+
+class _Exact:
+    exp, log, sin, cos, sinh, cosh = sympy.exp, sympy.log, sympy.sin, sympy.cos, sympy.sinh, sympy.cosh
+    atan, asin, acos, atanh, asinh = sympy.atan, sympy.asin, sympy.acos, sympy.atanh, sympy.asinh
+    pow = staticmethod(lambda a, b: a**b)
+
+
+class _Float:
+    exp, log, sin, cos, sinh, cosh = math.exp, math.log, math.sin, math.cos, math.sinh, math.cosh
+    atan, asin, acos, atanh, asinh = math.atan, math.asin, math.acos, math.atanh, math.asinh
+    pow = staticmethod(lambda a, b: a**float(b))
+
+
+_inverseNames = {sympy.atan: "atan", sympy.asin: "asin", sympy.acos: "acos", sympy.atanh: "atanh", sympy.asinh: "asinh"}
+
+
+def build(expr, x, a, numeric=False):
+    # PowerSeries of expr(x) about x = a
+    fn = _Float if numeric else _Exact
+    if not expr.has(x):
+        return constant_series(expr, numeric)
+    if expr == x:
+        zero, one = (0.0, 1.0) if numeric else (sympy.S.Zero, sympy.S.One)
+        start = float(a) if numeric else a
+        return PowerSeries(lambda n: start if n == 0 else (one if n == 1 else zero), numeric)
+
+    args = [build(arg, x, a, numeric) if arg.has(x) else None for arg in expr.args]
+    if expr.is_Add or expr.is_Mul:
+        series = [s if s is not None else constant_series(arg, numeric) for s, arg in zip(args, expr.args)]
+        result = series[0]
+        for s in series[1:]:
+            result = result + s if expr.is_Add else result * s
+        return result
+    if expr.is_Pow:
+        base, exponent = expr.args
+        if exponent.has(x):
+            return build(sympy.exp(exponent * sympy.log(base)), x, a, numeric)
+        return _power(args[0], float(exponent) if numeric else exponent, fn)
+
+    u = args[0] if len(expr.args) == 1 else None
+    if isinstance(expr, sympy.exp):
+        return _exp(u, fn)
+    if isinstance(expr, sympy.log) and u is not None:
+        return _log(u, fn)
+    if isinstance(expr, (sympy.sin, sympy.cos)):
+        s, c = _sin_cos(u, fn)
+        return s if isinstance(expr, sympy.sin) else c
+    if isinstance(expr, (sympy.sinh, sympy.cosh)):
+        s, c = _sin_cos(u, fn, hyperbolic=True)
+        return s if isinstance(expr, sympy.sinh) else c
+    if isinstance(expr, (sympy.tan, sympy.tanh)):
+        s, c = _sin_cos(u, fn, hyperbolic=isinstance(expr, sympy.tanh))
+        return s / c
+    if expr.func in _inverseNames:
+        return _inverse(u, fn, _inverseNames[expr.func])
+    return _by_derivatives(expr, x, a, numeric)
+
+
+def _by_derivatives(expr, x, a, numeric):
+    # Anything else: k-th coefficient is f^(k)(a)/k!, with each derivative
+    # kept so the next one starts from it
+    derivatives = [expr]
+
+    def rule(n):
+        while len(derivatives) <= n:
+            derivatives.append(sympy.diff(derivatives[-1], x))
+        value = derivatives[n].subs(x, a)
+        if value.has(sympy.zoo, sympy.oo, sympy.nan):
+            raise NotAnalytic(f"{expr} is not differentiable at x = {a}")
+        # abs, floor, re, ... leave Derivative/Subs objects SymPy cannot
+        # evaluate; the caller then falls back to series() as for a pole
+        if not value.has(sympy.Derivative, sympy.Subs):
+            value = value.doit()
+        if value.has(sympy.Derivative, sympy.Subs) or not value.is_number:
+            raise NotAnalytic(f"SymPy cannot evaluate the derivatives of {expr} at x = {a}")
+        value = value / sympy.factorial(n)
+        return float(value) if numeric else value
+    return PowerSeries(rule, numeric)
+
+
+# ================= CACHE =================
+_built = OrderedDict()
+
+
+def taylor(f, x, a):
+    # The shared, growing series of f about a
+    key = (sympy.srepr(f), sympy.srepr(a))
+    series = _built.get(key)
+    if series is None:
+        series = build(f, x, a)
+        stored = get_cache().get(_disk_key(f, a))
+        if stored:
+            series.coeffs = list(stored)
+        _built[key] = series
+        while len(_built) > seriesItems:
+            _built.popitem(last=False)
+    _built.move_to_end(key)
+    return series
+
+
+def save(f, a, series):
+    # Called after use so the next session can skip the terms computed so far
+    cache = get_cache()
+    key = _disk_key(f, a)
+    stored = cache.get(key)
+    if not stored or len(stored) < len(series.coeffs):
+        cache.put(key, list(series.coeffs))
+
+
+def _disk_key(f, a):
+    return get_cache().key("taylor", (f, a), {})
+
+
+# ================= ERROR ESTIMATES =================
+def remainder_bound(f, x, a, order, radius, points=21):
+    # Lagrange remainder for terms below (x-a)^order on |x - a| <= radius:
+    #   |R(x)| <= max|f^(order)(xi)| / order! * radius^order
+    # and f^(order)(xi) / order! is the order-th coefficient about xi, taken
+    # from float series at sample points xi (an estimate of the max, not a
+    # proof). Returns (bound, max |f^(order)| / order!) or None.
+    centre = float(a)
+    largest = 0.0
+    for i in range(points):
+        xi = centre - radius + 2 * radius * i / (points - 1)
+        try:
+            value = abs(build(f, x, xi, numeric=True)[order])
+        except (NotAnalytic, ValueError, ZeroDivisionError, OverflowError, TypeError):
+            return None
+        if not math.isfinite(value):
+            return None
+        largest = max(largest, value)
+    return largest * radius**order, largest
+
+
+def sample_error(f, polynomial, x, a, radius, points=41):
+    # Largest |f - P| on an even grid over |x - a| <= radius, and where
+    f_n = sympy.lambdify(x, f, modules=["math", "mpmath"])
+    p_n = sympy.lambdify(x, polynomial, modules=["math", "mpmath"])
+    worst, where = 0.0, float(a)
+    for i in range(points):
+        t = float(a) - radius + 2 * radius * i / (points - 1)
+        try:
+            error = abs(float(f_n(t)) - float(p_n(t)))
+        except (ValueError, ZeroDivisionError, OverflowError, TypeError):
+            continue
+        if error > worst:
+            worst, where = error, t
+    return worst, where
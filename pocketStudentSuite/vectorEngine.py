@@ -0,0 +1,177 @@
+import csv
+import math
+import re
+from fractions import Fraction
+
+#+++++++++++++++ Vector Engine +++++++++++++++++++
+# Dot, cross, angle and projection for many vector pairs at once, e.g. a
+# tutorial sheet checked in one go. Pairs are grouped by dimension and each
+# group is one set of NumPy array operations, so 1,000 pairs cost about as
+# much as a handful. Without NumPy the same results come from a plain loop.
+#
+#   parse_pairs("1 2 3 | 4 5 6; 1 0 | 0 1")    pairs split on ";" or newlines,
+#                                               u and v on "|", entries on
+#                                               spaces or commas
+#   read_pairs_csv("sheet.csv")                one pair per row: the first
+#                                               half of the cells is u, the
+#                                               second half v (or two cells
+#                                               holding "1 2 3" and "4 5 6")
+
+operationNames = ("dot", "cross", "angle", "projection")
+
+_PAIRS = re.compile(r"[;\n]")
+_ENTRIES = re.compile(r"[\s,]+")
+
+
+class VectorSyntaxError(ValueError):
+    pass
+
+
+# ================= PARSING =================
+def _number(text, where):
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    try:
+        return float(Fraction(text))
+    except (ValueError, ZeroDivisionError):
+        raise VectorSyntaxError(f"{where}: '{text}' is not a number")
+
+
+def _vector(text, where):
+    values = [_number(item, where) for item in _ENTRIES.split(text.strip().strip("<>()[]")) if item]
+    if not values:
+        raise VectorSyntaxError(f"{where}: empty vector")
+    return values
+
+
+def _pair(u, v, where):
+    if len(u) != len(v):
+        raise VectorSyntaxError(f"{where}: u has {len(u)} entries but v has {len(v)}")
+    return u, v
+
+
+def parse_pairs(text):
+    pairs = []
+    for number, line in enumerate((line for line in _PAIRS.split(text) if line.strip()), 1):
+        parts = line.split("|")
+        if len(parts) != 2:
+            raise VectorSyntaxError(f"Pair {number}: write it as u | v, e.g. 1 2 3 | 4 5 6")
+        where = f"Pair {number}"
+        pairs.append(_pair(_vector(parts[0], where), _vector(parts[1], where), where))
+    return pairs
+
+
+def read_pairs_csv(path):
+    pairs = []
+    try:
+        with open(path, newline="", encoding="utf-8") as handle:
+            for line, row in enumerate(csv.reader(handle), 1):
+                cells = [cell.strip() for cell in row if cell.strip()]
+                if not cells:
+                    continue
+                where = f"{path}, line {line}"
+                if len(cells) == 2:
+                    u, v = _vector(cells[0], where), _vector(cells[1], where)
+                else:
+                    try:
+                        values = [_number(cell, where) for cell in cells]
+                    except VectorSyntaxError:
+                        if not pairs and line == 1:
+                            # A header row such as u1,u2,u3,v1,v2,v3
+                            continue
+                        raise
+                    if len(values) % 2:
+                        raise VectorSyntaxError(f"{where}: needs an even number of entries (u then v)")
+                    half = len(values) // 2
+                    u, v = values[:half], values[half:]
+                pairs.append(_pair(u, v, where))
+    except OSError as e:
+        raise VectorSyntaxError(f"Cannot read {path}: {e.strerror or e}")
+    return pairs
+
+
+def parse_operations(text):
+    text = (text or "all").strip().lower()
+    if text == "all":
+        return list(operationNames)
+    chosen = [item for item in _ENTRIES.split(text) if item]
+    unknown = [item for item in chosen if item not in operationNames]
+    if unknown or not chosen:
+        raise VectorSyntaxError(f"Unknown operation '{unknown[0] if unknown else text}' "
+                                f"(use all, or any of {', '.join(operationNames)})")
+    return [name for name in operationNames if name in chosen]
+
+
+# ================= BATCH OPERATIONS =================
+def batch_operations(pairs, operations=operationNames):
+    # {operation: list in pair order}, plus "norm_u" and "norm_v". Angles are
+    # in degrees; an angle or projection involving a zero vector is None, as
+    # is a cross product outside 3-D (2-D pairs give the z component).
+    try:
+        import numpy as np
+    except ImportError:
+        return python_operations(pairs, operations)
+    count = len(pairs)
+    results = {name: [None] * count for name in ("norm_u", "norm_v", *operations)}
+    groups = {}
+    for i, (u, v) in enumerate(pairs):
+        groups.setdefault(len(u), []).append(i)
+
+    for dimension, indices in groups.items():
+        U = np.array([pairs[i][0] for i in indices], dtype=float)
+        V = np.array([pairs[i][1] for i in indices], dtype=float)
+        dots = np.einsum("ij,ij->i", U, V)
+        norm_u = np.sqrt(np.einsum("ij,ij->i", U, U))
+        norm_v = np.sqrt(np.einsum("ij,ij->i", V, V))
+        columns = {"norm_u": norm_u.tolist(), "norm_v": norm_v.tolist()}
+        if "dot" in operations:
+            columns["dot"] = dots.tolist()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if "angle" in operations:
+                cosines = np.clip(dots / (norm_u * norm_v), -1.0, 1.0)
+                angles = np.degrees(np.arccos(cosines))
+                columns["angle"] = [None if math.isnan(a) else a for a in angles.tolist()]
+            if "projection" in operations:
+                scale = dots / (norm_v * norm_v)
+                projections = (scale[:, None] * V).tolist()
+                columns["projection"] = [None if b == 0 else p for p, b in zip(projections, norm_v.tolist())]
+        if "cross" in operations:
+            if dimension == 3:
+                columns["cross"] = np.cross(U, V).tolist()
+            elif dimension == 2:
+                columns["cross"] = (U[:, 0] * V[:, 1] - U[:, 1] * V[:, 0]).tolist()
+        for name, values in columns.items():
+            column = results[name]
+            for i, value in zip(indices, values):
+                column[i] = value
+    return results
+
+
+def python_operations(pairs, operations=operationNames):
+    # batch_operations one pair at a time, for when NumPy is missing
+    results = {name: [] for name in ("norm_u", "norm_v", *operations)}
+    for u, v in pairs:
+        dot = sum(a * b for a, b in zip(u, v))
+        norm_u = math.sqrt(sum(a * a for a in u))
+        norm_v = math.sqrt(sum(b * b for b in v))
+        results["norm_u"].append(norm_u)
+        results["norm_v"].append(norm_v)
+        if "dot" in operations:
+            results["dot"].append(dot)
+        if "angle" in operations:
+            if norm_u == 0 or norm_v == 0:
+                results["angle"].append(None)
+            else:
+                results["angle"].append(math.degrees(math.acos(max(-1.0, min(1.0, dot / (norm_u * norm_v))))))
+        if "projection" in operations:
+            results["projection"].append(None if norm_v == 0 else [dot / (norm_v * norm_v) * b for b in v])
+        if "cross" in operations:
+            if len(u) == 3:
+                results["cross"].append([u[1] * v[2] - u[2] * v[1], u[2] * v[0] - u[0] * v[2], u[0] * v[1] - u[1] * v[0]])
+            elif len(u) == 2:
+                results["cross"].append(u[0] * v[1] - u[1] * v[0])
+            else:
+                results["cross"].append(None)
+    return results